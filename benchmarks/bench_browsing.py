@@ -0,0 +1,452 @@
+"""메뉴 클릭부터 이미지 표시까지의 지연 시간을 측정하는 헤드리스 벤치마크
+
+화면과 오디오 장치 없이(Qt offscreen, SDL dummy) 합성 이미지/오디오로 MainWindow를 띄우고,
+정해진 탐색 시나리오대로 menu_clicked를 호출하여 다음 값을 측정합니다.
+
+- 클릭 -> 픽스맵 표시 지연 시간의 p50/p95/p99 (처음 보는 이미지/디스크 캐시/메모리 캐시별)
+- 이미지 캐시 적중률, 로더 통계, 최대 RSS, 시작 단계별 소요 시간
+- (--grid) 카테고리 썸네일 그리드를 스크롤할 때 프레임별 GUI 스레드 처리 시간
+
+사용 예:
+    python benchmarks/bench_browsing.py --output bench.json
+    python benchmarks/bench_browsing.py --baseline bench.json --threshold warm_p95_ms=10
+
+기준값을 넘으면 종료 코드 1로 끝납니다.
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import wave
+from array import array
+
+# Qt와 pygame을 불러오기 전에 헤드리스 환경 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from startup import StartupTimer
+from metrics import metrics
+from bundle import AssetBundle
+from derived import DerivedAssets
+
+STARTUP = StartupTimer()
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 기본 기준값 (넘으면 실패)
+DEFAULT_THRESHOLDS = {
+    "startup_ms": 1500,     # 조작 가능까지 걸린 시간
+    "cold_p95_ms": 300,     # 처음 보는 이미지 (원본 디코딩)
+    "disk_p95_ms": 60,      # 디스크 캐시의 축소 이미지
+    "warm_p95_ms": 16,      # 메모리 캐시 (한 프레임 안)
+    "peak_rss_mb": 800,
+    "grid_frame_p95_ms": 16,  # 썸네일 그리드 스크롤 (--grid, 60fps 한 프레임 안)
+}
+# 빠르게 훑기: 한 번에 넘기는 항목 수와 클릭 간격
+SCRUB_BURST = 8
+SCRUB_INTERVAL_MS = 30
+# 썸네일 그리드 스크롤: 한 프레임(60fps)에 움직이는 픽셀 수
+GRID_SCROLL_STEP = 40
+FRAME_MS = 1000 / 60
+# 표시를 기다리는 최대 시간
+DISPLAY_TIMEOUT_S = 10.0
+SAMPLE_RATE = 44100
+
+def percentile(values, pct):
+    """최근접 순위 방식의 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def summarize(values):
+    """지연 시간 리스트 요약"""
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else None,
+        "mean": sum(values) / len(values) if values else None,
+    }
+
+def peak_rss_mb():
+    """프로세스의 최대 RSS(MB). 알 수 없으면 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def write_tone(path, seconds, frequency):
+    """합성 음원 저장 (44.1kHz 16비트 스테레오 WAV)
+
+    파일 이름이 .mp3여도 SDL_mixer는 내용으로 형식을 판별하므로 그대로 재생됩니다.
+    """
+    frames = int(seconds * SAMPLE_RATE)
+    samples = array("h")
+    step = 2 * math.pi * frequency / SAMPLE_RATE
+    for i in range(frames):
+        value = int(8000 * math.sin(i * step))
+        samples.append(value)
+        samples.append(value)
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.tobytes())
+
+def make_resources(root, category_count, items_per_category, image_size):
+    """합성 이미지, 오디오, 카탈로그가 들어 있는 resources 디렉토리 생성
+
+    Returns:
+        tuple: (resources 경로, {카테고리: [메뉴 항목]})
+    """
+    from PySide6.QtGui import QImage, QPainter, QColor, QLinearGradient
+
+    resources_dir = os.path.join(root, "resources")
+    image_dir = os.path.join(resources_dir, "images")
+    audio_dir = os.path.join(resources_dir, "audio")
+    os.makedirs(image_dir)
+    os.makedirs(audio_dir)
+
+    rng = random.Random(0)
+    categories = {}
+    for c in range(category_count):
+        category = f"분류{c:02d}"
+        items = [f"메뉴{c:02d}-{i:03d}" for i in range(items_per_category)]
+        categories[category] = items
+        write_tone(os.path.join(audio_dir, f"{category}.mp3"), 2.0, 220 + 40 * c)
+        for item in items:
+            # 실제 사진처럼 JPEG 압축이 덜 되도록 그라데이션 위에 도형을 흩뿌림
+            image = QImage(image_size[0], image_size[1], QImage.Format.Format_RGB32)
+            painter = QPainter(image)
+            gradient = QLinearGradient(0, 0, image_size[0], image_size[1])
+            gradient.setColorAt(0, QColor.fromHsv(rng.randrange(360), 200, 230))
+            gradient.setColorAt(1, QColor.fromHsv(rng.randrange(360), 180, 90))
+            painter.fillRect(image.rect(), gradient)
+            for _ in range(60):
+                painter.fillRect(rng.randrange(image_size[0]), rng.randrange(image_size[1]),
+                                 rng.randrange(20, 200), rng.randrange(20, 200),
+                                 QColor.fromHsv(rng.randrange(360), 160, rng.randrange(256)))
+            painter.end()
+            image.save(os.path.join(image_dir, f"{item}.jpg"), "JPG", 90)
+    write_tone(os.path.join(audio_dir, "ambient.mp3"), 6.0, 110)
+
+    with open(os.path.join(resources_dir, "catalog.json"), "w", encoding="utf-8") as f:
+        json.dump(categories, f, ensure_ascii=False)
+    return resources_dir, categories
+
+def build_bundle(resources_dir, encoding):
+    """합성 리소스로 에셋 번들 생성 (앱과 같은 믹서 형식으로 오디오 디코딩)"""
+    import pygame
+    from tools.build_bundle import build
+    from audio.audio_manager import MIXER_FORMAT
+    frequency, size, channels = MIXER_FORMAT
+    pygame.mixer.init(frequency=frequency, size=size, channels=channels)
+    path = os.path.join(resources_dir, "assets.bundle")
+    build(resources_dir, path, encoding=encoding)
+    pygame.mixer.quit()
+    return path
+
+def preprocess_resources(resources_dir):
+    """합성 리소스를 전처리 도구로 미리 축소/변환 (resources/derived)"""
+    from tools.preprocess import preprocess
+    preprocess(resources_dir)
+    return os.path.join(resources_dir, "derived")
+
+class BrowsingBench:
+    """MainWindow에 탐색 시나리오를 재생하고 클릭별 지연 시간을 기록"""
+
+    def __init__(self, app, window):
+        self.app = app
+        self.window = window
+        self.samples = []  # {"session", "item", "source", "ms"}
+
+    def wait_until(self, predicate, timeout=DISPLAY_TIMEOUT_S):
+        """조건이 참이 될 때까지 이벤트 처리 (시간 초과면 False)"""
+        from PySide6.QtCore import QEventLoop
+        deadline = time.perf_counter() + timeout
+        while not predicate():
+            if time.perf_counter() > deadline:
+                return False
+            self.app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 5)
+        return True
+
+    def _decode_source(self, item):
+        """로더가 가장 최근에 항목을 읽어 온 위치 (디스크 캐시, 번들, 전처리 결과, 그 외에는 원본 디코딩 "cold")"""
+        for entry in reversed(self.window.image_loader.decode_log):
+            if entry["item"] == item:
+                return entry["source"] if entry["source"] in ("disk", "bundle", "derived") else "cold"
+        return "cold"
+
+    def _displayed(self, item):
+        return self.window.current_image == item and self.window.image_label.pixmap() is not None
+
+    def click(self, session, item, wait=True):
+        """항목 클릭 후 (wait이면) 표시될 때까지 기다려 지연 시간 기록"""
+        cached = self.window.image_cache.contains(item)
+        start = time.perf_counter()
+        self.window.menu_clicked(item)
+        if not wait:
+            return
+        if not self.wait_until(lambda: self._displayed(item)):
+            raise RuntimeError(f"이미지가 표시되지 않았습니다: {item}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        source = "memory" if cached else self._decode_source(item)
+        self.samples.append({"session": session, "item": item, "source": source, "ms": elapsed_ms})
+
+    def sequential(self, items):
+        """카탈로그 순서대로 하나씩 클릭"""
+        for item in items:
+            self.click("sequential", item)
+
+    def random_walk(self, items, clicks, seed):
+        """무작위 항목 클릭 (최근 항목을 다시 보는 경우가 많도록 일부는 최근 10개에서 선택)"""
+        rng = random.Random(seed)
+        recent = []
+        for _ in range(clicks):
+            if recent and rng.random() < 0.4:
+                item = rng.choice(recent)
+            else:
+                item = rng.choice(items)
+            recent = (recent + [item])[-10:]
+            self.click("random", item)
+
+    def scrub(self, items, bursts, seed):
+        """빠르게 훑기: 일정 간격으로 연달아 클릭하고 마지막 항목이 표시되는 시간만 기록"""
+        rng = random.Random(seed)
+        for _ in range(bursts):
+            start = rng.randrange(max(1, len(items) - SCRUB_BURST))
+            burst = items[start:start + SCRUB_BURST]
+            for item in burst[:-1]:
+                self.click("scrub", item, wait=False)
+                self.wait_until(lambda: False, timeout=SCRUB_INTERVAL_MS / 1000)
+            self.click("scrub", burst[-1])
+
+    def scroll_grid(self, category):
+        """카테고리 썸네일 그리드를 끝까지 한 프레임씩 스크롤했다가 돌아오며 프레임별 처리 시간 기록
+
+        프레임마다 스크롤 위치를 옮기고 다시 그린 뒤 밀린 이벤트(완료된 썸네일 반영 등)를 모두 처리한 시간을
+        기록하고, 남은 프레임 시간 동안은 이벤트를 처리하지 않고 워커가 디코딩하도록 기다립니다.
+        """
+        self.window.show_category_grid(category)
+        grid = self.window.category_grid
+        self.wait_until(lambda: grid.isVisible())
+        bar = grid.verticalScrollBar()
+        positions = list(range(0, bar.maximum() + GRID_SCROLL_STEP, GRID_SCROLL_STEP))
+        frames = []
+        for position in positions + positions[::-1]:
+            start = time.perf_counter()
+            bar.setValue(position)
+            grid.viewport().repaint()
+            self.app.processEvents()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            frames.append(elapsed_ms)
+            if elapsed_ms < FRAME_MS:
+                time.sleep((FRAME_MS - elapsed_ms) / 1000)
+        # 마지막 화면의 썸네일이 모두 표시될 때까지 기다림
+        self.wait_until(lambda: not grid._load_timer.isActive() and not grid.loader.stats()["in_flight"])
+        return frames
+
+def run(args):
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    STARTUP.mark("qt")
+    from ui.main_window import MainWindow
+    from audio.audio_manager import AudioManager
+    STARTUP.mark("imports")
+
+    root = tempfile.mkdtemp(prefix="foodcourt-bench-")
+    try:
+        resources_dir, categories = make_resources(root, args.categories, args.items,
+                                                   (args.image_width, args.image_height))
+        items = [item for names in categories.values() for item in names]
+        cache_dir = os.path.join(root, "cache")
+        bundle_path = build_bundle(resources_dir, args.bundle) if args.bundle else None
+        derived_dir = preprocess_resources(resources_dir) if args.preprocess else None
+        STARTUP.mark("fixtures")
+
+        # app.main()과 같은 순서로 시작 (합성 파일 생성 시간은 제외)
+        bundle = AssetBundle(bundle_path) if bundle_path else None
+        derived = DerivedAssets(derived_dir) if derived_dir else None
+        STARTUP.mark("assets")
+        audio_manager = AudioManager(os.path.join(resources_dir, "audio"), cache_dir, bundle=bundle,
+                                     derived=derived)
+        window = MainWindow("benchmark", os.path.join(resources_dir, "images"), audio_manager,
+                            cache_dir, os.path.join(resources_dir, "catalog.json"), bundle, derived)
+        STARTUP.mark("ui")
+        window.show()
+        STARTUP.mark("show")
+        bench = BrowsingBench(app, window)
+        bench.wait_until(lambda: window.painted)
+        STARTUP.mark("paint")
+        audio_init = audio_manager.start(window.on_audio_ready)
+        bench.wait_until(lambda: audio_init.isFinished())
+        app.processEvents()
+        STARTUP.mark("audio")
+        phases = STARTUP.timings()
+        startup_ms = sum(phase["ms"] for name, phase in phases.items() if name != "fixtures")
+
+        bench.sequential(items[:args.sequential])
+        bench.random_walk(items, args.random, args.seed)
+        bench.scrub(items, args.scrub, args.seed)
+        grid = None
+        if args.grid:
+            category = max(categories, key=lambda name: len(categories[name]))
+            frames = bench.scroll_grid(category)
+            grid = {"category": category, "items": len(categories[category]),
+                    "frame_ms": summarize(frames),
+                    "frames_over_budget": sum(1 for ms in frames if ms > FRAME_MS),
+                    **window.category_grid.stats()}
+
+        samples = bench.samples
+        by_source = {source: summarize([s["ms"] for s in samples if s["source"] == source])
+                     for source in ("cold", "disk", "bundle", "derived", "memory")}
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "config": vars(args),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "startup": {"ms": startup_ms, "phases": phases},
+            "latency_ms": {
+                "all": summarize([s["ms"] for s in samples]),
+                "by_source": by_source,
+                "by_session": {session: summarize([s["ms"] for s in samples if s["session"] == session])
+                               for session in ("sequential", "random", "scrub")},
+            },
+            "image_cache": window.image_cache.stats(),
+            "image_loader": window.image_loader.stats(),
+            "grid": grid,
+            "sound_cache": audio_manager.sound_cache.stats(),
+            "voices": audio_manager.voices.stats() if audio_manager.voices else None,
+            "peak_rss_mb": peak_rss_mb(),
+            "metrics": metrics.snapshot() if metrics.enabled else None,
+        }
+        window.close()
+        return report
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+def check_thresholds(report, thresholds):
+    """기준값을 넘은 항목 리스트 반환"""
+    by_source = report["latency_ms"]["by_source"]
+    measured = {
+        "startup_ms": report["startup"]["ms"],
+        "cold_p95_ms": by_source["cold"]["p95"],
+        "disk_p95_ms": by_source["disk"]["p95"],
+        "warm_p95_ms": by_source["memory"]["p95"],
+        "peak_rss_mb": report["peak_rss_mb"],
+        "grid_frame_p95_ms": report["grid"]["frame_ms"]["p95"] if report["grid"] else None,
+    }
+    failures = []
+    for name, limit in thresholds.items():
+        value = measured.get(name)
+        if value is not None and value > limit:
+            failures.append(f"{name}: {value:.1f} > {limit}")
+    return failures
+
+def compare(report, baseline):
+    """이전 결과와 주요 지표 비교 문자열"""
+    def pick(data):
+        latency = data["latency_ms"]
+        return {
+            "startup_ms": data["startup"]["ms"],
+            "all_p95_ms": latency["all"]["p95"],
+            "cold_p95_ms": latency["by_source"]["cold"]["p95"],
+            "disk_p95_ms": latency["by_source"]["disk"]["p95"],
+            "warm_p95_ms": latency["by_source"]["memory"]["p95"],
+            "hit_rate": data["image_cache"]["hit_rate"],
+            "peak_rss_mb": data["peak_rss_mb"],
+        }
+    lines = []
+    current, previous = pick(report), pick(baseline)
+    for name, value in current.items():
+        old = previous.get(name)
+        if value is None or old is None:
+            continue
+        change = f"{(value - old) / old * 100:+.1f}%" if old else ""
+        lines.append(f"  {name:<12} {old:10.2f} -> {value:10.2f}  {change}")
+    return "\n".join(lines)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="헤드리스 메뉴 탐색 성능 벤치마크")
+    parser.add_argument("--categories", type=int, default=5, help="카테고리 수")
+    parser.add_argument("--items", type=int, default=40, help="카테고리별 메뉴 항목 수")
+    parser.add_argument("--image-width", type=int, default=1600)
+    parser.add_argument("--image-height", type=int, default=1200)
+    parser.add_argument("--sequential", type=int, default=60, help="순서대로 클릭할 항목 수")
+    parser.add_argument("--random", type=int, default=200, help="무작위 클릭 수")
+    parser.add_argument("--scrub", type=int, default=20, help="빠르게 훑기 반복 수")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--bundle", choices=["raw", "jpg"],
+                        help="합성 리소스로 에셋 번들을 만들어 번들에서 읽기 (이미지 저장 형식)")
+    parser.add_argument("--preprocess", action="store_true",
+                        help="합성 리소스를 전처리 도구로 미리 축소/변환하여 사용")
+    parser.add_argument("--grid", action="store_true",
+                        help="항목이 가장 많은 카테고리의 썸네일 그리드 스크롤 측정 (--items 400 등과 함께 사용)")
+    parser.add_argument("--metrics", action="store_true",
+                        help="앱 내부 측정을 켜고 결과에 포함 (측정 부담 비교용)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일 경로")
+    parser.add_argument("--threshold", action="append", default=[], metavar="NAME=VALUE",
+                        help=f"기준값 변경 ({', '.join(DEFAULT_THRESHOLDS)})")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for entry in args.threshold:
+        name, _, value = entry.partition("=")
+        if name not in DEFAULT_THRESHOLDS:
+            print(f"알 수 없는 기준값: {name}")
+            return 2
+        thresholds[name] = float(value)
+
+    if args.metrics:
+        metrics.enable()
+    report = run(args)
+    report["thresholds"] = thresholds
+    failures = check_thresholds(report, thresholds)
+    report["failures"] = failures
+
+    latency = report["latency_ms"]
+    print(f"시작: {report['startup']['ms']:.1f} ms")
+    for source, summary in latency["by_source"].items():
+        if summary["count"]:
+            print(f"{source:<7} n={summary['count']:<4} p50={summary['p50']:.1f} "
+                  f"p95={summary['p95']:.1f} p99={summary['p99']:.1f} ms")
+    print(f"이미지 캐시 적중률: {report['image_cache']['hit_rate']:.1%}")
+    grid = report["grid"]
+    if grid:
+        frame = grid["frame_ms"]
+        print(f"그리드 스크롤 ({grid['items']}개) n={frame['count']} p50={frame['p50']:.1f} "
+              f"p95={frame['p95']:.1f} max={frame['max']:.1f} ms, "
+              f"한 프레임 초과 {grid['frames_over_budget']}회, 썸네일 디코딩 {grid['loader']['decodes']}회")
+    if report["peak_rss_mb"] is not None:
+        print(f"최대 RSS: {report['peak_rss_mb']:.1f} MB")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            print("이전 결과와 비교:\n" + compare(report, json.load(f)))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for failure in failures:
+        print(f"기준 초과 - {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
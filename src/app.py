@@ -1,10 +1,16 @@
 import sys
 import os
-from PySide6.QtWidgets import QApplication, QSplashScreen
-from PySide6.QtGui import QPixmap
-from PySide6.QtCore import Qt, QTimer
-from ui.main_window import MainWindow
-from audio.audio_manager import AudioManager
+import argparse
+from startup import StartupTimer
+from metrics import metrics, DEFAULT_INTERVAL
+from bundle import AssetBundle, BundleError
+from derived import DerivedAssets, DerivedError
+
+# 시작 단계별 소요 시간 (가장 먼저 만들어 모듈 로드 시간까지 측정)
+STARTUP = StartupTimer()
+
+# PySide6, pygame 등 무거운 모듈은 main()에서 필요한 시점에 불러옴
+from ui.catalog import Catalog
 
 # 리소스 경로 캐싱
 _resource_path = None
@@ -40,9 +46,46 @@ app_title = "풀다운 푸드 코트"
 RESOURCES_DIR = get_resource_path()
 IMAGE_DIR = os.path.join(RESOURCES_DIR, "images")
 AUDIO_DIR = os.path.join(RESOURCES_DIR, "audio")
+# 미리 축소한 이미지 등 파생 파일 캐시 (resources 디렉토리 옆)
+CACHE_DIR = os.path.join(os.path.dirname(RESOURCES_DIR), "cache")
+# 메뉴 카탈로그 파일 (resources/catalog.json 또는 catalog.db, 없으면 기본 메뉴)
+CATALOG_PATH = Catalog.find(RESOURCES_DIR)
+# 미리 축소한 이미지와 디코딩한 오디오 번들 (resources/assets.bundle, 없으면 개별 파일 사용)
+BUNDLE_PATH = AssetBundle.find(RESOURCES_DIR)
+# 전처리 도구가 만든 축소 이미지와 변환한 오디오 (resources/derived, 없으면 개별 파일 사용)
+DERIVED_DIR = DerivedAssets.find(RESOURCES_DIR)
+
+# 스플래시가 준비 신호를 기다리는 최대 시간 (오디오 장치가 늦게 열려도 이 시간 뒤에는 닫음)
+SPLASH_MAX_WAIT_MS = 2000
+# 이 환경 변수가 설정되어 있으면 시작 단계별 소요 시간 출력
+STARTUP_TRACE_ENV = "FOODCOURT_STARTUP_TRACE"
+# 이 환경 변수에 기준 시간(ms)을 지정하면 GUI 이벤트 루프 멈춤 감지
+STALL_ENV = "FOODCOURT_STALL_MS"
+
+def parse_args(argv):
+    """명령행 인자 해석 (나머지 인자는 Qt에 그대로 전달)"""
+    parser = argparse.ArgumentParser(description=app_title)
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="측정값을 내보낼 파일 (.prom이면 Prometheus 텍스트, 그 외에는 JSON Lines)")
+    parser.add_argument("--metrics-interval", type=float, default=DEFAULT_INTERVAL, metavar="SECONDS",
+                        help="측정값 내보내기 간격(초)")
+    parser.add_argument("--stall-ms", type=float, metavar="MS",
+                        help="GUI 이벤트 루프가 이 시간 넘게 멈추면 호출 스택 출력")
+    return parser.parse_known_args(argv)
 
 def main():
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.metrics:
+        metrics.enable(args.metrics, args.metrics_interval)
+    else:
+        metrics.enable_from_env()
+    stall_ms = args.stall_ms or float(os.environ.get(STALL_ENV) or 0)
+    
+    from PySide6.QtWidgets import QApplication, QSplashScreen
+    from PySide6.QtGui import QPixmap
+    from PySide6.QtCore import QTimer
+    app = QApplication(sys.argv[:1] + qt_args)
+    STARTUP.mark("qt")
     
     # 스플래시 화면 표시 (로딩 중 표시)
     splash_path = os.path.join(IMAGE_DIR, "splash.jpg")
@@ -52,25 +95,85 @@ def main():
         splash = QSplashScreen(splash_pixmap)
         splash.show()
         app.processEvents()
+    STARTUP.mark("splash")
     
-    # 오디오 매니저 초기화
-    audio_manager = AudioManager(AUDIO_DIR)
+    # 스플래시를 띄운 뒤 UI와 오디오 모듈 로드 (pygame 포함)
+    from ui.main_window import MainWindow
+    from audio.audio_manager import AudioManager
+    STARTUP.mark("imports")
     
-    # 메인 윈도우 생성
-    window = MainWindow(app_title, IMAGE_DIR, audio_manager)
+    # 에셋 번들과 전처리 색인 열기 (색인만 읽고 데이터는 필요할 때 사용)
+    bundle = None
+    if BUNDLE_PATH:
+        try:
+            bundle = AssetBundle(BUNDLE_PATH)
+        except BundleError as e:
+            print(f"{e} - 개별 리소스 파일을 사용합니다")
+    derived = None
+    if DERIVED_DIR:
+        try:
+            derived = DerivedAssets(DERIVED_DIR, RESOURCES_DIR)
+        except DerivedError as e:
+            print(f"{e} - 개별 리소스 파일을 사용합니다")
+    STARTUP.mark("assets")
     
-    # 스플래시 화면이 있으면 잠시 후 메인 윈도우 표시
-    if splash:
-        QTimer.singleShot(1000, lambda: _finish_loading(window, splash))
+    # 오디오 매니저 생성 (믹서 초기화는 윈도우 표시 후 백그라운드에서)
+    audio_manager = AudioManager(AUDIO_DIR, CACHE_DIR, bundle=bundle, derived=derived)
+    
+    # 메인 윈도우 생성 후 바로 표시
+    window = MainWindow(app_title, IMAGE_DIR, audio_manager, CACHE_DIR, CATALOG_PATH, bundle, derived)
+    STARTUP.mark("ui")
+    window.show()
+    STARTUP.mark("show")
+    
+    # 측정 중이거나 기준 시간이 지정되면 이벤트 루프 멈춤 감지
+    # (종료 처리 중 작업을 기다리는 것은 멈춤이 아니므로 윈도우를 닫을 때 중지)
+    stall_detector = None
+    if stall_ms or metrics.enabled:
+        from ui.stall_detector import StallDetector, DEFAULT_STALL_MS
+        stall_detector = StallDetector(stall_ms or DEFAULT_STALL_MS, parent=window).start()
+        window.stall_detector = stall_detector
+    
+    # 스플래시는 첫 화면이 그려지고 오디오가 준비되면(또는 실패하면) 닫음
+    pending = {"paint", "audio"}
+    
+    def _ready(phase):
+        if phase not in pending:
+            return
+        pending.discard(phase)
+        STARTUP.mark(phase)
+        if not pending:
+            _finish_loading(window, splash)
+    
+    def _audio_ready():
+        window.on_audio_ready()
+        _ready("audio")
+    
+    audio_manager.start(_audio_ready, lambda message: _ready("audio"))
+    if window.painted:
+        _ready("paint")
     else:
-        window.show()
+        window.first_painted.connect(lambda: _ready("paint"))
+    QTimer.singleShot(SPLASH_MAX_WAIT_MS, lambda: (pending.clear(), _finish_loading(window, splash)))
     
-    return app.exec()
+    exit_code = app.exec()
+    if stall_detector:
+        stall_detector.stop()
+    metrics.shutdown()
+    return exit_code
 
 def _finish_loading(window, splash):
-    """스플래시 화면을 닫고 메인 윈도우 표시"""
-    window.show()
-    splash.finish(window)
+    """스플래시 화면을 닫고 조작 가능 시점 기록 (한 번만)"""
+    if STARTUP.elapsed("interactive") is not None:
+        return
+    if splash:
+        splash.finish(window)
+    STARTUP.mark("interactive")
+    for phase, timing in STARTUP.timings().items():
+        metrics.observe(f"startup.{phase}", timing["ms"])
+    metrics.observe("startup.time_to_interactive", STARTUP.elapsed("interactive"))
+    if os.environ.get(STARTUP_TRACE_ENV) or not STARTUP.within_target():
+        print(STARTUP.report())
 
 if __name__ == "__main__":
     sys.exit(main())
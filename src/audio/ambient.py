@@ -0,0 +1,84 @@
+from array import array
+from .stream import ChannelStream, open_wav
+
+class AmbientLoop(ChannelStream):
+    """샘플 단위로 정확하게 반복하는 배경 환경음 스트림
+
+    반복 구간의 끝과 시작을 미리 섞어 둔 이음 구간(crossfade)을 끼워 넣어
+    끝에서 처음으로 넘어갈 때 틈이나 튐 없이 이어집니다.
+    조각 단위로 읽어 채널 대기열에 넘기므로 GUI 스레드 타이머가 필요 없습니다.
+    """
+
+    def __init__(self, channel, wav_path, loop_start=1.0, crossfade=0.5,
+                 chunk_seconds=0.5, fade_ms=0):
+        """환경음 반복 스트림 초기화
+
+        Args:
+            channel (pygame.mixer.Channel): 환경음 전용 채널
+            wav_path (str): 믹서 형식과 같은 PCM WAV 파일 경로 (또는 번들 항목)
+            loop_start (float): 반복 구간 시작 위치(초)
+            crossfade (float): 끝과 시작을 섞는 이음 구간 길이(초)
+            chunk_seconds (float): 한 번에 읽을 조각 길이(초)
+            fade_ms (int): 재생 시작 시 페이드 인 시간(밀리초)
+        """
+        super().__init__(channel, wav_path, loops=-1, chunk_seconds=chunk_seconds, fade_ms=fade_ms)
+        self.loop_start = loop_start
+        self.crossfade = crossfade
+        self.loop_count = 0  # 반복 횟수
+
+    def _chunks(self):
+        """반복 구간을 조각으로 나누어 끝없이 생성 (이음 구간 포함)"""
+        with open_wav(self.wav_path) as wav:
+            rate = wav.getframerate()
+            total = wav.getnframes()
+            start = min(int(self.loop_start * rate), total // 2)
+            fade = min(int(self.crossfade * rate), (total - start) // 2)
+            if wav.getsampwidth() != 2:
+                fade = 0  # 16비트 PCM이 아니면 이음 구간 없이 반복
+            seam = self._make_seam(wav, start, total, fade)
+
+            frames_per_chunk = max(1, int(rate * self.chunk_seconds))
+            pos = start
+            while not self._stop_event.is_set():
+                # 본문: pos부터 이음 구간 직전까지
+                wav.setpos(pos)
+                remaining = total - fade - pos
+                while remaining > 0 and not self._stop_event.is_set():
+                    frames = min(frames_per_chunk, remaining)
+                    yield wav.readframes(frames)
+                    remaining -= frames
+                if seam:
+                    yield seam
+                # 이음 구간에 시작 부분이 이미 섞여 있으므로 그 다음부터 이어서 재생
+                pos = start + fade
+                self.loop_count += 1
+
+    @staticmethod
+    def _make_seam(wav, start, end, fade):
+        """반복 구간의 끝(페이드 아웃)과 시작(페이드 인)을 섞은 이음 구간 생성
+
+        Args:
+            wav (wave.Wave_read): 열린 WAV 파일
+            start (int): 반복 구간 시작 프레임
+            end (int): 반복 구간 끝 프레임
+            fade (int): 이음 구간 길이(프레임)
+
+        Returns:
+            bytes: 섞인 PCM 데이터 (이음 구간이 없으면 빈 bytes)
+        """
+        if fade <= 0:
+            return b""
+        channels = wav.getnchannels()
+
+        wav.setpos(end - fade)
+        tail = array("h", wav.readframes(fade))
+        wav.setpos(start)
+        head = array("h", wav.readframes(fade))
+
+        count = min(len(tail), len(head))
+        frames = count // channels
+        seam = array("h", bytes(count * 2))
+        for i in range(count):
+            gain = (i // channels) / frames
+            seam[i] = int(tail[i] * (1.0 - gain) + head[i] * gain)
+        return seam.tobytes()
@@ -1,34 +1,110 @@
 import os
+import shutil
+import tempfile
 import pygame
-from PySide6.QtCore import QTimer
-import platform
+from PySide6.QtCore import QThread
+from metrics import metrics
+from .notification import NotificationPlayer
+from .pcm_cache import PcmCache
+from .warmup import AudioWarmup, AudioInit
+from .probe import probe_duration
+from .sound_cache import SoundCache, pcm_bytes
+from .stream import ChannelStream
+from .ambient import AmbientLoop
+from .voices import VoicePool, PRIORITY_VOICE
 
-# 운영체제별 필요한 모듈 import
-system = platform.system()
-if system == "Darwin":  # macOS
-    import subprocess
-elif system == "Windows":  # Windows
-    import winsound
+# 디코딩 크기가 이 값을 넘는 음성은 메모리에 두지 않고 스트리밍 (약 24초 분량)
+STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024
+# 환경음 반복 구간 시작 위치(초)와 끝/시작 이음 구간 길이(초)
+AMBIENT_LOOP_START = 1.0
+AMBIENT_CROSSFADE = 0.5
+# 음성과 효과음을 동시에 재생할 채널 수
+VOICE_CHANNELS = 4
+# 믹서 형식 (샘플레이트, 샘플 크기, 채널 수) - PCM 캐시와 번들의 오디오도 이 형식으로 저장
+MIXER_FORMAT = (44100, -16, 2)
 
 class AudioManager:
-    def __init__(self, audio_dir):
-        """오디오 매니저 초기화
+    def __init__(self, audio_dir, cache_dir=None, voice_channels=VOICE_CHANNELS, bundle=None,
+                 derived=None):
+        """오디오 매니저 초기화 (믹서는 start() 또는 initialize()에서 초기화)
         
         Args:
             audio_dir (str): 오디오 파일이 있는 디렉토리 경로
+            cache_dir (str): 디코딩한 PCM을 저장할 캐시 디렉토리 경로 (None이면 사용 안 함)
+            voice_channels (int): 음성과 효과음을 동시에 재생할 채널 수
+            bundle (AssetBundle): 미리 디코딩한 오디오가 들어 있는 번들 (없는 파일은 audio_dir에서 읽음)
+            derived (DerivedAssets): 전처리 도구가 믹서 형식으로 변환한 오디오 색인 (없는 파일은 audio_dir에서 읽음)
         """
         self.audio_dir = audio_dir
+        self.bundle = bundle
+        self.derived = derived
         self.ambient_length = 0 # 환경음 길이
-        self.ambient_timer = None # 환경음 시간
+        self.ambient_filename = None # 환경음 파일명
+        self.ambient_loop = None # 샘플 단위 반복 환경음 스트림
+        self._ambient_music = False # PCM 준비 전 mixer.music으로 재생 중인지 여부
         self.ambient_enabled = True # 환경음 활성화 상태
-        self.sound_cache = {}  # 사운드 캐시 추가
+        self.sound_cache = SoundCache()  # 메모리 예산 기반 LRU 사운드 캐시
+        self.stream_threshold = STREAM_THRESHOLD_BYTES
+        self.pcm_cache = PcmCache(os.path.join(cache_dir, "audio")) if cache_dir else None
+        # 긴 음성을 스트리밍할 PCM 저장 위치 (캐시 디렉토리가 없으면 종료 시 지우는 임시 디렉토리)
+        self._temp_pcm_dir = None
+        if self.pcm_cache is None:
+            self._temp_pcm_dir = tempfile.mkdtemp(prefix="foodcourt-pcm-")
+        self.stream_cache = self.pcm_cache or PcmCache(self._temp_pcm_dir)
+        self._pending_voice = None  # 백그라운드에서 PCM을 준비한 뒤 재생할 긴 음성 파일명
+        self._voice_prep = {}  # 파일명 -> 긴 음성 PCM을 준비하는 AudioWarmup
+        self.warmup = None  # 백그라운드 워밍업 스레드
+        self.voice_channels = voice_channels
+        self.init_thread = None  # 백그라운드 믹서 초기화 스레드
+        self.ready = False  # 믹서 초기화 완료 여부 (그 전의 재생 요청은 무시)
+        self.notification = None
+        self.ambient_channel = None
+        self.voices = None
+
+    def initialize(self):
+        """pygame 믹서와 채널 초기화 (워커 스레드에서 호출해도 됨)
+        
+        Raises:
+            pygame.error: 오디오 장치를 열 수 없는 경우
+        """
+        # pygame 믹서 초기화 (알림음, 환경음 전용 채널과 음성/효과음 채널 풀 설정)
+        frequency, size, channels = MIXER_FORMAT
+        pygame.mixer.init(frequency=frequency, size=size, channels=channels, buffer=512)
+        pygame.mixer.set_num_channels(2 + self.voice_channels)
+        pygame.mixer.set_reserved(2 + self.voice_channels)
         
-        # pygame 믹서 초기화 (효과음을 위한 채널 1개 설정)
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-        pygame.mixer.set_num_channels(1)
+        # 알림음 전용 채널 (알림음은 한 번만 디코딩하여 메모리에서 재생)
+        self.notification = NotificationPlayer(self.audio_dir, pygame.mixer.Channel(0))
+        
+        # 환경음 전용 채널
+        self.ambient_channel = pygame.mixer.Channel(1)
+        
+        # 음성/효과음 채널 풀 (우선순위에 따라 채널을 빼앗고, 음성 재생 중에는 환경음을 낮춤)
+        self.voices = VoicePool([pygame.mixer.Channel(2 + i) for i in range(self.voice_channels)],
+                                set_ambient_volume=self._set_ambient_volume)
+        self.ready = True
+
+    def start(self, on_ready=None, on_failed=None):
+        """믹서 초기화와 환경음 시작을 백그라운드에서 실행
         
-        # 효과음 전용 채널
-        self.effect_channel = pygame.mixer.Channel(0)
+        초기화가 빨리 끝나도 신호를 놓치지 않도록 스레드를 시작하기 전에 연결합니다.
+        
+        Args:
+            on_ready (callable): 믹서가 준비되고 환경음이 시작되면 호출될 함수 (선택)
+            on_failed (callable): 믹서 초기화가 실패하면 에러 메시지와 함께 호출될 함수 (선택)
+            
+        Returns:
+            AudioInit: 시작된 초기화 스레드 (ready, failed 신호 제공)
+        """
+        if self.init_thread:
+            return self.init_thread
+        self.init_thread = AudioInit(self)
+        if on_ready:
+            self.init_thread.ready.connect(on_ready)
+        if on_failed:
+            self.init_thread.failed.connect(on_failed)
+        self.init_thread.start()
+        return self.init_thread
 
     def _load_sound(self, filename):
         """사운드 파일을 로드하고 캐싱
@@ -39,55 +115,214 @@ class AudioManager:
         Returns:
             pygame.mixer.Sound: 로드된 사운드 객체 또는 None
         """
-        if filename in self.sound_cache:
-            return self.sound_cache[filename]
+        sound = self.sound_cache.get(filename)
+        if sound is not None:
+            metrics.count("audio.cache.hit")
+            return sound
+        metrics.count("audio.cache.miss")
+        
+        # 번들에 있으면 파일을 열지 않고 mmap의 PCM으로 바로 사운드 생성
+        entry = self.bundle_entry(filename)
+        if entry is not None:
+            with metrics.span("audio.load_sound"):
+                sound = pygame.mixer.Sound(buffer=entry.view(entry.meta["pcm_offset"]))
+            self.sound_cache.put(filename, sound)
+            return sound
+        
+        # 전처리한 WAV가 있으면 MP3 디코딩과 PCM 캐시 저장 생략
+        derived_path = self.derived_audio(filename)
+        if derived_path:
+            with metrics.span("audio.load_sound"):
+                sound = pygame.mixer.Sound(derived_path)
+            self.sound_cache.put(filename, sound)
+            return sound
             
         sound_path = os.path.join(self.audio_dir, filename)
         if not os.path.exists(sound_path):
             print(f"사운드 파일을 찾을 수 없습니다: {sound_path}")
             return None
-            
-        sound = pygame.mixer.Sound(sound_path)
-        self.sound_cache[filename] = sound
+        
+        with metrics.span("audio.load_sound"):
+            # PCM 캐시가 있으면 MP3 디코딩 생략
+            sound = self.pcm_cache.load(sound_path) if self.pcm_cache else None
+            if sound is None:
+                sound = pygame.mixer.Sound(sound_path)
+        self.sound_cache.put(filename, sound)
         return sound
 
-    def play_ambient_sound(self, filename, parent=None):
+    def evict_sound(self, filename):
+        """메모리 캐시에서 사운드 제거 (카탈로그에서 카테고리가 없어진 경우 등)
+        
+        Args:
+            filename (str): 제거할 사운드 파일명
+            
+        Returns:
+            bool: 캐시에 있어서 제거했으면 True
+        """
+        return self.sound_cache.remove(filename)
+
+    def bundle_entry(self, filename):
+        """번들에서 현재 믹서 형식으로 바로 재생할 수 있는 오디오 항목 찾기
+        
+        Returns:
+            BundleEntry: 번들 항목. 번들이 없거나 항목이 없으면 None
+        """
+        entry = self.bundle.audio(filename) if self.bundle else None
+        if entry is None or not ChannelStream.is_compatible(entry):
+            return None
+        return entry
+
+    def derived_audio(self, filename):
+        """전처리 도구가 믹서 형식으로 변환해 둔 WAV 경로 (없거나 원본이 바뀌었으면 None)"""
+        return self.derived.audio(filename) if self.derived else None
+
+    def has_sound(self, filename):
+        """번들, 전처리 결과 또는 오디오 디렉토리에 사운드 파일이 있는지 확인"""
+        return (self.bundle is not None and self.bundle.audio(filename) is not None
+                or self.derived_audio(filename) is not None
+                or os.path.exists(os.path.join(self.audio_dir, filename)))
+
+    def sound_duration(self, filename):
+        """사운드 길이(초) (번들/전처리 색인 또는 파일 메타데이터만 읽음, 알 수 없으면 None)"""
+        entry = self.bundle.audio(filename) if self.bundle else None
+        if entry is not None:
+            return entry.meta.get("duration")
+        if self.derived_audio(filename):
+            return self.derived.duration(filename)
+        return probe_duration(os.path.join(self.audio_dir, filename))
+
+    def is_long_clip(self, sound_path):
+        """디코딩했을 때 스트리밍 기준보다 큰 음성인지 확인 (메타데이터만 읽음)
+        
+        Args:
+            sound_path (str): 오디오 파일 경로
+            
+        Returns:
+            bool: 스트리밍해야 하는 긴 음성이면 True
+        """
+        duration = self.sound_duration(os.path.basename(sound_path))
+        return duration is not None and pcm_bytes(duration) > self.stream_threshold
+
+    def _stream_source(self, sound_path):
+        """스트리밍에 사용할 PCM WAV (번들 항목, 전처리한 WAV, PCM 캐시 또는 원본 WAV)
+        
+        Returns:
+            믹서 형식과 같은 WAV 파일 경로 또는 번들 항목. 없으면 None
+        """
+        entry = self.bundle_entry(os.path.basename(sound_path))
+        if entry is not None:
+            return entry
+        derived_path = self.derived_audio(os.path.basename(sound_path))
+        if derived_path and ChannelStream.is_compatible(derived_path):
+            return derived_path
+        if self.stream_cache.contains(sound_path):
+            return self.stream_cache.entry_path(sound_path)
+        if sound_path.lower().endswith(".wav") and ChannelStream.is_compatible(sound_path):
+            return sound_path
+        return None
+
+    def start_warmup(self, filenames, on_ready=None):
+        """사운드 파일들을 백그라운드에서 미리 디코딩
+        
+        Args:
+            filenames (list): 미리 디코딩할 파일명 리스트
+            on_ready (callable): 모든 파일이 준비되면 호출될 함수 (선택)
+            
+        Returns:
+            AudioWarmup: 시작된 워밍업 스레드 (ready, file_ready 신호 제공)
+        """
+        if not self.ready:
+            return None
+        if self.warmup and self.warmup.isRunning():
+            return self.warmup
+        
+        # 환경음은 가장 마지막에 준비 (PCM이 준비되면 반복 스트림으로 교체)
+        filenames = list(filenames)
+        if self.ambient_filename and self.ambient_filename not in filenames:
+            filenames.append(self.ambient_filename)
+        
+        self.warmup = AudioWarmup(self, filenames)
+        self.warmup.file_ready.connect(self._on_warmup_file_ready)
+        if on_ready:
+            self.warmup.ready.connect(on_ready)
+        self.warmup.start(QThread.Priority.LowPriority)
+        return self.warmup
+
+    def is_warmed_up(self):
+        """워밍업이 끝났는지 확인"""
+        return self.warmup is not None and self.warmup.isFinished()
+
+    def warmup_stats(self):
+        """파일별 워밍업 소요 시간 반환
+        
+        Returns:
+            dict: 파일명 -> {"ms": 소요 시간, "source": 로드 경로}
+        """
+        return dict(self.warmup.timings) if self.warmup else {}
+
+    def play_ambient_sound(self, filename):
         """배경 환경음 재생
         
+        PCM이 준비되어 있으면 샘플 단위로 반복하는 스트림으로 재생하고,
+        아직 없으면 mixer.music의 자체 반복으로 재생하다가 워밍업이 끝나면 교체합니다.
+        
         Args:
             filename (str): 재생할 환경음 파일명 (예: ambient.mp3)
-            parent: QTimer를 위한 부모 객체 (보통 MainWindow)
         """
-        if not self.ambient_enabled:
-            return
+        self.ambient_filename = filename
+        if not self.ambient_enabled or not self.ready:
+            return  # 믹서가 준비되면 AudioInit에서 시작
 
-        sound = self._load_sound(filename)
-        if not sound:
+        ambient_path = os.path.join(self.audio_dir, filename)
+        if not self.has_sound(filename):
+            print(f"사운드 파일을 찾을 수 없습니다: {ambient_path}")
             return
             
-        # 환경음의 총 길이(초) 구하기
-        self.ambient_length = sound.get_length()
+        # 환경음의 총 길이(초) 구하기 (메타데이터만 읽고 디코딩하지 않음)
+        self.ambient_length = self.sound_duration(filename) or 0
         
-        # 배경 환경음 재생 (mixer.music 사용)
-        ambient_path = os.path.join(self.audio_dir, filename)
-        pygame.mixer.music.load(ambient_path)
-        pygame.mixer.music.play(-1, start=1.0)
-        
-        if parent:
-            # 타이머를 사용하여 끝나기 1초 전에 다시 시작
-            if self.ambient_timer:
-                self.ambient_timer.stop()
-                
-            self.ambient_timer = QTimer(parent)
-            # 환경음이 끝나기 1.1초 전에 타이머 실행 (약간의 여유를 둠)
-            interval = (self.ambient_length - 2.1) * 1000  # 밀리초 단위로 변환
-            self.ambient_timer.setInterval(int(max(100, interval)))  # 최소 100ms 보장
-            self.ambient_timer.timeout.connect(self.restart_ambient)
-            self.ambient_timer.start()
-
-    def restart_ambient(self):
-        """배경 환경음을 1초 지점부터 다시 시작"""
-        pygame.mixer.music.play(-1, start=1.0)
+        stream_path = self._stream_source(ambient_path)
+        if stream_path:
+            self._start_ambient_loop(stream_path)
+            return
+        
+        # PCM 준비 전에는 mixer.music으로 스트리밍 (타이머 없이 자체 반복)
+        try:
+            pygame.mixer.music.load(ambient_path)
+            pygame.mixer.music.play(-1, start=AMBIENT_LOOP_START)
+        except pygame.error as e:
+            # 워밍업에서 PCM이 만들어지면 반복 스트림으로 다시 시도
+            print(f"환경음을 재생할 수 없습니다: {filename} ({e})")
+            return
+        self._ambient_music = True
+
+    def _start_ambient_loop(self, stream_path, fade_ms=0):
+        """반복 환경음 스트림 시작"""
+        if self.ambient_loop:
+            self.ambient_loop.stop()
+        self.ambient_loop = AmbientLoop(self.ambient_channel, stream_path,
+                                        loop_start=AMBIENT_LOOP_START,
+                                        crossfade=AMBIENT_CROSSFADE,
+                                        fade_ms=fade_ms).start()
+
+    def _on_warmup_file_ready(self, filename, elapsed_ms):
+        """환경음 PCM이 준비되면 mixer.music 재생을 반복 스트림으로 교차 전환
+        (mixer.music으로 재생하지 못했다면 반복 스트림으로 시작)"""
+        if filename != self.ambient_filename or self.ambient_loop:
+            return
+        stream_path = self._stream_source(os.path.join(self.audio_dir, filename))
+        if not stream_path:
+            return
+        
+        fade_ms = int(AMBIENT_CROSSFADE * 1000)
+        if self._ambient_music:
+            self._ambient_music = False
+            if self.ambient_enabled:
+                pygame.mixer.music.fadeout(fade_ms)
+            else:
+                pygame.mixer.music.stop()
+        if self.ambient_enabled:
+            self._start_ambient_loop(stream_path, fade_ms=fade_ms)
 
     def play_category_sound(self, category):
         """메뉴 카테고리에 해당하는 음성 재생
@@ -95,45 +330,103 @@ class AudioManager:
         Args:
             category (str): 메뉴 카테고리 (예: 한식, 중식, 일식)
         """
-        sound_filename = f"{category}.mp3"
-        sound = self._load_sound(sound_filename)
-        if not sound:
+        if not self.ready:
             return
-            
-        # 이전에 재생 중이던 효과음 중지
-        self.effect_channel.stop()
+        self._pending_voice = None
+        with metrics.span("audio.play_category"):
+            sound_filename = f"{category}.mp3"
+            sound_path = os.path.join(self.audio_dir, sound_filename)
+        
+            # 긴 음성은 메모리에 캐시하지 않고 스트리밍
+            # (같은 "category" 키의 이전 음성은 채널 풀에서 먼저 중지됨)
+            if self.has_sound(sound_filename) and self.is_long_clip(sound_path):
+                stream_path = self._stream_source(sound_path)
+                if stream_path:
+                    self.voices.play_stream(stream_path, priority=PRIORITY_VOICE, loops=-1,
+                                            key="category", duck=True)
+                else:
+                    # 스트리밍할 PCM이 아직 없으면 GUI 스레드에서 디코딩하지 않고
+                    # 백그라운드에서 PCM을 저장한 뒤 재생 (이전 카테고리 음성은 바로 중지)
+                    self.voices.stop("category")
+                    self._prepare_voice(sound_filename)
+                return
+        
+            sound = self._load_sound(sound_filename)
+            if not sound:
+                return
+        
+            # 채널 풀에서 새로운 음성 재생 (-1은 무한 반복)
+            self.voices.play(sound, priority=PRIORITY_VOICE, loops=-1, key="category", duck=True)
+
+    def _prepare_voice(self, filename):
+        """긴 음성의 PCM을 백그라운드에서 스트리밍 캐시에 저장하고 준비되면 재생
         
-        # 효과음 채널에서 새로운 효과음 재생 (-1은 무한 반복)
-        self.effect_channel.play(sound, loops=-1)  # 무한 반복으로 변경
+        Args:
+            filename (str): 준비할 음성 파일명
+        """
+        self._pending_voice = filename
+        thread = self._voice_prep.get(filename)
+        if thread is not None and thread.isRunning():
+            return
+        thread = AudioWarmup(self, [filename])
+        thread.file_ready.connect(self._on_voice_prepared)
+        self._voice_prep[filename] = thread
+        thread.start()
+
+    def _on_voice_prepared(self, filename, elapsed_ms):
+        """긴 음성의 PCM이 준비되었을 때 그 사이 다른 카테고리를 고르지 않았으면 스트리밍 재생"""
+        if filename != self._pending_voice or not self.ready:
+            return
+        self._pending_voice = None
+        stream_path = self._stream_source(os.path.join(self.audio_dir, filename))
+        if stream_path:
+            self.voices.play_stream(stream_path, priority=PRIORITY_VOICE, loops=-1,
+                                    key="category", duck=True)
+
+    def play_effect(self, filename, priority=0, duck=False):
+        """효과음 재생 (다른 음성이나 효과음을 끊지 않고 빈 채널에서 재생)
+        
+        Args:
+            filename (str): 재생할 효과음 파일명
+            priority (int): 우선순위 (채널이 모두 사용 중이면 낮은 우선순위부터 빼앗음)
+            duck (bool): 재생하는 동안 환경음 볼륨을 낮출지 여부
+        """
+        if not self.ready:
+            return
+        sound = self._load_sound(filename)
+        if sound:
+            self.voices.play(sound, priority=priority, duck=duck)
+
+    def _set_ambient_volume(self, volume):
+        """환경음 볼륨 설정 (반복 스트림과 mixer.music 모두)"""
+        self.ambient_channel.set_volume(volume)
+        pygame.mixer.music.set_volume(volume)
 
     def play_system_notification(self):
         """시스템 알림음(Notification) 재생
-        Windows와 macOS 모두 지원"""
-        system = platform.system()
-        if system == "Darwin":  # macOS
-            try:
-                subprocess.run(["afplay", "/System/Library/Sounds/Tink.aiff"])
-            except (FileNotFoundError, subprocess.SubprocessError):
-                print("macOS에서 알림음을 재생할 수 없습니다.")
-        elif system == "Windows":  # Windows
-            try:
-                winsound.PlaySound("SystemDefault", winsound.SND_ALIAS)
-            except Exception:
-                print("Windows에서 알림음을 재생할 수 없습니다.")
+        전용 채널에서 재생하며 GUI 스레드를 막지 않음"""
+        if not self.ready:
+            return
+        with metrics.span("audio.notification"):
+            self.notification.play()
 
     def toggle_ambient_sound(self):
-        """환경음 On/Off 토글"""
+        """환경음 On/Off 토글 (파일을 다시 로드하지 않고 일시 정지/재개)"""
         self.ambient_enabled = not self.ambient_enabled
         if self.ambient_enabled:
             # 환경음 다시 시작
-            pygame.mixer.music.play(-1, start=1.0)
-            if self.ambient_timer:
-                self.ambient_timer.start()
+            if self.ambient_loop:
+                self.ambient_loop.resume()
+            elif self._ambient_music:
+                pygame.mixer.music.unpause()
+            elif self.ambient_filename:
+                self.play_ambient_sound(self.ambient_filename)
         else:
             # 환경음 중지
-            pygame.mixer.music.stop()
-            if self.ambient_timer:
-                self.ambient_timer.stop()
+            if self.ambient_loop:
+                self.ambient_loop.pause()
+            elif self._ambient_music:
+                pygame.mixer.music.pause()
         return self.ambient_enabled
 
     def is_ambient_enabled(self):
@@ -142,8 +435,25 @@ class AudioManager:
 
     def cleanup(self):
         """오디오 리소스 정리"""
-        if self.ambient_timer:
-            self.ambient_timer.stop()
+        if self.init_thread and self.init_thread.isRunning():
+            self.init_thread.wait()
+        if not self.ready:
+            self._remove_temp_pcm()
+            return
+        for thread in [self.warmup, *self._voice_prep.values()]:
+            if thread and thread.isRunning():
+                thread.requestInterruption()
+                thread.wait()
+        if self.ambient_loop:
+            self.ambient_loop.stop()
         pygame.mixer.music.stop()
-        self.effect_channel.stop()
+        self.voices.stop_all()
+        self.notification.stop()
         pygame.mixer.quit()
+        self._remove_temp_pcm()
+
+    def _remove_temp_pcm(self):
+        """캐시 디렉토리 없이 실행한 경우 긴 음성용 임시 PCM 디렉토리 삭제"""
+        if self._temp_pcm_dir:
+            shutil.rmtree(self._temp_pcm_dir, ignore_errors=True)
+            self._temp_pcm_dir = None
@@ -0,0 +1,147 @@
+import os
+import math
+import time
+import platform
+import subprocess
+from array import array
+import pygame
+
+system = platform.system()
+if system == "Windows":  # Windows
+    import winsound
+
+# 운영체제별 시스템 알림음 파일 (메모리에 한 번만 디코딩)
+SYSTEM_SOUNDS = {
+    "Darwin": ["/System/Library/Sounds/Tink.aiff"],
+    "Windows": [r"C:\Windows\Media\Windows Notify System Generic.wav",
+                r"C:\Windows\Media\Windows Ding.wav"],
+    "Linux": ["/usr/share/sounds/freedesktop/stereo/message.oga",
+              "/usr/share/sounds/freedesktop/stereo/bell.oga"],
+}
+
+# 믹서를 사용할 수 없을 때 사용할 외부 재생기와 재생할 수 있는 확장자 (None이면 모든 형식)
+# aplay는 WAV만 재생하므로 freedesktop 알림음(.oga)에는 사용하지 않음
+EXTERNAL_PLAYERS = {
+    "Darwin": [("afplay", None)],
+    "Linux": [("paplay", None), ("aplay", (".wav",))],
+}
+
+# 사용자 지정 알림음 파일명 (오디오 디렉토리에 있으면 우선 사용)
+CUSTOM_SOUND = "notification.wav"
+
+class NotificationPlayer:
+    """메뉴 클릭 알림음 재생기
+
+    알림음을 한 번만 디코딩해 메모리에 두고 전용 믹서 채널에서 재생하므로
+    클릭마다 프로세스를 만들거나 GUI 스레드를 기다리게 하지 않습니다.
+    """
+
+    def __init__(self, audio_dir, channel=None):
+        """알림음 재생기 초기화
+
+        Args:
+            audio_dir (str): 오디오 파일이 있는 디렉토리 경로
+            channel (pygame.mixer.Channel): 알림음 전용 채널 (None이면 외부 재생기 사용)
+        """
+        self.audio_dir = audio_dir
+        self.channel = channel
+        self.sound = None
+        self.sound_path = None  # 알림음 파일 경로 (합성음이면 None)
+        self._process = None  # 외부 재생기 프로세스
+        self.last_latency_ms = 0.0  # 마지막 재생 호출에 걸린 시간
+
+        if channel is not None:
+            self.sound = self._load()
+
+    def _candidates(self):
+        """알림음 파일 후보 목록"""
+        candidates = [os.path.join(self.audio_dir, CUSTOM_SOUND)]
+        candidates.extend(SYSTEM_SOUNDS.get(system, []))
+        return candidates
+
+    def _load(self):
+        """알림음을 디코딩하여 메모리에 로드 (실패하면 짧은 클릭음 합성)"""
+        for path in self._candidates():
+            if not os.path.exists(path):
+                continue
+            try:
+                sound = pygame.mixer.Sound(path)
+                self.sound_path = path
+                return sound
+            except pygame.error:
+                continue
+        return self._synthesize_click()
+
+    def _synthesize_click(self, frequency=1800, duration=0.04):
+        """짧게 감쇠하는 클릭음을 믹서 형식에 맞게 합성
+
+        Args:
+            frequency (int): 음의 주파수(Hz)
+            duration (float): 길이(초)
+
+        Returns:
+            pygame.mixer.Sound: 합성된 사운드 또는 None
+        """
+        mixer_format = pygame.mixer.get_init()
+        if not mixer_format:
+            return None
+        rate, size, channels = mixer_format
+        if abs(size) != 16:
+            return None
+
+        samples = array("h")
+        count = int(rate * duration)
+        for i in range(count):
+            envelope = 1.0 - i / count
+            value = int(12000 * envelope * envelope * math.sin(2 * math.pi * frequency * i / rate))
+            samples.extend([value] * channels)
+        try:
+            return pygame.mixer.Sound(buffer=samples.tobytes())
+        except pygame.error:
+            return None
+
+    def play(self):
+        """알림음 재생 (항상 즉시 반환)"""
+        start = time.perf_counter()
+        if self.sound is not None and self.channel is not None:
+            self.channel.play(self.sound)
+        else:
+            self._play_external()
+        self.last_latency_ms = (time.perf_counter() - start) * 1000
+
+    def _play_external(self):
+        """믹서를 사용할 수 없을 때 외부 재생기로 비동기 재생"""
+        if system == "Windows":  # Windows
+            try:
+                winsound.PlaySound("SystemDefault", winsound.SND_ALIAS | winsound.SND_ASYNC)
+            except Exception:
+                print("Windows에서 알림음을 재생할 수 없습니다.")
+            return
+
+        # 이전 재생이 아직 진행 중이면 겹쳐서 실행하지 않음 (종료된 프로세스는 회수)
+        if self._process is not None and self._process.poll() is None:
+            return
+
+        # 사용자 지정 알림음, 시스템 알림음 순으로 재생기가 지원하는 형식의 파일을 찾음
+        sound_paths = [path for path in self._candidates() if os.path.exists(path)]
+        for player, extensions in EXTERNAL_PLAYERS.get(system, []):
+            sound_path = next((path for path in sound_paths
+                               if extensions is None or path.lower().endswith(extensions)), None)
+            if sound_path is None:
+                continue
+            try:
+                self._process = subprocess.Popen([player, sound_path],
+                                                 stdout=subprocess.DEVNULL,
+                                                 stderr=subprocess.DEVNULL)
+                return
+            except (FileNotFoundError, OSError):
+                continue
+        print("알림음을 재생할 수 없습니다.")
+
+    def stop(self):
+        """재생 중인 알림음 중지"""
+        if self.channel is not None:
+            self.channel.stop()
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+        self._process = None
@@ -0,0 +1,126 @@
+import os
+import wave
+import hashlib
+import threading
+import pygame
+
+class PcmCache:
+    """디코딩한 PCM 데이터를 WAV 파일로 저장하는 디스크 캐시
+
+    캐시 파일 이름은 '<경로 키>-<버전 키>.wav' 형식입니다.
+    버전 키는 원본 파일의 크기, 수정 시각과 믹서 형식으로 만들어지므로
+    원본이나 믹서 설정이 바뀌면 이전 항목은 자동으로 무효화됩니다.
+    """
+
+    def __init__(self, cache_dir):
+        """PCM 캐시 초기화
+
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 디렉토리 경로
+        """
+        self.cache_dir = cache_dir
+        self.enabled = True
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"오디오 캐시 디렉토리를 사용할 수 없습니다: {e}")
+            self.enabled = False
+
+    def _path_key(self, source_path):
+        """원본 경로로 만든 키"""
+        return hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()[:20]
+
+    def entry_path(self, source_path):
+        """원본 파일 상태와 믹서 형식을 반영한 캐시 파일 경로
+
+        Returns:
+            str: 캐시 파일 경로. 원본이 없거나 믹서가 초기화되지 않았으면 None
+        """
+        mixer_format = pygame.mixer.get_init()
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        if not mixer_format:
+            return None
+        raw = f"{stat.st_size}|{stat.st_mtime_ns}|{mixer_format}"
+        version = hashlib.sha1(raw.encode()).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{self._path_key(source_path)}-{version}.wav")
+
+    def contains(self, source_path):
+        """원본에 해당하는 최신 캐시 파일이 있는지 확인"""
+        entry_path = self.entry_path(source_path) if self.enabled else None
+        return entry_path is not None and os.path.exists(entry_path)
+
+    def load(self, source_path):
+        """캐시된 PCM을 사운드로 로드 (MP3 디코딩 생략)
+
+        Args:
+            source_path (str): 원본 오디오 파일 경로
+
+        Returns:
+            pygame.mixer.Sound: 로드된 사운드. 없거나 손상된 경우 None
+        """
+        if not self.enabled:
+            return None
+        entry_path = self.entry_path(source_path)
+        if entry_path is None or not os.path.exists(entry_path):
+            return None
+        try:
+            return pygame.mixer.Sound(entry_path)
+        except pygame.error:
+            print(f"손상된 오디오 캐시 항목을 삭제합니다: {os.path.basename(entry_path)}")
+            self._remove(entry_path)
+            return None
+
+    def store(self, source_path, sound):
+        """사운드의 PCM 데이터를 WAV 파일로 저장
+
+        Args:
+            source_path (str): 원본 오디오 파일 경로
+            sound (pygame.mixer.Sound): 디코딩된 사운드
+        """
+        if not self.enabled:
+            return
+        entry_path = self.entry_path(source_path)
+        if entry_path is None:
+            return
+        rate, size, channels = pygame.mixer.get_init()
+        self._remove_stale(source_path, keep=entry_path)
+
+        # 임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 손상된 항목이 남지 않게 함
+        temp_path = f"{entry_path}.{threading.get_ident()}.tmp"
+        try:
+            with wave.open(temp_path, "wb") as wav:
+                wav.setnchannels(channels)
+                wav.setsampwidth(abs(size) // 8)
+                wav.setframerate(rate)
+                wav.writeframes(sound.get_raw())
+            os.replace(temp_path, entry_path)
+        except (OSError, wave.Error) as e:
+            print(f"오디오 캐시를 저장할 수 없습니다: {e}")
+            self._remove(temp_path)
+
+    def invalidate(self, source_path):
+        """원본 파일의 캐시 항목을 모두 삭제"""
+        if self.enabled:
+            self._remove_stale(source_path, keep=None)
+
+    def _remove_stale(self, source_path, keep):
+        """같은 원본의 다른 버전 캐시 파일 삭제"""
+        prefix = self._path_key(source_path) + "-"
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            if name.startswith(prefix) and path != keep:
+                self._remove(path)
+
+    def _remove(self, path):
+        """파일 삭제 (없으면 무시)"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
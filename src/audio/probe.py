@@ -0,0 +1,117 @@
+import os
+import wave
+import struct
+
+# MPEG 오디오 비트레이트 표 (kbps) - [MPEG-1 Layer III, MPEG-2/2.5 Layer III]
+_MP3_BITRATES = [
+    [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0],
+    [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0],
+]
+# 샘플레이트 표 (Hz) - 버전 비트(0: MPEG-2.5, 2: MPEG-2, 3: MPEG-1)
+_MP3_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    0: [11025, 12000, 8000],
+}
+
+def probe_duration(path):
+    """오디오 파일의 길이(초)를 메타데이터만 읽어서 구함 (디코딩하지 않음)
+
+    WAV, MP3, OGG 형식을 지원합니다.
+
+    Args:
+        path (str): 오디오 파일 경로
+
+    Returns:
+        float: 길이(초). 알 수 없는 형식이거나 읽을 수 없으면 None
+    """
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        if ext == ".wav":
+            return _probe_wav(path)
+        if ext == ".mp3":
+            return _probe_mp3(path)
+        if ext in (".ogg", ".oga"):
+            return _probe_ogg(path)
+    except (OSError, EOFError, wave.Error, struct.error, IndexError):
+        return None
+    return None
+
+def _probe_wav(path):
+    """WAV 헤더에서 길이 계산"""
+    with wave.open(path, "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+def _probe_mp3(path):
+    """MP3 첫 프레임 헤더와 Xing/VBRI 헤더에서 길이 계산 (없으면 고정 비트레이트로 추정)"""
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        head = f.read(10)
+        offset = 0
+        # ID3v2 태그 건너뛰기
+        if head[:3] == b"ID3":
+            tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            offset = 10 + tag_size
+        f.seek(offset)
+        data = f.read(4096)
+
+    # 첫 번째 프레임 동기 비트 찾기
+    pos = 0
+    while pos < len(data) - 4:
+        if data[pos] == 0xFF and (data[pos + 1] & 0xE0) == 0xE0:
+            break
+        pos += 1
+    else:
+        return None
+
+    header = struct.unpack(">I", data[pos:pos + 4])[0]
+    version = (header >> 19) & 0x3
+    bitrate_index = (header >> 12) & 0xF
+    rate_index = (header >> 10) & 0x3
+    channel_mode = (header >> 6) & 0x3
+    if version == 1 or rate_index == 3 or bitrate_index in (0, 15):
+        return None
+
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    samples_per_frame = 1152 if version == 3 else 576
+
+    # Xing/Info 헤더 (VBR) 확인
+    if version == 3:
+        side_info = 17 if channel_mode == 3 else 32
+    else:
+        side_info = 9 if channel_mode == 3 else 17
+    xing = pos + 4 + side_info
+    if data[xing:xing + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", data[xing + 4:xing + 8])[0]
+        if flags & 0x1:
+            frames = struct.unpack(">I", data[xing + 8:xing + 12])[0]
+            return frames * samples_per_frame / sample_rate
+
+    # VBRI 헤더 확인 (프레임 헤더 뒤 32바이트 위치)
+    vbri = pos + 4 + 32
+    if data[vbri:vbri + 4] == b"VBRI":
+        frames = struct.unpack(">I", data[vbri + 14:vbri + 18])[0]
+        return frames * samples_per_frame / sample_rate
+
+    # 고정 비트레이트로 추정
+    bitrate = _MP3_BITRATES[0 if version == 3 else 1][bitrate_index] * 1000
+    return (file_size - offset - pos) * 8 / bitrate
+
+def _probe_ogg(path):
+    """OGG Vorbis 식별 헤더의 샘플레이트와 마지막 페이지의 granule 위치로 길이 계산"""
+    with open(path, "rb") as f:
+        head = f.read(4096)
+        marker = head.find(b"\x01vorbis")
+        if marker < 0:
+            return None
+        sample_rate = struct.unpack("<I", head[marker + 12:marker + 16])[0]
+
+        file_size = os.path.getsize(path)
+        f.seek(max(0, file_size - 65536))
+        tail = f.read()
+
+    last_page = tail.rfind(b"OggS")
+    if last_page < 0 or not sample_rate:
+        return None
+    granule = struct.unpack("<q", tail[last_page + 6:last_page + 14])[0]
+    return granule / sample_rate if granule > 0 else None
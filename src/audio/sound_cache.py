@@ -0,0 +1,124 @@
+import threading
+from collections import OrderedDict
+import pygame
+
+# 기본 메모리 예산 (44.1kHz 16비트 스테레오 기준 약 3분 분량)
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+def pcm_bytes(duration):
+    """주어진 길이(초)의 PCM 데이터가 현재 믹서 형식에서 차지하는 바이트 수
+
+    Args:
+        duration (float): 길이(초)
+
+    Returns:
+        int: 바이트 수 (믹서가 초기화되지 않았으면 44.1kHz 16비트 스테레오 기준)
+    """
+    rate, size, channels = pygame.mixer.get_init() or (44100, -16, 2)
+    return int(duration * rate * channels * abs(size) // 8)
+
+class SoundCache:
+    """메모리 예산(바이트) 기반 LRU pygame 사운드 캐시
+
+    워밍업 스레드와 GUI 스레드에서 함께 사용하므로 내부적으로 잠금을 사용합니다.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """캐시 초기화
+
+        Args:
+            max_bytes (int): 캐시가 사용할 수 있는 최대 바이트 수
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()  # 파일명 -> (Sound, 바이트 크기)
+        self._lock = threading.Lock()
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """캐시에서 사운드를 조회 (조회된 항목은 가장 최근 사용으로 이동)
+
+        Args:
+            key (str): 사운드 파일명
+
+        Returns:
+            pygame.mixer.Sound: 캐시된 사운드 또는 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, sound):
+        """사운드를 캐시에 저장하고 예산을 넘으면 오래된 항목을 제거
+
+        Args:
+            key (str): 사운드 파일명
+            sound (pygame.mixer.Sound): 저장할 사운드
+        """
+        cost = pcm_bytes(sound.get_length())
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (sound, cost)
+            self.current_bytes += cost
+
+            # 방금 넣은 항목은 남기고 오래된 항목부터 제거
+            while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_cost) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_cost
+                self.evictions += 1
+
+    def contains(self, key):
+        """키가 캐시에 있는지 확인 (통계와 LRU 순서에는 영향 없음)"""
+        with self._lock:
+            return key in self._entries
+
+    def remove(self, key):
+        """캐시에서 항목 제거
+
+        Returns:
+            bool: 항목이 있어서 제거했으면 True
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self.current_bytes -= entry[1]
+            return True
+
+    def clear(self):
+        """모든 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """캐시 통계 반환
+
+        Returns:
+            dict: 항목 수, 사용 바이트, 예산, 적중/실패/제거 횟수
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.contains(key)
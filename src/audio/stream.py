@@ -0,0 +1,132 @@
+import wave
+import threading
+import pygame
+
+def open_wav(source):
+    """WAV 파일 경로 또는 번들 항목(open()으로 파일 객체를 여는 객체)을 읽기용으로 열기"""
+    if hasattr(source, "open"):
+        return wave.open(source.open(), "rb")
+    return wave.open(source, "rb")
+
+class ChannelStream:
+    """WAV 파일의 PCM 데이터를 조각 단위로 읽어 믹서 채널에 이어서 재생하는 스트림
+
+    전체 파일을 메모리에 올리지 않고 재생 중인 조각 하나와 대기 중인 조각 하나만 유지합니다.
+    조각은 채널의 대기열(queue)로 넘기므로 조각 사이에 틈이 생기지 않습니다.
+    """
+
+    def __init__(self, channel, wav_path, loops=0, chunk_seconds=0.5, fade_ms=0):
+        """스트림 초기화
+
+        Args:
+            channel (pygame.mixer.Channel): 재생할 채널
+            wav_path (str): 믹서 형식과 같은 PCM WAV 파일 경로 (또는 번들 항목)
+            loops (int): 반복 횟수 (-1은 무한 반복)
+            chunk_seconds (float): 한 번에 읽을 조각 길이(초)
+            fade_ms (int): 재생 시작 시 페이드 인 시간(밀리초)
+        """
+        self.channel = channel
+        self.wav_path = wav_path
+        self.loops = loops
+        self.chunk_seconds = chunk_seconds
+        self.fade_ms = fade_ms
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._source = None
+        self.length = None  # 한 번 재생하는 길이(초, 파일을 연 뒤 설정)
+
+    @staticmethod
+    def is_compatible(wav_path):
+        """WAV 파일이 현재 믹서 형식과 같아 그대로 스트리밍할 수 있는지 확인"""
+        mixer_format = pygame.mixer.get_init()
+        if not mixer_format:
+            return False
+        rate, size, channels = mixer_format
+        try:
+            with open_wav(wav_path) as wav:
+                return (wav.getframerate() == rate and wav.getnchannels() == channels
+                        and wav.getsampwidth() == abs(size) // 8)
+        except (OSError, EOFError, wave.Error):
+            return False
+
+    def start(self, prime=False):
+        """스트리밍 스레드 시작
+
+        Args:
+            prime (bool): 첫 조각을 호출한 스레드에서 바로 재생할지 여부
+                (True이면 반환 시점에 채널이 이미 재생 중)
+
+        Returns:
+            ChannelStream: 자기 자신
+        """
+        self._source = self._chunks()
+        if prime:
+            try:
+                data = next(self._source, None)
+                if data is None:
+                    return self
+                self.channel.play(pygame.mixer.Sound(buffer=data), fade_ms=self.fade_ms)
+            except (OSError, EOFError, wave.Error, pygame.error) as e:
+                print(f"오디오 스트리밍 중 오류가 발생했습니다: {e}")
+                return self
+            self.fade_ms = 0
+        self._thread = threading.Thread(target=self._run, name="ChannelStream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """스트리밍 중지"""
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self.channel.stop()
+
+    def pause(self):
+        """재생 일시 정지 (스트리밍 스레드는 대기열이 빌 때까지 기다림)"""
+        self.channel.pause()
+
+    def resume(self):
+        """일시 정지한 위치부터 다시 재생"""
+        self.channel.unpause()
+
+    def is_playing(self):
+        """스트리밍 중인지 확인"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _chunks(self):
+        """반복 설정에 따라 PCM 조각을 차례로 생성"""
+        loops = self.loops
+        with open_wav(self.wav_path) as wav:
+            self.length = wav.getnframes() / wav.getframerate()
+            frames_per_chunk = max(1, int(wav.getframerate() * self.chunk_seconds))
+            while not self._stop_event.is_set():
+                data = wav.readframes(frames_per_chunk)
+                if data:
+                    yield data
+                    continue
+                if loops == 0:
+                    return
+                if loops > 0:
+                    loops -= 1
+                wav.rewind()
+
+    def _run(self):
+        """조각을 읽어 채널 대기열에 하나씩 넘기는 스레드 본문"""
+        wait = self.chunk_seconds / 4
+        fade_ms = self.fade_ms
+        try:
+            for data in self._source:
+                sound = pygame.mixer.Sound(buffer=data)
+                if not self.channel.get_busy():
+                    self.channel.play(sound, fade_ms=fade_ms)
+                    fade_ms = 0
+                    continue
+                # 대기열이 빌 때까지 기다렸다가 다음 조각을 넘김
+                while self.channel.get_queue() is not None:
+                    if self._stop_event.wait(wait):
+                        return
+                if self._stop_event.is_set():
+                    return
+                self.channel.queue(sound)
+        except (OSError, EOFError, wave.Error, pygame.error) as e:
+            print(f"오디오 스트리밍 중 오류가 발생했습니다: {e}")
@@ -0,0 +1,235 @@
+import time
+import threading
+import pygame
+from .stream import ChannelStream
+
+# 기본 우선순위 (값이 클수록 중요)
+PRIORITY_EFFECT = 0
+PRIORITY_VOICE = 10
+
+class _Voice:
+    """채널 하나에서 재생 중인 소리 정보"""
+
+    def __init__(self, channel, priority, key=None, duck=False, stream=None, length=None):
+        self.channel = channel
+        self.priority = priority
+        self.key = key
+        self.duck = duck
+        self.stream = stream
+        self.started = time.monotonic()
+        # 환경음 볼륨을 낮추는 기한 (한 번 재생하는 길이만큼, 반복해도 늘어나지 않음)
+        self.duck_until = self.started + length if length else None
+
+    def is_active(self):
+        """재생 중인지 확인 (스트림은 스트리밍 스레드가 남은 조각을 넘기는 동안에도 재생 중)"""
+        if self.stream and self.stream.is_playing():
+            return True
+        return self.channel.get_busy()
+
+    def is_ducking(self, now):
+        """환경음 볼륨을 낮춰야 하는지 확인 (반복하는 소리는 첫 재생 동안만)"""
+        if not self.duck:
+            return False
+        if self.duck_until is not None and now >= self.duck_until:
+            return False
+        return self.is_active()
+
+    def stop(self):
+        """재생 중지"""
+        if self.stream:
+            self.stream.stop()
+        else:
+            self.channel.stop()
+
+class VoicePool:
+    """여러 소리를 동시에 재생하기 위한 채널 풀
+
+    빈 채널이 없으면 요청보다 우선순위가 같거나 낮은 소리 중 가장 낮은 우선순위,
+    그중에서도 가장 오래된 소리를 빼앗아 재생합니다.
+    음성처럼 잘 들려야 하는 소리를 재생하는 동안에는 환경음 볼륨을 자동으로 낮춥니다.
+    반복하는 소리는 첫 재생이 끝나면 환경음 볼륨을 되돌립니다.
+    채널은 재생을 시작할 때 풀이 점유하고 소리가 끝나거나 중지될 때 놓으므로,
+    스트림처럼 채널이 아직 재생 중으로 보이지 않는 소리의 채널을 다른 소리가 가져가지 않습니다.
+    """
+
+    def __init__(self, channels, set_ambient_volume=None, duck_volume=0.35):
+        """채널 풀 초기화
+
+        Args:
+            channels (list): 풀에서 사용할 pygame.mixer.Channel 리스트
+            set_ambient_volume (callable): 환경음 볼륨(0.0~1.0)을 설정하는 함수 (선택)
+            duck_volume (float): 음성 재생 중 환경음 볼륨
+        """
+        self.channels = list(channels)
+        self.set_ambient_volume = set_ambient_volume
+        self.duck_volume = duck_volume
+        self._voices = {}  # 풀의 채널 객체 -> _Voice
+        self._claimed = set()  # 점유 중인 채널 (재생을 시작하기 전 채널 포함)
+        self._lock = threading.Lock()
+        self._ducked = False
+        self._monitor = None
+
+        # 통계 카운터
+        self.plays = 0
+        self.steals = 0
+        self.rejected = 0
+
+    def play(self, sound, priority=PRIORITY_EFFECT, loops=0, key=None, duck=False):
+        """사운드를 빈 채널(또는 빼앗은 채널)에서 재생
+
+        Args:
+            sound (pygame.mixer.Sound): 재생할 사운드
+            priority (int): 우선순위 (값이 클수록 중요)
+            loops (int): 반복 횟수 (-1은 무한 반복)
+            key (str): 같은 키로 재생 중인 소리는 먼저 중지 (예: "category")
+            duck (bool): 재생하는 동안 환경음 볼륨을 낮출지 여부 (반복하면 첫 재생 동안만)
+
+        Returns:
+            pygame.mixer.Channel: 재생에 사용한 채널. 채널을 얻지 못하면 None
+        """
+        channel = self._allocate(priority, key)
+        if channel is None:
+            return None
+        try:
+            channel.play(sound, loops=loops)
+        except pygame.error:
+            self._release(channel)
+            raise
+        self._register(_Voice(channel, priority, key, duck, length=sound.get_length()))
+        return channel
+
+    def play_stream(self, wav_path, priority=PRIORITY_EFFECT, loops=0, key=None, duck=False):
+        """PCM WAV 파일을 빈 채널(또는 빼앗은 채널)에서 스트리밍
+
+        Args:
+            wav_path (str): 믹서 형식과 같은 PCM WAV 파일 경로
+            priority (int): 우선순위 (값이 클수록 중요)
+            loops (int): 반복 횟수 (-1은 무한 반복)
+            key (str): 같은 키로 재생 중인 소리는 먼저 중지
+            duck (bool): 재생하는 동안 환경음 볼륨을 낮출지 여부 (반복하면 첫 재생 동안만)
+
+        Returns:
+            ChannelStream: 시작된 스트림. 채널을 얻지 못하면 None
+        """
+        channel = self._allocate(priority, key)
+        if channel is None:
+            return None
+        # 첫 조각을 여기서 재생하여 등록하는 시점에 채널이 이미 재생 중이도록 함
+        stream = ChannelStream(channel, wav_path, loops=loops).start(prime=True)
+        if not stream.is_playing() and not channel.get_busy():
+            self._release(channel)
+            return None
+        self._register(_Voice(channel, priority, key, duck, stream, length=stream.length))
+        return stream
+
+    def stop(self, key):
+        """같은 키로 재생 중인 소리 중지"""
+        with self._lock:
+            voices = [voice for voice in self._voices.values() if voice.key == key]
+            for voice in voices:
+                del self._voices[voice.channel]
+        for voice in voices:
+            voice.stop()
+            self._release(voice.channel)
+        self._update_ducking()
+
+    def stop_all(self):
+        """모든 소리 중지"""
+        with self._lock:
+            voices = list(self._voices.values())
+            self._voices.clear()
+            self._claimed.clear()
+        for voice in voices:
+            voice.stop()
+        self._update_ducking()
+
+    def active_voices(self):
+        """재생 중인 소리 수"""
+        with self._lock:
+            return sum(1 for voice in self._voices.values() if voice.is_active())
+
+    def stats(self):
+        """채널 풀 통계 반환
+
+        Returns:
+            dict: 채널 수, 재생 중인 소리 수, 재생/빼앗기/거절 횟수
+        """
+        return {
+            "channels": len(self.channels),
+            "active": self.active_voices(),
+            "plays": self.plays,
+            "steals": self.steals,
+            "rejected": self.rejected,
+            "ducked": self._ducked,
+        }
+
+    def _allocate(self, priority, key):
+        """재생할 채널 선택 (같은 키 -> 빈 채널 -> 빼앗을 채널 순)"""
+        if key is not None:
+            self.stop(key)
+
+        with self._lock:
+            self._reap()
+            for channel in self.channels:
+                if channel not in self._claimed:
+                    self._claimed.add(channel)
+                    return channel
+
+            # 우선순위가 같거나 낮은 소리 중 가장 낮고 오래된 것을 빼앗음
+            # (빼앗은 채널은 점유한 채로 넘겨줌)
+            candidates = [voice for voice in self._voices.values() if voice.priority <= priority]
+            if not candidates:
+                self.rejected += 1
+                return None
+            victim = min(candidates, key=lambda voice: (voice.priority, voice.started))
+            del self._voices[victim.channel]
+            self.steals += 1
+
+        victim.stop()
+        return victim.channel
+
+    def _reap(self):
+        """끝난 소리의 채널을 놓음 (잠금을 잡은 상태에서 호출)"""
+        for channel, voice in list(self._voices.items()):
+            if not voice.is_active():
+                del self._voices[channel]
+                self._claimed.discard(channel)
+
+    def _release(self, channel):
+        """재생하지 못한 채널이나 중지한 채널을 놓음"""
+        with self._lock:
+            if channel not in self._voices:
+                self._claimed.discard(channel)
+
+    def _register(self, voice):
+        """재생을 시작한 소리를 기록하고 필요하면 환경음 볼륨을 낮춤"""
+        with self._lock:
+            self._voices[voice.channel] = voice
+            self.plays += 1
+        if voice.duck:
+            self._update_ducking()
+
+    def _update_ducking(self):
+        """음성이 재생 중이면 환경음 볼륨을 낮추고, 모두 끝나면 되돌림"""
+        if self.set_ambient_volume is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            ducking = any(voice.is_ducking(now) for voice in self._voices.values())
+            changed = ducking != self._ducked
+            self._ducked = ducking
+        if changed:
+            self.set_ambient_volume(self.duck_volume if ducking else 1.0)
+        if ducking and not (self._monitor and self._monitor.is_alive()):
+            # 음성이 끝나는 시점을 확인하기 위한 감시 스레드 (낮춘 동안에만 실행)
+            self._monitor = threading.Thread(target=self._watch_ducking, name="VoiceDucking", daemon=True)
+            self._monitor.start()
+
+    def _watch_ducking(self):
+        """낮춘 환경음 볼륨을 음성이 끝나면 되돌리는 감시 스레드 본문"""
+        while self._ducked:
+            time.sleep(0.1)
+            try:
+                self._update_ducking()
+            except pygame.error:
+                return
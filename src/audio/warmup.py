@@ -0,0 +1,117 @@
+import os
+import time
+import pygame
+from PySide6.QtCore import QThread, Signal
+
+class AudioWarmup(QThread):
+    """카테고리 음성을 백그라운드에서 미리 디코딩하는 워커 스레드
+
+    PCM 캐시가 있으면 WAV를 바로 읽고, 없으면 원본을 디코딩한 뒤 PCM 캐시에 저장하므로
+    두 번째 실행부터는 MP3 디코딩 없이 준비됩니다. 긴 음성은 스트리밍용 PCM 캐시
+    (캐시 디렉토리가 없으면 임시 디렉토리)에만 저장합니다.
+    """
+    file_ready = Signal(str, float)  # (파일명, 소요 시간 ms)
+    ready = Signal()                 # 모든 파일 준비 완료
+
+    def __init__(self, audio_manager, filenames):
+        """워밍업 스레드 초기화
+
+        Args:
+            audio_manager (AudioManager): 디코딩한 사운드를 저장할 오디오 매니저
+            filenames (list): 미리 디코딩할 파일명 리스트
+        """
+        super().__init__()
+        self.audio_manager = audio_manager
+        self.filenames = list(filenames)
+        self.timings = {}  # 파일명 -> {"ms": 소요 시간, "source": 로드 경로}
+
+    def run(self):
+        """워밍업 작업 실행"""
+        for filename in self.filenames:
+            if self.isInterruptionRequested():
+                return
+
+            start = time.perf_counter()
+            sound_path = os.path.join(self.audio_manager.audio_dir, filename)
+            long_clip = self.audio_manager.is_long_clip(sound_path)
+            pcm_cache = self.audio_manager.stream_cache if long_clip else self.audio_manager.pcm_cache
+
+            # 번들이나 전처리 결과에 있으면 디코딩이나 캐시 저장 없이 준비 완료
+            # (긴 음성은 번들이나 전처리한 WAV에서 바로 스트리밍)
+            prepared = None
+            if self.audio_manager.bundle_entry(filename) is not None:
+                prepared = "bundle"
+            elif self.audio_manager.derived_audio(filename):
+                prepared = "derived"
+            if prepared:
+                if not long_clip:
+                    self.audio_manager._load_sound(filename)
+                self._finish_file(filename, start, prepared)
+                continue
+            if not os.path.exists(sound_path):
+                continue
+
+            # 긴 음성은 PCM 캐시에만 저장하고 메모리에는 두지 않음 (재생 시 스트리밍)
+            if long_clip and pcm_cache.contains(sound_path):
+                self._finish_file(filename, start, "pcm-cache")
+                continue
+
+            sound = self.audio_manager.sound_cache.get(filename)
+            source = "memory"
+            try:
+                if sound is None and pcm_cache:
+                    sound = pcm_cache.load(sound_path)
+                    source = "pcm-cache"
+                if sound is None:
+                    sound = pygame.mixer.Sound(sound_path)
+                    source = "decoded"
+                if pcm_cache and not pcm_cache.contains(sound_path):
+                    pcm_cache.store(sound_path, sound)
+            except pygame.error as e:
+                print(f"사운드를 미리 불러올 수 없습니다: {filename} ({e})")
+                continue
+
+            if not long_clip and not self.audio_manager.sound_cache.contains(filename):
+                self.audio_manager.sound_cache.put(filename, sound)
+            self._finish_file(filename, start, source)
+
+        self.ready.emit()
+
+    def _finish_file(self, filename, start, source):
+        """파일별 소요 시간을 기록하고 준비 완료 신호 전달"""
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.timings[filename] = {"ms": elapsed_ms, "source": source}
+        self.file_ready.emit(filename, elapsed_ms)
+
+class AudioInit(QThread):
+    """pygame 믹서 초기화와 환경음 시작을 GUI 스레드 밖에서 처리하는 워커 스레드
+
+    오디오 장치를 여는 데 시간이 걸려도 윈도우 표시가 늦어지지 않습니다.
+    """
+    ready = Signal()       # 믹서 준비 및 환경음 시작 완료
+    failed = Signal(str)   # 오디오 장치를 열지 못함 (오류 메시지)
+
+    def __init__(self, audio_manager):
+        """초기화 스레드 생성
+
+        Args:
+            audio_manager (AudioManager): 초기화할 오디오 매니저
+        """
+        super().__init__()
+        self.audio_manager = audio_manager
+        self.elapsed_ms = None  # 믹서 초기화부터 환경음 시작까지 걸린 시간
+
+    def run(self):
+        """믹서 초기화 후 대기 중인 환경음 시작"""
+        start = time.perf_counter()
+        try:
+            self.audio_manager.initialize()
+        except pygame.error as e:
+            print(f"오디오 장치를 초기화할 수 없습니다: {e}")
+            self.failed.emit(str(e))
+            return
+
+        if self.audio_manager.ambient_filename:
+            self.audio_manager.play_ambient_sound(self.audio_manager.ambient_filename)
+        self.elapsed_ms = (time.perf_counter() - start) * 1000
+        self.ready.emit()
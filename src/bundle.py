@@ -0,0 +1,216 @@
+import io
+import os
+import json
+import mmap
+import struct
+import threading
+
+# 번들 파일 이름 (resources 디렉토리 기준)
+BUNDLE_FILENAME = "assets.bundle"
+
+# 헤더: 매직(8) + 버전(u32) + 예약(u32) + 색인 위치(u64) + 색인 길이(u64)
+_MAGIC = b"FCBUNDLE"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ")
+# 각 항목의 시작 위치 정렬 (QImage 스캔라인과 SIMD 읽기에 맞춤)
+_ALIGN = 64
+
+class BundleError(Exception):
+    """번들 파일을 읽을 수 없거나 형식이 잘못된 경우"""
+
+class BundleEntry:
+    """번들 안의 항목 하나 (데이터는 복사하지 않고 mmap을 그대로 가리킴)"""
+
+    __slots__ = ("name", "offset", "length", "meta", "_buffer")
+
+    def __init__(self, name, offset, length, meta, buffer):
+        self.name = name
+        self.offset = offset
+        self.length = length
+        self.meta = meta
+        self._buffer = buffer
+
+    def view(self, start=0, length=None):
+        """항목 데이터(또는 그 일부)의 memoryview (복사 없음)"""
+        if length is None:
+            length = self.length - start
+        return self._buffer[self.offset + start:self.offset + start + length]
+
+    def open(self):
+        """항목 데이터를 읽는 파일 객체 (wave.open 등에 그대로 넘길 수 있음)"""
+        return _MemoryFile(self.view())
+
+class _MemoryFile(io.RawIOBase):
+    """memoryview를 읽기 전용 파일처럼 다루는 객체 (읽은 부분만 복사)"""
+
+    def __init__(self, view):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = min(len(buffer), len(self._view) - self._pos)
+        if count <= 0:
+            return 0
+        buffer[:count] = self._view[self._pos:self._pos + count]
+        self._pos += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+class AssetBundle:
+    """미리 축소한 이미지와 미리 디코딩한 오디오를 하나로 묶은 파일
+
+    파일 전체를 mmap으로 열어 두고 항목을 요청하면 복사 없이 memoryview로 돌려줍니다.
+    키오스크처럼 저장 장치가 느린 환경에서 항목마다 파일을 찾고 여는 비용이 없습니다.
+
+    항목 이름:
+        images/<메뉴 항목>  - 미리 축소한 이미지 (meta: encoding, width, height, ...)
+        audio/<파일명>      - 믹서 형식으로 디코딩한 WAV (meta: rate, channels, ...)
+    """
+
+    def __init__(self, path):
+        """번들 열기
+
+        Args:
+            path (str): 번들 파일 경로
+
+        Raises:
+            BundleError: 파일을 읽을 수 없거나 형식이 잘못된 경우
+        """
+        self.path = path
+        try:
+            with open(path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise BundleError(f"번들을 열 수 없습니다: {os.path.basename(path)} ({e})") from e
+
+        self._buffer = memoryview(self._mmap)
+        try:
+            magic, version, _, index_offset, index_length = _HEADER.unpack_from(self._buffer)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("번들 형식이 아니거나 지원하지 않는 버전입니다")
+            index = json.loads(bytes(self._buffer[index_offset:index_offset + index_length]))
+        except (struct.error, ValueError) as e:
+            self.close()
+            raise BundleError(f"번들을 읽을 수 없습니다: {os.path.basename(path)} ({e})") from e
+
+        self.info = index.get("info", {})
+        self.entries = {
+            name: BundleEntry(name, entry["offset"], entry["length"], entry.get("meta", {}), self._buffer)
+            for name, entry in index["entries"].items()
+        }
+
+    @classmethod
+    def find(cls, resources_dir):
+        """resources 디렉토리에서 번들 파일 경로 찾기 (없으면 None)"""
+        path = os.path.join(resources_dir, BUNDLE_FILENAME)
+        return path if os.path.exists(path) else None
+
+    def entry(self, name):
+        """이름으로 항목 찾기 (없으면 None)"""
+        return self.entries.get(name)
+
+    def image(self, menu_item):
+        """메뉴 항목의 이미지 항목 (없으면 None)"""
+        return self.entries.get(f"images/{menu_item}")
+
+    def audio(self, filename):
+        """오디오 파일명의 항목 (없으면 None)"""
+        return self.entries.get(f"audio/{filename}")
+
+    def close(self):
+        """mmap 닫기 (항목 데이터를 아직 참조 중이면 프로세스가 끝날 때 닫힘)"""
+        try:
+            self._buffer.release()
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+class BundleWriter:
+    """번들 파일 작성기
+
+    항목 데이터를 차례로 쓰고 마지막에 색인을 붙입니다.
+    임시 파일에 쓴 뒤 교체하므로 실행 중인 앱이 쓰다 만 번들을 읽지 않습니다.
+
+    사용 예:
+        with BundleWriter(path, info={"target_size": [700, 500]}) as writer:
+            writer.add("images/비빔밥", data, encoding="raw", width=700, height=500)
+    """
+
+    def __init__(self, path, info=None):
+        self.path = path
+        self.info = info or {}
+        self.entries = {}
+        self._temp_path = f"{path}.{threading.get_ident()}.tmp"
+        self._file = open(self._temp_path, "wb")
+        self._file.write(bytes(_HEADER.size))
+
+    def add(self, name, data, **meta):
+        """항목 추가
+
+        Args:
+            name (str): 항목 이름 (예: images/비빔밥, audio/한식.mp3)
+            data (bytes): 항목 데이터 (bytes 또는 memoryview)
+            **meta: 항목을 해석하는 데 필요한 정보 (JSON으로 저장)
+        """
+        self._pad()
+        offset = self._file.tell()
+        self._file.write(data)
+        self.entries[name] = {"offset": offset, "length": self._file.tell() - offset, "meta": meta}
+
+    def _pad(self):
+        """다음 항목 위치를 정렬 단위에 맞춤"""
+        padding = -self._file.tell() % _ALIGN
+        if padding:
+            self._file.write(bytes(padding))
+
+    def close(self):
+        """색인과 헤더를 쓰고 번들 파일 완성"""
+        self._pad()
+        index_offset = self._file.tell()
+        index = json.dumps({"info": self.info, "entries": self.entries}, ensure_ascii=False).encode("utf-8")
+        self._file.write(index)
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, 0, index_offset, len(index)))
+        self._file.close()
+        os.replace(self._temp_path, self.path)
+
+    def abort(self):
+        """작성 중인 임시 파일 삭제"""
+        self._file.close()
+        try:
+            os.remove(self._temp_path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
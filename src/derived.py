@@ -0,0 +1,100 @@
+import os
+import json
+
+# 전처리 결과 디렉토리 이름 (resources 디렉토리 기준)
+DERIVED_DIRNAME = "derived"
+# 원본별 해시와 파생 파일 목록을 기록한 색인
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+class DerivedError(Exception):
+    """전처리 색인을 읽을 수 없거나 형식이 잘못된 경우"""
+
+class DerivedAssets:
+    """전처리 도구(tools/preprocess.py)가 만든 파생 파일 색인
+
+    메뉴 이미지는 여러 크기(1x, 2x, 썸네일)로 미리 축소되어 있고, 오디오는 믹서 형식의
+    WAV로 변환되어 음량이 맞춰져 있습니다. 원본 파일의 크기나 수정 시각이 색인과 다르면
+    전처리 이후에 원본이 바뀐 것이므로 파생 파일을 쓰지 않습니다.
+    원본 없이 파생 파일만 배포한 경우에는 파생 파일을 그대로 사용합니다.
+
+    색인 형식:
+        images/<메뉴 항목>  - {"source", "size", "mtime_ns", "sha256", "variants": [{"box", "path", ...}]}
+        audio/<파일명>      - {"source", "size", "mtime_ns", "sha256", "path", "duration", "gain_db"}
+    """
+
+    def __init__(self, root, resources_dir=None):
+        """색인 읽기
+
+        Args:
+            root (str): 전처리 결과 디렉토리 경로
+            resources_dir (str): 원본 resources 디렉토리 경로 (기본값: root의 상위 디렉토리)
+
+        Raises:
+            DerivedError: 색인을 읽을 수 없거나 형식이 잘못된 경우
+        """
+        self.root = root
+        self.resources_dir = resources_dir or os.path.dirname(os.path.abspath(root))
+        try:
+            with open(os.path.join(root, MANIFEST_FILENAME), encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != MANIFEST_VERSION:
+                raise ValueError("지원하지 않는 버전입니다")
+        except (OSError, ValueError) as e:
+            raise DerivedError(f"전처리 색인을 읽을 수 없습니다: {root} ({e})") from e
+
+        self.params = manifest.get("params", {})
+        self.images = manifest.get("images", {})
+        self.audio_files = manifest.get("audio", {})
+        self.missing = manifest.get("missing", [])
+
+    @classmethod
+    def find(cls, resources_dir):
+        """resources 디렉토리에서 전처리 결과 디렉토리 찾기 (색인이 없으면 None)"""
+        root = os.path.join(resources_dir, DERIVED_DIRNAME)
+        return root if os.path.exists(os.path.join(root, MANIFEST_FILENAME)) else None
+
+    def _is_fresh(self, record):
+        """전처리 이후 원본이 바뀌지 않았는지 확인 (원본이 없으면 파생 파일만 배포한 것으로 간주)"""
+        try:
+            stat = os.stat(os.path.join(self.resources_dir, record["source"]))
+        except OSError:
+            return True
+        return stat.st_size == record["size"] and stat.st_mtime_ns == record["mtime_ns"]
+
+    def image(self, menu_item, target_size):
+        """목표 크기에 늘리지 않고 맞출 수 있는 가장 작은 미리 축소 이미지 경로
+
+        가로나 세로 한쪽이라도 목표 크기 이상인 크기 중 가장 작은 것을 고르며,
+        원본이 작아 만들 때의 크기보다 작은 이미지는 원본 해상도 그대로이므로 그대로 사용합니다.
+
+        Args:
+            menu_item (str): 메뉴 항목
+            target_size (tuple): 목표 크기 (너비, 높이)
+
+        Returns:
+            str: 이미지 파일 경로. 없거나 원본이 바뀌었거나 모두 늘려야 하면 None
+        """
+        record = self.images.get(menu_item)
+        if record is None or not self._is_fresh(record):
+            return None
+        best = None
+        for variant in record["variants"]:
+            box, width, height = variant["box"], variant["width"], variant["height"]
+            source_limited = width < box[0] and height < box[1]
+            if source_limited or width >= target_size[0] or height >= target_size[1]:
+                if best is None or width * height < best["width"] * best["height"]:
+                    best = variant
+        return os.path.join(self.root, best["path"]) if best else None
+
+    def audio(self, filename):
+        """믹서 형식으로 변환한 WAV 경로 (없거나 원본이 바뀌었으면 None)"""
+        record = self.audio_files.get(filename)
+        if record is None or not self._is_fresh(record):
+            return None
+        return os.path.join(self.root, record["path"])
+
+    def duration(self, filename):
+        """변환한 오디오의 길이(초) (없으면 None)"""
+        record = self.audio_files.get(filename)
+        return record.get("duration") if record else None
@@ -0,0 +1,260 @@
+import os
+import json
+import time
+import bisect
+import threading
+from collections import deque
+
+# 이 환경 변수에 내보낼 파일 경로를 지정하면 측정 시작 (.prom이면 Prometheus 텍스트, 그 외에는 JSON Lines)
+METRICS_ENV = "FOODCOURT_METRICS"
+# 내보내기 간격(초)
+METRICS_INTERVAL_ENV = "FOODCOURT_METRICS_INTERVAL"
+DEFAULT_INTERVAL = 10.0
+# 지연 시간 히스토그램 구간 상한(ms)
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# 내보내기 사이에 보관할 최대 구간 기록 수
+MAX_SPANS = 1000
+
+class Histogram:
+    """구간별 관측 횟수를 세는 지연 시간 히스토그램 (Prometheus 누적 구간과 같은 형식)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """구간 상한으로 근사한 분위수 (관측값이 없으면 None)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], self.counts)),
+        }
+
+class _NullSpan:
+    """측정이 꺼져 있을 때 쓰는 아무 일도 하지 않는 구간 (새 객체를 만들지 않도록 하나만 공유)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    """with 블록의 실행 시간을 히스토그램과 구간 기록에 남김"""
+
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.metrics._record_span(self.name, self.start, end, exc[0] is not None)
+        return False
+
+class Metrics:
+    """카운터, 지연 시간 히스토그램, 구간(span) 기록
+
+    꺼져 있으면 각 호출은 플래그 하나만 확인하고 돌아가므로 핫 패스에 그대로 두어도 됩니다.
+    워커 스레드에서 호출해도 안전합니다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.interval = DEFAULT_INTERVAL
+        self.counters = {}
+        self.histograms = {}
+        self.spans = deque(maxlen=MAX_SPANS)
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._origin_wall = time.time()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def enable(self, path=None, interval=DEFAULT_INTERVAL):
+        """측정 시작 (경로가 있으면 주기적으로 파일에 내보냄)
+
+        Args:
+            path (str): 내보낼 파일 경로 (.prom이면 Prometheus 텍스트, 그 외에는 JSON Lines)
+            interval (float): 내보내기 간격(초)
+        """
+        self.enabled = True
+        self.path = path
+        self.interval = interval
+        if path and not (self._thread and self._thread.is_alive()):
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="MetricsExport", daemon=True)
+            self._thread.start()
+
+    def enable_from_env(self):
+        """환경 변수에 내보낼 경로가 있으면 측정 시작
+
+        Returns:
+            bool: 측정이 켜졌는지 여부
+        """
+        path = os.environ.get(METRICS_ENV)
+        if not path:
+            return False
+        try:
+            interval = float(os.environ.get(METRICS_INTERVAL_ENV, DEFAULT_INTERVAL))
+        except ValueError:
+            interval = DEFAULT_INTERVAL
+        self.enable(path, interval)
+        return True
+
+    def count(self, name, value=1):
+        """카운터 증가"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value_ms):
+        """지연 시간(ms) 관측값 기록"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value_ms)
+
+    def span(self, name):
+        """with 블록의 실행 시간을 기록하는 구간
+
+        사용 예:
+            with metrics.span("image.decode"):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def _record_span(self, name, start, end, failed):
+        duration_ms = (end - start) * 1000
+        self.observe(name, duration_ms)
+        self.spans.append({
+            "type": "span",
+            "name": name,
+            "start": self._origin_wall + (start - self._origin),
+            "ms": duration_ms,
+            "thread": threading.current_thread().name,
+            "error": failed,
+        })
+
+    def snapshot(self):
+        """현재 카운터와 히스토그램
+
+        Returns:
+            dict: {"counters": {...}, "histograms": {이름: 요약}}
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "histograms": {name: h.snapshot() for name, h in self.histograms.items()},
+            }
+
+    def export(self):
+        """설정한 파일로 내보내기 (경로가 없으면 아무 일도 하지 않음)"""
+        if not self.path:
+            return
+        try:
+            if self.path.endswith(".prom"):
+                self._write_prometheus(self.path)
+            else:
+                self._append_jsonl(self.path)
+        except OSError as e:
+            print(f"측정값을 내보낼 수 없습니다: {e}")
+
+    def _append_jsonl(self, path):
+        """내보낼 때마다 요약 한 줄과 그 사이에 끝난 구간 기록을 덧붙임"""
+        spans = []
+        while self.spans:
+            spans.append(self.spans.popleft())
+        lines = [json.dumps(dict(self.snapshot(), type="metrics", ts=time.time()), ensure_ascii=False)]
+        lines.extend(json.dumps(span, ensure_ascii=False) for span in spans)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def _write_prometheus(self, path):
+        """Prometheus 텍스트 형식으로 파일 전체를 교체 (node_exporter textfile 수집기용)"""
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):
+            metric = _prometheus_name(name) + "_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, histogram in sorted(snapshot["histograms"].items()):
+            metric = _prometheus_name(name) + "_ms"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, count in histogram["buckets"].items():
+                cumulative += count
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+            lines += [f"{metric}_sum {histogram['sum']}", f"{metric}_count {histogram['count']}"]
+
+        # 수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, path)
+
+    def _run(self):
+        """내보내기 스레드 본문"""
+        while not self._stop_event.wait(self.interval):
+            self.export()
+
+    def shutdown(self):
+        """내보내기 스레드를 멈추고 마지막 측정값 내보내기"""
+        if not self.enabled:
+            return
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        self.export()
+
+    def reset(self):
+        """모든 측정값 초기화"""
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.spans.clear()
+
+def _prometheus_name(name):
+    """측정 이름을 Prometheus 이름으로 변환 (예: image.decode -> foodcourt_image_decode)"""
+    return "foodcourt_" + "".join(c if c.isalnum() else "_" for c in name)
+
+# 애플리케이션 전체에서 공유하는 측정 객체 (기본값은 꺼짐)
+metrics = Metrics()
@@ -0,0 +1,60 @@
+import time
+
+# 실행부터 조작 가능할 때까지의 목표 시간
+TIME_TO_INTERACTIVE_TARGET_MS = 1500
+
+class StartupTimer:
+    """시작 단계별 소요 시간 측정
+
+    프로세스 시작 직후 만들어 두고 단계가 끝날 때마다 mark()를 호출합니다.
+    각 단계의 시간은 직전 단계가 끝난 시점부터 잽니다.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []  # (단계 이름, 소요 시간 ms, 시작부터 누적 시간 ms)
+        self._last = self.start
+
+    def mark(self, phase):
+        """단계 종료 시점 기록
+
+        Args:
+            phase (str): 단계 이름 (예: "imports", "ui", "audio")
+
+        Returns:
+            float: 단계 소요 시간(ms)
+        """
+        now = time.perf_counter()
+        elapsed_ms = (now - self._last) * 1000
+        self.phases.append((phase, elapsed_ms, (now - self.start) * 1000))
+        self._last = now
+        return elapsed_ms
+
+    def elapsed(self, phase):
+        """시작부터 단계가 끝날 때까지의 시간(ms). 아직 끝나지 않았으면 None"""
+        for name, _, total_ms in self.phases:
+            if name == phase:
+                return total_ms
+        return None
+
+    def timings(self):
+        """단계별 소요 시간 반환
+
+        Returns:
+            dict: 단계 이름 -> {"ms": 소요 시간, "total_ms": 시작부터 누적 시간}
+        """
+        return {name: {"ms": ms, "total_ms": total_ms} for name, ms, total_ms in self.phases}
+
+    def within_target(self, interactive_phase="interactive", target_ms=TIME_TO_INTERACTIVE_TARGET_MS):
+        """조작 가능 시점이 목표 시간 안에 들어왔는지 확인 (아직 기록 전이면 True)"""
+        tti = self.elapsed(interactive_phase)
+        return tti is None or tti <= target_ms
+
+    def report(self, interactive_phase="interactive", target_ms=TIME_TO_INTERACTIVE_TARGET_MS):
+        """단계별 소요 시간 요약 문자열 (조작 가능 시점이 목표를 넘으면 경고 포함)"""
+        lines = [f"  {name:<12} {ms:8.1f} ms  (누적 {total_ms:8.1f} ms)"
+                 for name, ms, total_ms in self.phases]
+        tti = self.elapsed(interactive_phase)
+        if tti is not None and tti > target_ms:
+            lines.append(f"  조작 가능까지 {tti:.0f} ms 걸렸습니다 (목표 {target_ms} ms)")
+        return "시작 단계별 소요 시간:\n" + "\n".join(lines)
@@ -0,0 +1,37 @@
+"""배포 도구가 함께 쓰는 카탈로그와 리소스 파일 목록"""
+import os
+from ui.catalog import Catalog, CatalogError
+
+# 배포 도구가 처리하는 오디오 확장자
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".ogg")
+
+def load_catalog(resources_dir):
+    """resources 디렉토리의 카탈로그 로드 (없거나 읽을 수 없으면 기본 메뉴)"""
+    try:
+        return Catalog.load(Catalog.find(resources_dir))
+    except CatalogError as e:
+        print(f"{e} - 기본 메뉴를 사용합니다")
+        return Catalog.default()
+
+def image_path(resources_dir, menu_item):
+    """메뉴 항목의 원본 이미지 경로"""
+    return os.path.join(resources_dir, "images", f"{menu_item}.jpg")
+
+def audio_filenames(resources_dir):
+    """오디오 디렉토리의 오디오 파일명 목록 (이름순)"""
+    audio_dir = os.path.join(resources_dir, "audio")
+    if not os.path.isdir(audio_dir):
+        return []
+    return sorted(f for f in os.listdir(audio_dir) if f.lower().endswith(AUDIO_EXTENSIONS))
+
+def missing_files(catalog, resources_dir):
+    """카탈로그에 있는데 파일이 없는 메뉴 이미지, 환경음, 카테고리 음성
+
+    Returns:
+        list: 없는 파일 경로 리스트
+    """
+    audio_dir = os.path.join(resources_dir, "audio")
+    expected = [image_path(resources_dir, item) for item in catalog.category_map]
+    expected += [os.path.join(audio_dir, "ambient.mp3")]
+    expected += [os.path.join(audio_dir, f"{category}.mp3") for category in catalog.categories]
+    return [path for path in expected if not os.path.exists(path)]
@@ -0,0 +1,151 @@
+"""배포용 에셋 번들 빌더
+
+카탈로그의 메뉴 이미지를 표시 크기로 미리 축소하고, 환경음과 카테고리 음성을
+믹서 형식의 PCM으로 미리 디코딩하여 resources/assets.bundle 하나로 묶습니다.
+앱은 번들이 있으면 mmap으로 열어 이미지와 오디오를 복사 없이 읽고,
+번들에 없는 항목만 개별 파일에서 읽습니다.
+
+사용 예:
+    python src/tools/build_bundle.py
+    python src/tools/build_bundle.py --image-encoding jpg --quality 90
+"""
+import io
+import os
+import sys
+import time
+import wave
+import argparse
+
+# Qt와 pygame을 불러오기 전에 화면/오디오 장치 없이 동작하도록 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from PySide6.QtCore import QBuffer, QIODevice
+from PySide6.QtGui import QGuiApplication, QImage
+from bundle import BundleWriter, BUNDLE_FILENAME
+from ui.image_loader import decode_image, TARGET_SIZE
+from audio.audio_manager import MIXER_FORMAT
+from tools.assets import load_catalog, image_path, audio_filenames, missing_files
+
+def pack_image(image_path, target_size, encoding="raw", quality=90):
+    """이미지를 목표 크기로 축소하여 번들 항목 데이터로 변환
+
+    Args:
+        image_path (str): 원본 이미지 경로
+        target_size (tuple): 목표 크기 (너비, 높이)
+        encoding (str): "raw"(원시 픽셀, 앱에서 복사/디코딩 없이 사용) 또는 "jpg"(작은 파일)
+        quality (int): JPEG 품질
+
+    Returns:
+        tuple: (데이터, 메타데이터)
+    """
+    image = decode_image(image_path, target_size)
+    meta = {"encoding": encoding, "width": image.width(), "height": image.height(),
+            "target_size": list(target_size)}
+    if encoding == "raw":
+        image_format = (QImage.Format.Format_ARGB32_Premultiplied if image.hasAlphaChannel()
+                        else QImage.Format.Format_RGB32)
+        image = image.convertToFormat(image_format)
+        meta.update(bytes_per_line=image.bytesPerLine(), format=image_format.name)
+        return bytes(image.constBits()), meta
+
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    if not image.save(buffer, "JPG", quality):
+        raise ValueError("이미지를 압축할 수 없습니다")
+    return bytes(buffer.data()), meta
+
+def pack_audio(sound_path):
+    """오디오를 믹서 형식의 PCM WAV로 디코딩하여 번들 항목 데이터로 변환
+
+    Returns:
+        tuple: (WAV 데이터, 메타데이터)
+    """
+    raw = pygame.mixer.Sound(sound_path).get_raw()
+    rate, size, channels = pygame.mixer.get_init()
+    sample_width = abs(size) // 8
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(rate)
+        wav.writeframes(raw)
+    data = buffer.getvalue()
+    frames = len(raw) // (channels * sample_width)
+    return data, {"rate": rate, "channels": channels, "sample_width": sample_width,
+                  "duration": frames / rate, "pcm_offset": len(data) - len(raw)}
+
+def build(resources_dir, output_path, target_size=TARGET_SIZE, encoding="raw", quality=90):
+    """번들 생성
+
+    Returns:
+        dict: 항목 수, 누락된 파일, 번들 크기 등 요약
+    """
+    audio_dir = os.path.join(resources_dir, "audio")
+    catalog = load_catalog(resources_dir)
+    missing = missing_files(catalog, resources_dir)
+
+    counts = {"images": 0, "audio": 0}
+    info = {"built": time.strftime("%Y-%m-%dT%H:%M:%S"), "target_size": list(target_size),
+            "image_encoding": encoding}
+    with BundleWriter(output_path, info=info) as writer:
+        for item in catalog.category_map:
+            source_path = image_path(resources_dir, item)
+            if not os.path.exists(source_path):
+                continue
+            try:
+                data, meta = pack_image(source_path, target_size, encoding, quality)
+            except ValueError as e:
+                print(f"이미지를 번들에 넣을 수 없습니다: {item} ({e})")
+                continue
+            writer.add(f"images/{item}", data, **meta)
+            counts["images"] += 1
+
+        for filename in audio_filenames(resources_dir):
+            try:
+                data, meta = pack_audio(os.path.join(audio_dir, filename))
+            except pygame.error as e:
+                print(f"오디오를 번들에 넣을 수 없습니다: {filename} ({e})")
+                continue
+            writer.add(f"audio/{filename}", data, **meta)
+            counts["audio"] += 1
+
+    return dict(counts, missing=missing, bytes=os.path.getsize(output_path))
+
+def main(argv=None):
+    default_resources = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), "resources")
+    parser = argparse.ArgumentParser(description="배포용 에셋 번들 빌더")
+    parser.add_argument("--resources", default=default_resources, help="resources 디렉토리 경로")
+    parser.add_argument("--output", help=f"번들 파일 경로 (기본값: <resources>/{BUNDLE_FILENAME})")
+    parser.add_argument("--size", default=f"{TARGET_SIZE[0]}x{TARGET_SIZE[1]}",
+                        help="이미지 목표 크기 (예: 700x500)")
+    parser.add_argument("--image-encoding", choices=["raw", "jpg"], default="raw",
+                        help="raw: 앱에서 복사/디코딩 없이 사용 (큰 파일), jpg: 작은 파일")
+    parser.add_argument("--quality", type=int, default=90, help="JPEG 품질")
+    args = parser.parse_args(argv)
+
+    width, _, height = args.size.partition("x")
+    target_size = (int(width), int(height))
+    output_path = args.output or os.path.join(args.resources, BUNDLE_FILENAME)
+
+    app = QGuiApplication.instance() or QGuiApplication([sys.argv[0]])
+    frequency, size, channels = MIXER_FORMAT
+    pygame.mixer.init(frequency=frequency, size=size, channels=channels)
+
+    start = time.perf_counter()
+    summary = build(args.resources, output_path, target_size, args.image_encoding, args.quality)
+    pygame.mixer.quit()
+
+    print(f"{output_path}: 이미지 {summary['images']}개, 오디오 {summary['audio']}개, "
+          f"{summary['bytes'] / (1024 * 1024):.1f} MB ({time.perf_counter() - start:.1f}초)")
+    for path in summary["missing"]:
+        print(f"파일 없음: {path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
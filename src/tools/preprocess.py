@@ -0,0 +1,350 @@
+"""배포용 에셋 전처리 도구
+
+카탈로그를 따라 메뉴 이미지를 표시 크기와 썸네일 크기로 배율별(1x, 2x) 미리 축소하고,
+오디오를 믹서 형식의 WAV로 변환하면서 음량을 맞춰 resources/derived에 저장합니다.
+모든 코어를 쓰는 프로세스 풀에서 처리하며, 원본 내용의 해시를 manifest.json에 기록해 두고
+다시 실행하면 바뀐 원본만 처리합니다. 카탈로그에 있는데 파일이 없는 항목도 알려 줍니다.
+
+사용 예:
+    python src/tools/preprocess.py
+    python src/tools/preprocess.py --scales 1,2,3 --thumbnail 200x150 --jobs 4
+    python src/tools/preprocess.py --strict  # 없는 파일이나 실패한 파일이 있으면 종료 코드 1
+"""
+import os
+import sys
+import json
+import math
+import time
+import wave
+import array
+import hashlib
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Qt와 pygame을 불러오기 전에 화면/오디오 장치 없이 동작하도록 설정 (워커 프로세스에도 전달됨)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from PySide6.QtCore import Qt, QSize
+from derived import DERIVED_DIRNAME, MANIFEST_FILENAME, MANIFEST_VERSION
+from ui.image_loader import decode_image, TARGET_SIZE
+from audio.audio_manager import MIXER_FORMAT
+from tools.assets import load_catalog, image_path, audio_filenames, missing_files
+
+# 썸네일 크기 (1x 기준)
+THUMBNAIL_SIZE = (160, 120)
+# 만들 배율 (1x: 일반 화면, 2x: HiDPI 화면)
+DEFAULT_SCALES = (1, 2)
+# 오디오 음량 목표(RMS, dBFS)와 음량을 올릴 때 넘지 않을 피크(dBFS)
+DEFAULT_LOUDNESS_DB = -20.0
+PEAK_CEILING_DB = -1.0
+# 16비트 샘플 최댓값
+_FULL_SCALE = 32767
+
+def file_hash(path):
+    """파일 내용의 SHA-256 해시"""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+def _init_worker():
+    """워커 프로세스 초기화 (오디오를 앱과 같은 믹서 형식으로 디코딩)"""
+    frequency, size, channels = MIXER_FORMAT
+    pygame.mixer.init(frequency=frequency, size=size, channels=channels)
+
+def process_image(source_path, known_hash, outputs, quality):
+    """원본 이미지 하나를 여러 크기로 축소하여 저장 (워커 프로세스에서 실행)
+
+    원본은 가장 큰 크기로 한 번만 디코딩하고, 작은 크기는 바로 위 크기에서 축소합니다.
+
+    Args:
+        source_path (str): 원본 이미지 경로
+        known_hash (str): 이전 실행에서 기록한 원본 해시 (없으면 None)
+        outputs (list): (크기 상자, 저장 경로) 리스트
+        quality (int): JPEG 품질
+
+    Returns:
+        dict: 원본 해시와 크기별 결과 (내용이 그대로라 다시 만들지 않았으면 "unchanged"가 True)
+
+    Raises:
+        ValueError: 이미지를 디코딩하거나 저장할 수 없는 경우
+    """
+    sha256 = file_hash(source_path)
+    if sha256 == known_hash and all(os.path.exists(path) for _, path in outputs):
+        return {"sha256": sha256, "unchanged": True}
+
+    outputs = sorted(outputs, key=lambda output: output[0][0] * output[0][1], reverse=True)
+    image = decode_image(source_path, outputs[0][0])
+    variants = []
+    for box, path in outputs:
+        if image.width() > box[0] or image.height() > box[1]:
+            image = image.scaled(QSize(*box),
+                                 Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        # 임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 쓰다 만 파일이 남지 않게 함
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        if not image.save(temp_path, "JPG", quality):
+            raise ValueError(f"이미지를 저장할 수 없습니다: {os.path.basename(path)}")
+        os.replace(temp_path, path)
+        variants.append({"box": list(box), "path": path, "width": image.width(), "height": image.height()})
+    return {"sha256": sha256, "variants": variants}
+
+def process_audio(source_path, known_hash, output_path, loudness_db):
+    """오디오 하나를 믹서 형식의 WAV로 변환하고 음량 맞추기 (워커 프로세스에서 실행)
+
+    RMS 음량을 목표에 맞추되 피크가 기준을 넘지 않도록 증폭을 제한합니다.
+
+    Args:
+        source_path (str): 원본 오디오 경로
+        known_hash (str): 이전 실행에서 기록한 원본 해시 (없으면 None)
+        output_path (str): 저장할 WAV 경로
+        loudness_db (float): 목표 RMS 음량(dBFS). None이면 음량을 바꾸지 않음
+
+    Returns:
+        dict: 원본 해시, 길이(초), 적용한 증폭(dB) (내용이 그대로라 다시 만들지 않았으면 "unchanged"가 True)
+
+    Raises:
+        pygame.error: 오디오를 디코딩할 수 없는 경우
+    """
+    sha256 = file_hash(source_path)
+    if sha256 == known_hash and os.path.exists(output_path):
+        return {"sha256": sha256, "unchanged": True}
+
+    raw = pygame.mixer.Sound(source_path).get_raw()
+    rate, size, channels = pygame.mixer.get_init()
+    sample_width = abs(size) // 8
+
+    gain = 1.0
+    if loudness_db is not None and size == -16 and raw:
+        samples = array.array("h")
+        samples.frombytes(raw)
+        peak = max(max(samples), -min(samples))
+        rms = math.sqrt(sum(sample * sample for sample in samples) / len(samples))
+        if rms > 0:
+            gain = min(10 ** (loudness_db / 20) * _FULL_SCALE / rms,
+                       10 ** (PEAK_CEILING_DB / 20) * _FULL_SCALE / peak)
+        # 피크로 증폭을 제한했으므로 샘플 범위를 넘지 않음
+        if abs(gain - 1.0) > 0.01:
+            raw = array.array("h", [int(sample * gain) for sample in samples]).tobytes()
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    with wave.open(temp_path, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(rate)
+        wav.writeframes(raw)
+    os.replace(temp_path, output_path)
+    return {"sha256": sha256, "duration": len(raw) / (channels * sample_width * rate),
+            "gain_db": round(20 * math.log10(gain), 2)}
+
+def _relpath(path, start):
+    """색인에 기록할 상대 경로 (운영체제와 상관없이 / 구분자)"""
+    return os.path.relpath(path, start).replace(os.sep, "/")
+
+def _load_manifest(output_dir):
+    """이전 실행의 색인 (없거나 읽을 수 없으면 빈 색인)"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILENAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+def _is_unchanged(old, record, paths):
+    """원본의 크기와 수정 시각이 이전 실행과 같고 파생 파일이 모두 있는지 확인 (해시 계산 생략)"""
+    return (old is not None and old["size"] == record["size"] and old["mtime_ns"] == record["mtime_ns"]
+            and all(os.path.exists(path) for path in paths))
+
+def _remove_unreferenced(output_dir, referenced):
+    """색인에 없는 파생 파일과 빈 디렉토리 삭제 (카탈로그에서 빠진 항목, 이전 크기 등)
+
+    Returns:
+        int: 삭제한 파일 수
+    """
+    removed = 0
+    for subdir in ("images", "audio"):
+        for dirpath, _, filenames in os.walk(os.path.join(output_dir, subdir), topdown=False):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if path not in referenced:
+                    try:
+                        os.remove(path)
+                        removed += 1
+                    except OSError:
+                        pass
+            try:
+                os.rmdir(dirpath)  # 비어 있을 때만 삭제됨
+            except OSError:
+                pass
+    return removed
+
+def preprocess(resources_dir, output_dir=None, target_size=TARGET_SIZE, thumbnail_size=THUMBNAIL_SIZE,
+               scales=DEFAULT_SCALES, quality=90, loudness_db=DEFAULT_LOUDNESS_DB, jobs=None):
+    """카탈로그의 이미지와 오디오를 전처리하고 색인 저장
+
+    원본의 크기와 수정 시각이 이전 실행과 같으면 해시도 계산하지 않고 건너뛰고,
+    다르면 워커에서 해시를 계산하여 내용이 바뀐 경우에만 다시 만듭니다.
+    설정(크기, 품질, 음량)이 바뀌면 해당 종류는 모두 다시 만듭니다.
+
+    Args:
+        resources_dir (str): resources 디렉토리 경로
+        output_dir (str): 결과 디렉토리 경로 (기본값: <resources>/derived)
+        target_size (tuple): 표시 크기 (너비, 높이)
+        thumbnail_size (tuple): 썸네일 크기 (너비, 높이)
+        scales (tuple): 만들 배율
+        quality (int): JPEG 품질
+        loudness_db (float): 목표 RMS 음량(dBFS). None이면 음량을 바꾸지 않음
+        jobs (int): 워커 프로세스 수 (기본값: CPU 코어 수)
+
+    Returns:
+        dict: 처리/변경 없음/실패/삭제 개수, 누락된 파일 등 요약
+    """
+    output_dir = output_dir or os.path.join(resources_dir, DERIVED_DIRNAME)
+    catalog = load_catalog(resources_dir)
+    boxes = sorted({(size[0] * scale, size[1] * scale)
+                    for size in (target_size, thumbnail_size) for scale in scales}, reverse=True)
+    params = {
+        "images": {"boxes": [list(box) for box in boxes], "quality": quality},
+        "audio": {"mixer": list(MIXER_FORMAT), "loudness_db": loudness_db, "peak_db": PEAK_CEILING_DB},
+    }
+    previous = _load_manifest(output_dir)
+    manifest = {"version": MANIFEST_VERSION, "built": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "params": params, "images": {}, "audio": {}}
+    summary = {"processed": 0, "unchanged": 0, "failed": 0}
+
+    # 설정이 바뀐 종류는 이전 기록을 쓰지 않음
+    old_records = {kind: previous.get(kind, {}) if previous.get("params", {}).get(kind) == params[kind] else {}
+                   for kind in ("images", "audio")}
+
+    pending = []  # (종류, 키, 기록, 이전 기록, 작업 함수, 인자)
+    for item in catalog.category_map:
+        source_path = image_path(resources_dir, item)
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            continue  # 아래에서 누락된 파일로 보고
+        record = {"source": _relpath(source_path, resources_dir), "size": stat.st_size,
+                  "mtime_ns": stat.st_mtime_ns}
+        outputs = [(box, os.path.join(output_dir, "images", f"{box[0]}x{box[1]}", f"{item}.jpg"))
+                   for box in boxes]
+        old = old_records["images"].get(item)
+        if _is_unchanged(old, record, [path for _, path in outputs]):
+            manifest["images"][item] = old
+            summary["unchanged"] += 1
+            continue
+        pending.append(("images", item, record, old, process_image,
+                        (source_path, old and old["sha256"], outputs, quality)))
+
+    for filename in audio_filenames(resources_dir):
+        source_path = os.path.join(resources_dir, "audio", filename)
+        stat = os.stat(source_path)
+        record = {"source": _relpath(source_path, resources_dir), "size": stat.st_size,
+                  "mtime_ns": stat.st_mtime_ns}
+        output_path = os.path.join(output_dir, "audio", f"{filename}.wav")
+        old = old_records["audio"].get(filename)
+        if _is_unchanged(old, record, [output_path]):
+            manifest["audio"][filename] = old
+            summary["unchanged"] += 1
+            continue
+        pending.append(("audio", filename, record, old, process_audio,
+                        (source_path, old and old["sha256"], output_path, loudness_db)))
+
+    # 바뀐 원본이 없으면 워커를 띄우지 않음
+    if pending:
+        # Qt와 SDL은 fork에 안전하지 않으므로 모든 운영체제에서 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), mp_context=context,
+                                 initializer=_init_worker) as pool:
+            futures = {pool.submit(func, *args): (kind, key, record, old)
+                       for kind, key, record, old, func, args in pending}
+            for future in as_completed(futures):
+                kind, key, record, old = futures[future]
+                try:
+                    result = future.result()
+                except (OSError, ValueError, wave.Error, pygame.error) as e:
+                    print(f"전처리할 수 없습니다: {record['source']} ({e})")
+                    summary["failed"] += 1
+                    continue
+
+                if result.get("unchanged"):
+                    # 수정 시각만 바뀌고 내용은 그대로인 경우
+                    manifest[kind][key] = dict(old, size=record["size"], mtime_ns=record["mtime_ns"])
+                    summary["unchanged"] += 1
+                    continue
+                record["sha256"] = result["sha256"]
+                if kind == "images":
+                    record["variants"] = [dict(variant, path=_relpath(variant["path"], output_dir))
+                                          for variant in result["variants"]]
+                else:
+                    output_path = os.path.join(output_dir, "audio", f"{key}.wav")
+                    record.update(path=_relpath(output_path, output_dir), duration=result["duration"],
+                                  gain_db=result["gain_db"])
+                manifest[kind][key] = record
+                summary["processed"] += 1
+
+    missing = missing_files(catalog, resources_dir)
+    manifest["missing"] = [_relpath(path, resources_dir) for path in missing]
+
+    referenced = {os.path.join(output_dir, *variant["path"].split("/"))
+                  for record in manifest["images"].values() for variant in record["variants"]}
+    referenced |= {os.path.join(output_dir, *record["path"].split("/"))
+                   for record in manifest["audio"].values()}
+    summary["removed"] = _remove_unreferenced(output_dir, referenced)
+
+    # 앱이 쓰다 만 색인을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(temp_path, manifest_path)
+
+    return dict(summary, missing=missing, images=len(manifest["images"]), audio=len(manifest["audio"]))
+
+def _parse_size(text):
+    """'700x500' 형식의 크기 해석"""
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+def main(argv=None):
+    default_resources = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), "resources")
+    parser = argparse.ArgumentParser(description="배포용 에셋 전처리 도구")
+    parser.add_argument("--resources", default=default_resources, help="resources 디렉토리 경로")
+    parser.add_argument("--output", help=f"결과 디렉토리 경로 (기본값: <resources>/{DERIVED_DIRNAME})")
+    parser.add_argument("--size", type=_parse_size, default=TARGET_SIZE,
+                        help="이미지 표시 크기 (예: 700x500)")
+    parser.add_argument("--thumbnail", type=_parse_size, default=THUMBNAIL_SIZE,
+                        help="썸네일 크기 (예: 160x120)")
+    parser.add_argument("--scales", default=",".join(str(scale) for scale in DEFAULT_SCALES),
+                        help="만들 배율 목록 (예: 1,2)")
+    parser.add_argument("--quality", type=int, default=90, help="JPEG 품질")
+    parser.add_argument("--loudness", type=float, default=DEFAULT_LOUDNESS_DB,
+                        help="오디오 목표 RMS 음량(dBFS)")
+    parser.add_argument("--no-normalize", action="store_true", help="오디오 음량을 바꾸지 않음")
+    parser.add_argument("--jobs", type=int, help="워커 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--strict", action="store_true",
+                        help="없는 파일이나 처리하지 못한 파일이 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    summary = preprocess(args.resources, args.output, args.size, args.thumbnail,
+                         tuple(int(scale) for scale in args.scales.split(",")), args.quality,
+                         None if args.no_normalize else args.loudness, args.jobs)
+
+    print(f"이미지 {summary['images']}개, 오디오 {summary['audio']}개: "
+          f"처리 {summary['processed']}, 변경 없음 {summary['unchanged']}, 실패 {summary['failed']}, "
+          f"삭제 {summary['removed']} ({time.perf_counter() - start:.1f}초)")
+    for path in summary["missing"]:
+        print(f"파일 없음: {path}")
+    if args.strict and (summary["missing"] or summary["failed"]):
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import os
+import json
+import sqlite3
+from typing import Dict, List, Optional
+
+# 카탈로그 파일이 없을 때 사용할 기본 메뉴
+DEFAULT_CATEGORIES = {
+    "한식": ["비빔밥", "김치찌개", "된장찌개", "불고기"],
+    "중식": ["짜장면", "짬뽕", "탕수육", "마파두부"],
+    "분식": ["떡볶이", "순대", "튀김", "라면"],
+    "일식": ["초밥", "라멘", "돈까스", "우동"],
+    "양식": ["파스타", "스테이크", "피자", "샐러드"],
+}
+
+# 카탈로그 파일 후보 (resources 디렉토리 기준)
+CATALOG_FILENAMES = ["catalog.json", "catalog.db", "catalog.sqlite"]
+
+class CatalogError(Exception):
+    """카탈로그 파일을 읽을 수 없거나 형식이 잘못된 경우"""
+
+class Catalog:
+    """메뉴 카탈로그 (카테고리별 메뉴 항목과 가격)
+
+    JSON 형식:
+        {"categories": [{"name": "한식", "items": ["비빔밥", {"name": "불고기", "price": 12000}]}]}
+        또는 {"한식": ["비빔밥", "불고기"], ...}
+
+    SQLite 형식:
+        CREATE TABLE items (category TEXT, name TEXT, price INTEGER, position INTEGER)
+        (카테고리 순서는 각 카테고리가 처음 나타나는 순서)
+    """
+
+    def __init__(self, categories: Dict[str, List[str]],
+                 prices: Optional[Dict[str, int]] = None, source_path: Optional[str] = None):
+        """카탈로그 초기화
+
+        Args:
+            categories: 카테고리 이름 -> 메뉴 항목 리스트 (순서 유지)
+            prices: 메뉴 항목 -> 가격 (선택)
+            source_path: 카탈로그를 읽어 온 파일 경로 (기본 메뉴이면 None)
+        """
+        self.categories = categories
+        self.prices = prices or {}
+        self.source_path = source_path
+        self.category_map = self._build_index()
+
+    def _build_index(self) -> Dict[str, str]:
+        """메뉴 항목에서 카테고리로의 색인 생성 (중복 항목은 처음 나온 카테고리 사용)"""
+        index = {}
+        for category, items in self.categories.items():
+            for item in items:
+                index.setdefault(item, category)
+        return index
+
+    @classmethod
+    def default(cls) -> "Catalog":
+        """기본 메뉴 카탈로그"""
+        return cls({category: list(items) for category, items in DEFAULT_CATEGORIES.items()})
+
+    @classmethod
+    def find(cls, resources_dir: str) -> Optional[str]:
+        """resources 디렉토리에서 카탈로그 파일 경로 찾기
+
+        Returns:
+            str: 카탈로그 파일 경로. 없으면 None
+        """
+        for filename in CATALOG_FILENAMES:
+            path = os.path.join(resources_dir, filename)
+            if os.path.exists(path):
+                return path
+        return None
+
+    @classmethod
+    def load(cls, path: Optional[str]) -> "Catalog":
+        """파일에서 카탈로그 로드 (경로가 없으면 기본 메뉴)
+
+        Args:
+            path: JSON 또는 SQLite 카탈로그 파일 경로
+
+        Returns:
+            Catalog: 로드된 카탈로그
+
+        Raises:
+            CatalogError: 파일을 읽을 수 없거나 형식이 잘못된 경우
+        """
+        if not path:
+            return cls.default()
+        try:
+            if path.lower().endswith(".json"):
+                categories, prices = cls._read_json(path)
+            else:
+                categories, prices = cls._read_sqlite(path)
+        except (OSError, ValueError, KeyError, TypeError, sqlite3.Error) as e:
+            raise CatalogError(f"카탈로그를 읽을 수 없습니다: {os.path.basename(path)} ({e})") from e
+        return cls(categories, prices, path)
+
+    @staticmethod
+    def _read_json(path):
+        """JSON 카탈로그 읽기"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        if isinstance(data, dict) and "categories" in data:
+            entries = [(entry["name"], entry["items"]) for entry in data["categories"]]
+        elif isinstance(data, dict):
+            entries = list(data.items())
+        else:
+            raise ValueError("최상위 값은 객체여야 합니다")
+
+        categories, prices = {}, {}
+        for category, items in entries:
+            names = categories.setdefault(str(category), [])
+            for item in items:
+                if isinstance(item, dict):
+                    name = str(item["name"])
+                    if item.get("price") is not None:
+                        prices[name] = int(item["price"])
+                else:
+                    name = str(item)
+                names.append(name)
+        return categories, prices
+
+    @staticmethod
+    def _read_sqlite(path):
+        """SQLite 카탈로그 읽기"""
+        categories, prices = {}, {}
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = connection.execute(
+                "SELECT category, name, price FROM items ORDER BY position, rowid")
+            for category, name, price in rows:
+                categories.setdefault(category, []).append(name)
+                if price is not None:
+                    prices[name] = int(price)
+        finally:
+            connection.close()
+        return categories, prices
+
+    def items(self, category: str) -> List[str]:
+        """카테고리의 메뉴 항목 리스트"""
+        return self.categories.get(category, [])
+
+    def label(self, item: str) -> str:
+        """메뉴에 표시할 항목 텍스트 (가격이 있으면 함께 표시)"""
+        price = self.prices.get(item)
+        return f"{item}\t{price:,}원" if price is not None else item
+
+    def __len__(self):
+        return len(self.category_map)
+
+class CatalogDiff:
+    """두 카탈로그의 차이"""
+
+    def __init__(self, old: Catalog, new: Catalog):
+        """두 카탈로그 비교
+
+        Args:
+            old: 이전 카탈로그
+            new: 새 카탈로그
+        """
+        old_categories, new_categories = old.categories, new.categories
+        self.added_categories = [c for c in new_categories if c not in old_categories]
+        self.removed_categories = [c for c in old_categories if c not in new_categories]
+        # 항목 구성이나 순서, 가격이 바뀐 카테고리
+        self.changed_categories = [
+            c for c in new_categories
+            if c in old_categories and (
+                old_categories[c] != new_categories[c]
+                or any(old.prices.get(item) != new.prices.get(item) for item in new_categories[c]))
+        ]
+        self.order_changed = ([c for c in new_categories if c in old_categories]
+                              != [c for c in old_categories if c in new_categories])
+
+        # 카테고리별로 추가/삭제된 항목 (메뉴에서 해당 QAction만 추가/삭제하는 데 사용)
+        self.category_added_items = {}
+        self.category_removed_items = {}
+        for c in self.changed_categories:
+            old_items, new_items = set(old_categories[c]), set(new_categories[c])
+            added = [item for item in new_categories[c] if item not in old_items]
+            removed = [item for item in old_categories[c] if item not in new_items]
+            if added:
+                self.category_added_items[c] = added
+            if removed:
+                self.category_removed_items[c] = removed
+
+        old_index, new_index = old.category_map, new.category_map
+        self.added_items = [item for item in new_index if item not in old_index]
+        self.removed_items = [item for item in old_index if item not in new_index]
+        # 다른 카테고리로 옮겨진 항목
+        self.moved_items = [item for item in new_index
+                            if item in old_index and old_index[item] != new_index[item]]
+        # 가격이 바뀐 항목 (메뉴에서 해당 QAction의 텍스트만 갱신)
+        self.repriced_items = [item for item in new_index
+                               if item in old_index and old.prices.get(item) != new.prices.get(item)]
+
+    def is_empty(self) -> bool:
+        """바뀐 것이 없는지 확인"""
+        return not (self.added_categories or self.removed_categories
+                    or self.changed_categories or self.order_changed)
+
+    def __repr__(self):
+        return (f"CatalogDiff(+카테고리 {len(self.added_categories)}, "
+                f"-카테고리 {len(self.removed_categories)}, "
+                f"~카테고리 {len(self.changed_categories)}, "
+                f"+항목 {len(self.added_items)}, -항목 {len(self.removed_items)}, "
+                f"이동 {len(self.moved_items)}, 가격 {len(self.repriced_items)})")
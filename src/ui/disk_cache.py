@@ -0,0 +1,202 @@
+import os
+import hashlib
+import threading
+from PySide6.QtGui import QImage
+
+# 디스크 캐시 기본 최대 크기
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CACHE_FORMAT = "jpg"
+CACHE_QUALITY = 92
+
+class DiskImageCache:
+    """미리 축소한 이미지를 디스크에 저장하는 캐시
+
+    캐시 파일 이름은 '<경로 키>-<버전 키>.jpg' 형식입니다.
+    경로 키는 원본 경로와 목표 크기로, 버전 키는 원본 파일의 크기와 수정 시각으로
+    만들어지므로 원본이 바뀌면 이전 항목은 자동으로 무효화됩니다.
+    시작할 때 한 번만 디렉토리를 읽어 경로 키별 캐시 파일 색인을 만들어 두므로,
+    캐시에 없는 항목을 조회하거나 이전 버전을 정리할 때 디렉토리 전체를 다시 읽지 않습니다.
+    여러 워커 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        """디스크 캐시 초기화
+
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 디렉토리 경로
+            max_bytes (int): 캐시 디렉토리의 최대 크기(바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self.current_bytes = 0
+        self._lock = threading.Lock()
+        self._index = {}  # 경로 키 -> {캐시 파일 경로: 크기}
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for path, size, _ in self._scan():
+                self._index_add(path, size)
+        except OSError as e:
+            print(f"이미지 캐시 디렉토리를 사용할 수 없습니다: {e}")
+            self.enabled = False
+
+    def _path_key(self, source_path, target_size):
+        """원본 경로와 목표 크기로 만든 키"""
+        raw = f"{os.path.abspath(source_path)}|{target_size[0]}x{target_size[1]}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+
+    def _entry_path(self, source_path, target_size, stat):
+        """원본 파일 상태까지 반영한 캐시 파일 경로"""
+        version = hashlib.sha1(f"{stat.st_size}|{stat.st_mtime_ns}".encode()).hexdigest()[:12]
+        filename = f"{self._path_key(source_path, target_size)}-{version}.{CACHE_FORMAT}"
+        return os.path.join(self.cache_dir, filename)
+
+    def load(self, source_path, target_size):
+        """캐시된 축소 이미지를 로드
+
+        Args:
+            source_path (str): 원본 이미지 경로
+            target_size (tuple): 목표 크기 (너비, 높이)
+
+        Returns:
+            QImage: 캐시된 이미지. 없거나 손상되었거나 오래된 경우 None
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+
+        entry_path = self._entry_path(source_path, target_size, stat)
+        if not os.path.exists(entry_path):
+            # 원본이 바뀌어 남아 있는 이전 버전 정리
+            self._remove_stale(source_path, target_size, keep=None)
+            return None
+
+        image = QImage(entry_path)
+        if image.isNull() or image.width() > target_size[0] or image.height() > target_size[1]:
+            print(f"손상된 이미지 캐시 항목을 삭제합니다: {os.path.basename(entry_path)}")
+            self._remove_file(entry_path)
+            return None
+
+        # 최근 사용 시각 갱신 (용량 초과 시 오래된 항목부터 삭제)
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return image
+
+    def store(self, source_path, target_size, image):
+        """축소한 이미지를 캐시에 저장
+
+        Args:
+            source_path (str): 원본 이미지 경로
+            target_size (tuple): 목표 크기 (너비, 높이)
+            image (QImage): 저장할 축소 이미지
+        """
+        if not self.enabled or image.isNull():
+            return
+
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return
+
+        entry_path = self._entry_path(source_path, target_size, stat)
+        self._remove_stale(source_path, target_size, keep=entry_path)
+
+        # 임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 손상된 항목이 남지 않게 함
+        temp_path = f"{entry_path}.{threading.get_ident()}.tmp"
+        if not image.save(temp_path, CACHE_FORMAT.upper(), CACHE_QUALITY):
+            self._remove_file(temp_path)
+            return
+
+        try:
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            self._remove_file(temp_path)
+            return
+
+        self._index_add(entry_path, size)
+        self._enforce_limit()
+
+    def invalidate(self, source_path, target_size):
+        """원본 이미지의 캐시 항목을 모두 삭제"""
+        if self.enabled:
+            self._remove_stale(source_path, target_size, keep=None)
+
+    def clear(self):
+        """캐시 디렉토리의 모든 항목 삭제"""
+        if not self.enabled:
+            return
+        for path, _, _ in self._scan():
+            self._remove_file(path)
+
+    def _scan(self):
+        """캐시 파일 목록 반환
+
+        Returns:
+            list: (경로, 크기, 최근 사용 시각) 튜플 리스트
+        """
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(f".{CACHE_FORMAT}"):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    @staticmethod
+    def _index_key(path):
+        """캐시 파일 경로의 경로 키 ('<경로 키>-<버전 키>.jpg')"""
+        return os.path.basename(path).split("-", 1)[0]
+
+    def _index_add(self, path, size):
+        """캐시 파일을 색인에 추가하고 사용량 갱신 (같은 파일을 덮어쓴 경우 이전 크기를 뺌)"""
+        with self._lock:
+            paths = self._index.setdefault(self._index_key(path), {})
+            self.current_bytes += size - paths.get(path, 0)
+            paths[path] = size
+
+    def _remove_stale(self, source_path, target_size, keep):
+        """같은 원본의 다른 버전 캐시 파일 삭제 (디렉토리를 읽지 않고 색인에서 찾음)"""
+        key = self._path_key(source_path, target_size)
+        with self._lock:
+            stale = [path for path in self._index.get(key, ()) if path != keep]
+        for path in stale:
+            self._remove_file(path)
+
+    def _remove_file(self, path):
+        """캐시 파일을 삭제하고 사용량 갱신"""
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        if path.endswith(f".{CACHE_FORMAT}"):
+            with self._lock:
+                self.current_bytes = max(0, self.current_bytes - size)
+                paths = self._index.get(self._index_key(path))
+                if paths is not None:
+                    paths.pop(path, None)
+                    if not paths:
+                        del self._index[self._index_key(path)]
+
+    def _enforce_limit(self):
+        """최대 크기를 넘으면 오래 사용되지 않은 항목부터 삭제"""
+        if self.current_bytes <= self.max_bytes:
+            return
+        try:
+            entries = sorted(self._scan(), key=lambda entry: entry[2])
+        except OSError:
+            return
+        with self._lock:
+            self.current_bytes = sum(size for _, size, _ in entries)
+        for path, _, _ in entries:
+            if self.current_bytes <= self.max_bytes:
+                break
+            self._remove_file(path)
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+
+# 기본 메모리 예산 (700x500 32비트 이미지 기준 약 45장)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+class PixmapCache:
+    """메모리 예산(바이트) 기반 LRU QPixmap 캐시
+
+    가장 오래 사용되지 않은 이미지부터 제거하며, 현재 표시 중인 이미지처럼
+    고정(pin)된 항목은 예산을 넘더라도 제거하지 않습니다.
+    QPixmap 대신 크기를 따로 지정하여 MipmapPyramid 등 다른 객체를 저장할 수도 있습니다.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """캐시 초기화
+
+        Args:
+            max_bytes (int): 캐시가 사용할 수 있는 최대 바이트 수
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()  # 키 -> (QPixmap 또는 MipmapPyramid, 바이트 크기)
+        self._pinned = set()
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def pixmap_cost(pixmap):
+        """픽스맵이 차지하는 메모리(바이트)를 계산 (너비 x 높이 x 깊이)
+
+        Args:
+            pixmap (QPixmap): 크기를 계산할 픽스맵
+
+        Returns:
+            int: 바이트 단위 크기
+        """
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key):
+        """캐시에서 픽스맵을 조회 (조회된 항목은 가장 최근 사용으로 이동)
+
+        Args:
+            key (str): 메뉴 항목 이름 등 캐시 키
+
+        Returns:
+            QPixmap: 캐시된 픽스맵 또는 None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def peek(self, key):
+        """캐시에서 항목을 조회 (통계와 LRU 순서에는 영향 없음, 없으면 None)"""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def put(self, key, pixmap, cost=None):
+        """픽스맵을 캐시에 저장하고 예산을 넘으면 오래된 항목을 제거
+
+        Args:
+            key (str): 캐시 키
+            pixmap (QPixmap): 저장할 픽스맵 (또는 다른 객체)
+            cost (int): 바이트 단위 크기 (None이면 픽스맵 크기로 계산)
+        """
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+
+        if cost is None:
+            cost = self.pixmap_cost(pixmap)
+        self._entries[key] = (pixmap, cost)
+        self.current_bytes += cost
+        self._evict()
+
+    def contains(self, key):
+        """키가 캐시에 있는지 확인 (통계와 LRU 순서에는 영향 없음)"""
+        return key in self._entries
+
+    def remove(self, key):
+        """캐시에서 항목 제거
+
+        Args:
+            key (str): 제거할 캐시 키
+
+        Returns:
+            bool: 항목이 있어서 제거했으면 True
+        """
+        self._pinned.discard(key)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.current_bytes -= entry[1]
+        return True
+
+    def set_max_bytes(self, max_bytes):
+        """메모리 예산을 바꾸고 줄었으면 오래된 항목부터 정리"""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def pin(self, key):
+        """항목을 고정하여 제거 대상에서 제외"""
+        self._pinned.add(key)
+
+    def unpin(self, key):
+        """항목 고정 해제 후 예산 초과분 정리"""
+        self._pinned.discard(key)
+        self._evict()
+
+    def clear(self):
+        """고정 여부와 관계없이 모든 항목 제거"""
+        self._entries.clear()
+        self._pinned.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        """캐시 통계 반환
+
+        Returns:
+            dict: 항목 수, 사용 바이트, 예산, 적중/실패/제거 횟수
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _evict(self):
+        """예산을 넘는 동안 고정되지 않은 가장 오래된 항목부터 제거"""
+        if self.current_bytes <= self.max_bytes:
+            return
+
+        for key in list(self._entries):
+            if self.current_bytes <= self.max_bytes:
+                break
+            if key in self._pinned:
+                continue
+            self.current_bytes -= self._entries.pop(key)[1]
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
@@ -0,0 +1,451 @@
+import os
+import time
+from collections import deque
+from PySide6.QtCore import Qt, QObject, QRunnable, QSize, QThread, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageIOHandler, QImageReader, QPixmap
+from metrics import metrics
+
+# 메뉴 이미지 기본 표시 크기 (화면에 표시되기 전, 번들/전처리 기본 크기)
+TARGET_SIZE = (700, 500)
+# 디코딩 크기 단위(물리 픽셀). 표시 크기를 이 단위로 올려 디코딩하므로 창 크기가 조금 바뀌어도
+# 원본을 다시 디코딩하지 않고, 디스크 캐시에도 비슷한 크기의 파일이 여러 개 생기지 않음
+DECODE_STEP = 128
+
+class LoadCancelled(Exception):
+    """더 이상 필요 없는 요청이라 디코딩을 중단했음을 알리는 예외"""
+
+def decode_size(size, step=DECODE_STEP):
+    """표시 크기를 덮는 디코딩 크기 (각 변을 step 단위로 올림)
+
+    Args:
+        size (tuple): 표시 크기 (너비, 높이, 물리 픽셀)
+        step (int): 올림 단위
+
+    Returns:
+        tuple: 디코딩 크기 (너비, 높이)
+    """
+    return tuple(-(-max(1, side) // step) * step for side in size)
+
+def _covers(size, target_size):
+    """size가 target_size 이상인지 확인 (너비와 높이 모두)"""
+    return size[0] >= target_size[0] and size[1] >= target_size[1]
+
+def _fills(image_size, built_for, target_size):
+    """미리 축소한 이미지로 목표 크기에 맞춘 이미지를 늘리지 않고 만들 수 있는지 확인
+
+    가로나 세로 한쪽이라도 목표 크기 이상이면 축소만으로 맞출 수 있고,
+    만들 때의 크기보다 양쪽 모두 작으면 원본 해상도 그대로이므로 더 나은 이미지가 없습니다.
+    """
+    source_limited = image_size[0] < built_for[0] and image_size[1] < built_for[1]
+    return source_limited or image_size[0] >= target_size[0] or image_size[1] >= target_size[1]
+
+def _fit_size(width, height, target_size):
+    """가로세로 비율을 유지하면서 목표 크기 안에 들어가는 크기 계산"""
+    scale = min(target_size[0] / width, target_size[1] / height, 1.0)
+    return QSize(max(1, round(width * scale)), max(1, round(height * scale)))
+
+def decode_image(image_path, target_size=TARGET_SIZE, disk_cache=None, is_cancelled=None,
+                 stats=None):
+    """이미지 파일을 목표 크기의 QImage로 디코딩 (워커 스레드에서 호출)
+
+    JPEG처럼 축소 디코딩을 지원하는 형식은 QImageReader에 크기를 미리 지정하여
+    원본 해상도 전체를 메모리에 올리지 않고, 필요한 경우에만 마지막에 고품질로 다시 축소합니다.
+
+    Args:
+        image_path (str): 원본 이미지 경로
+        target_size (tuple): 목표 크기 (너비, 높이)
+        disk_cache (DiskImageCache): 축소 이미지 디스크 캐시 (선택)
+        is_cancelled (callable): 요청이 취소되었는지 확인하는 함수 (선택)
+        stats (dict): 디코딩 시간(ms)과 최대 메모리 사용량(바이트)을 기록할 딕셔너리 (선택)
+
+    Returns:
+        QImage: 목표 크기에 맞게 축소된 이미지
+
+    Raises:
+        FileNotFoundError: 이미지 파일이 없는 경우
+        ValueError: 이미지를 디코딩할 수 없는 경우
+        LoadCancelled: 디코딩 도중 요청이 취소된 경우
+    """
+    if stats is None:
+        stats = {}
+    start = time.perf_counter()
+
+    if not os.path.exists(image_path):
+        raise FileNotFoundError(f"이미지를 찾을 수 없습니다: {os.path.basename(image_path)}")
+
+    # 디스크 캐시에 미리 축소된 이미지가 있으면 원본 디코딩 생략
+    if disk_cache:
+        image = disk_cache.load(image_path, target_size)
+        if image is not None:
+            stats.update(source="disk", decode_ms=(time.perf_counter() - start) * 1000,
+                         peak_bytes=image.sizeInBytes(), full_bytes=image.sizeInBytes())
+            return image
+
+    if is_cancelled and is_cancelled():
+        raise LoadCancelled()
+
+    reader = QImageReader(image_path)
+    source_size = reader.size()  # 헤더만 읽어 원본 크기 확인
+    if not source_size.isValid():
+        raise ValueError("이미지를 로드할 수 없습니다")
+    fitted = _fit_size(source_size.width(), source_size.height(), target_size)
+
+    # 원본이 목표 크기의 2배 이상이면 2배 크기로 축소 디코딩 (JPEG은 DCT 단계에서 축소)
+    # 마지막 고품질 축소를 위한 여유분을 남겨 화질 저하를 막음
+    scaled_read = (reader.supportsOption(QImageIOHandler.ImageOption.ScaledSize)
+                   and source_size.width() >= fitted.width() * 2
+                   and source_size.height() >= fitted.height() * 2)
+    if scaled_read:
+        reader.setScaledSize(fitted * 2)
+
+    source = reader.read()
+    if source.isNull():
+        raise ValueError(f"이미지를 로드할 수 없습니다: {reader.errorString()}")
+
+    if is_cancelled and is_cancelled():
+        raise LoadCancelled()
+
+    peak_bytes = source.sizeInBytes()
+    image = source
+    if source.size() != fitted:
+        image = source.scaled(fitted,
+                              Qt.AspectRatioMode.IgnoreAspectRatio,
+                              Qt.TransformationMode.SmoothTransformation)
+        peak_bytes += image.sizeInBytes()
+
+    stats.update(source="scaled-read" if scaled_read else "full-read",
+                 decode_ms=(time.perf_counter() - start) * 1000,
+                 peak_bytes=peak_bytes,
+                 full_bytes=source_size.width() * source_size.height() * 4)
+
+    if disk_cache:
+        disk_cache.store(image_path, target_size, image)
+    return image
+
+def decode_bundle_image(entry, target_size=TARGET_SIZE, stats=None):
+    """번들에 미리 축소해 둔 이미지를 QImage로 (워커 스레드에서 호출)
+
+    원시 픽셀로 저장된 항목은 mmap 메모리를 복사 없이 그대로 가리키는 QImage를 만들고,
+    압축된 항목은 디코딩합니다. 목표 크기보다 크면 고품질로 축소합니다.
+
+    Args:
+        entry (BundleEntry): 번들의 이미지 항목
+        target_size (tuple): 목표 크기 (너비, 높이)
+        stats (dict): 디코딩 시간(ms)과 최대 메모리 사용량(바이트)을 기록할 딕셔너리 (선택)
+
+    Returns:
+        QImage: 목표 크기에 맞는 이미지
+
+    Raises:
+        ValueError: 항목을 이미지로 읽을 수 없는 경우
+    """
+    if stats is None:
+        stats = {}
+    start = time.perf_counter()
+    meta = entry.meta
+
+    if meta.get("encoding") == "raw":
+        image = QImage(entry.view(), meta["width"], meta["height"], meta["bytes_per_line"],
+                       getattr(QImage.Format, meta["format"]))
+        peak_bytes = 0  # mmap을 그대로 사용
+    else:
+        # QImage.fromData는 memoryview를 받지 않으므로 압축 데이터(수십 KB)만 복사
+        image = QImage.fromData(bytes(entry.view()))
+        peak_bytes = image.sizeInBytes()
+    if image.isNull():
+        raise ValueError(f"번들 이미지를 읽을 수 없습니다: {entry.name}")
+
+    fitted = _fit_size(image.width(), image.height(), target_size)
+    if image.size() != fitted:
+        image = image.scaled(fitted,
+                             Qt.AspectRatioMode.IgnoreAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+        peak_bytes += image.sizeInBytes()
+
+    stats.update(source="bundle", decode_ms=(time.perf_counter() - start) * 1000,
+                 peak_bytes=peak_bytes, full_bytes=meta["width"] * meta["height"] * 4)
+    return image
+
+class _DecodeTask(QRunnable):
+    """스레드 풀에서 실행되는 이미지 디코딩 작업"""
+
+    def __init__(self, engine, key, image_path, generation, target_size, prefetch=False):
+        super().__init__()
+        self.setAutoDelete(False)  # 엔진이 참조를 관리
+        self.engine = engine
+        self.key = key
+        self.image_path = image_path
+        self.generation = generation  # 요청 세대 (최신 요청과 다르면 취소된 것으로 간주)
+        self.target_size = target_size  # 요청 시점의 목표 크기
+        self.prefetch = prefetch  # 미리 불러오기 작업 여부
+        self.stats = {}  # 디코딩 시간과 메모리 사용량
+
+    @property
+    def pool(self):
+        """작업이 실행되는 스레드 풀"""
+        return self.engine.prefetch_pool if self.prefetch else self.engine.pool
+
+    def is_cancelled(self):
+        """이 작업보다 새로운 요청이 들어왔는지 확인"""
+        if self.prefetch:
+            return self.generation != self.engine.prefetch_generation
+        return self.generation != self.engine.generation
+
+    def run(self):
+        """이미지 디코딩 작업 실행"""
+        name = self.engine.metrics_name
+        try:
+            with metrics.span(f"{name}.prefetch" if self.prefetch else f"{name}.decode"):
+                entry = self.engine.bundle_image(self.key, self.target_size)
+                derived_path = None
+                if entry is None:
+                    derived_path = self.engine.derived_image(self.key, self.target_size)
+                if entry is not None:
+                    image = decode_bundle_image(entry, self.target_size, self.stats)
+                elif derived_path:
+                    # 이미 목표 크기 가까이 축소된 파일이므로 디스크 캐시를 거치지 않음
+                    image = decode_image(derived_path, self.target_size, None,
+                                         self.is_cancelled, self.stats)
+                    self.stats["source"] = "derived"
+                else:
+                    image = decode_image(self.image_path, self.target_size,
+                                         self.engine.disk_cache, self.is_cancelled, self.stats)
+            metrics.count(f"{name}.source.{self.stats['source']}")
+            self.engine._task_done.emit(self, image, "")
+        except LoadCancelled:
+            metrics.count(f"{name}.cancelled")
+            self.engine._task_done.emit(self, None, "")
+        except Exception as e:
+            metrics.count(f"{name}.errors")
+            self.engine._task_done.emit(self, None, str(e) or "이미지를 로드할 수 없습니다")
+
+class ImageLoadEngine(QObject):
+    """공유 스레드 풀 기반의 취소 가능한 이미지 로더
+
+    - 워커에서는 QImage까지만 디코딩하고 QPixmap 변환은 GUI 스레드에서 수행
+    - 새로운 요청이 들어오면 세대 번호를 올려 이전 요청을 협조적으로 취소
+    - 같은 항목에 대해 진행 중인 요청이 있으면 새로 디코딩하지 않고 합침
+      (진행 중인 요청의 크기가 현재 목표 크기보다 작으면 새 크기로 다시 요청)
+    - 썸네일 그리드처럼 여러 항목을 함께 요청하면 목록에서 빠진 항목의 요청만 취소
+    - 미리 불러오기는 별도의 단일 스레드 풀에서 실행되어 실제 클릭을 막지 않음
+    """
+    image_loaded = Signal(str, object, object)  # (메뉴 항목, QPixmap, 디코딩 목표 크기)
+    load_error = Signal(str, str)       # (메뉴 항목, 에러 메시지)
+    _task_done = Signal(object, object, str)  # 워커 -> GUI 스레드 내부 전달용 (작업, QImage, 에러)
+
+    def __init__(self, image_dir, disk_cache=None, target_size=TARGET_SIZE,
+                 max_threads=2, parent=None, bundle=None, derived=None, metrics_name="image"):
+        """이미지 로더 초기화
+
+        Args:
+            image_dir (str): 이미지 파일이 있는 디렉토리 경로
+            disk_cache (DiskImageCache): 축소 이미지 디스크 캐시 (선택)
+            target_size (tuple): 목표 크기 (너비, 높이, 물리 픽셀). 표시 크기가 바뀌면 갱신
+            max_threads (int): 디코딩에 사용할 최대 스레드 수
+            parent (QObject): 부모 객체
+            bundle (AssetBundle): 미리 축소한 이미지가 들어 있는 번들 (없는 항목은 image_dir에서 읽음)
+            derived (DerivedAssets): 전처리 도구가 미리 축소한 이미지 색인 (없는 항목은 image_dir에서 읽음)
+            metrics_name (str): 측정값 이름 앞에 붙일 이름 (예: image.decode, thumbnail.decode)
+        """
+        super().__init__(parent)
+        self.image_dir = image_dir
+        self.disk_cache = disk_cache
+        self.bundle = bundle
+        self.derived = derived
+        self.metrics_name = metrics_name
+        self.target_size = target_size
+        self.generation = 0
+        self.prefetch_generation = 0
+        self._in_flight = {}  # 메뉴 항목 -> 진행 중인 _DecodeTask
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, min(max_threads, QThreadPool.globalInstance().maxThreadCount())))
+
+        # 미리 불러오기 전용 풀 (스레드 1개, 낮은 우선순위)
+        self.prefetch_pool = QThreadPool(self)
+        self.prefetch_pool.setMaxThreadCount(1)
+        self.prefetch_pool.setThreadPriority(QThread.Priority.LowPriority)
+
+        # 통계 카운터
+        self.decodes = 0
+        self.merged = 0
+        self.cancelled = 0
+        self.prefetches = 0
+        self.decode_log = deque(maxlen=100)  # 최근 이미지별 디코딩 통계
+
+        self._task_done.connect(self._on_task_done)
+
+    def image_path(self, menu_item):
+        """메뉴 항목의 이미지 파일 경로"""
+        return os.path.join(self.image_dir, f"{menu_item}.jpg")
+
+    def bundle_image(self, menu_item, target_size=None):
+        """번들에서 목표 크기에 충분한 이미지 항목 찾기
+
+        번들의 이미지를 늘려야 목표 크기에 맞출 수 있고 원본 파일이 있으면 원본을 사용합니다.
+
+        Returns:
+            BundleEntry: 번들 항목. 없거나 작으면 None
+        """
+        target_size = target_size or self.target_size
+        entry = self.bundle.image(menu_item) if self.bundle else None
+        if entry is None:
+            return None
+        meta = entry.meta
+        built_for = meta.get("target_size", target_size)
+        if (not _fills((meta["width"], meta["height"]), built_for, target_size)
+                and os.path.exists(self.image_path(menu_item))):
+            return None
+        return entry
+
+    def derived_image(self, menu_item, target_size=None):
+        """전처리 도구가 목표 크기 이상으로 미리 축소해 둔 이미지 경로 (없으면 None)"""
+        if not self.derived:
+            return None
+        return self.derived.image(menu_item, target_size or self.target_size)
+
+    def estimated_bytes(self):
+        """디코딩된 이미지 한 장의 최대 메모리 크기 추정치 (32비트 기준)"""
+        return self.target_size[0] * self.target_size[1] * 4
+
+    def request(self, menu_item):
+        """메뉴 항목의 이미지 로딩 요청 (가장 최근 요청만 유지)
+
+        Args:
+            menu_item (str): 이미지를 로드할 메뉴 항목
+        """
+        self.generation += 1
+
+        # 아직 시작하지 않은 이전 요청은 큐에서 제거 (미리 불러오기는 유지)
+        self._cancel_queued(keep=(menu_item,))
+        self._submit(menu_item)
+
+    def request_visible(self, menu_items):
+        """화면에 보이는 여러 항목의 이미지를 함께 요청 (썸네일 그리드 등에서 사용)
+
+        목록에 없는 이전 요청은 취소하고(실행 중인 작업은 다음 확인 지점에서 중단),
+        목록에 있는 항목의 진행 중인 요청은 그대로 이어서 진행합니다.
+
+        Args:
+            menu_items (list): 우선순위 순으로 정렬된 메뉴 항목 리스트 (비어 있으면 모두 취소)
+        """
+        self.generation += 1
+        self._cancel_queued(keep=set(menu_items))
+        for menu_item in menu_items:
+            self._submit(menu_item)
+
+    def _cancel_queued(self, keep):
+        """keep에 없는 항목의 아직 시작하지 않은 요청을 큐에서 제거 (미리 불러오기는 유지)"""
+        for key, task in list(self._in_flight.items()):
+            if key not in keep and not task.prefetch and self.pool.tryTake(task):
+                del self._in_flight[key]
+                self.cancelled += 1
+
+    def _submit(self, menu_item):
+        """현재 세대로 항목 디코딩 시작 (같은 항목이 진행 중이면 합침)"""
+        task = self._in_flight.get(menu_item)
+        if task is not None and not _covers(task.target_size, self.target_size):
+            # 더 작은 크기로 진행 중인 요청은 결과를 버리고 새 크기로 다시 요청
+            task.pool.tryTake(task)
+            task = None
+        if task is not None:
+            self.merged += 1
+            if task.prefetch and self.prefetch_pool.tryTake(task):
+                # 아직 시작하지 않은 미리 불러오기는 일반 요청으로 승격
+                task.prefetch = False
+                task.generation = self.generation
+                self.pool.start(task)
+                return
+            # 같은 항목이 이미 진행 중이면 최신 요청으로 갱신만 함
+            task.prefetch = False
+            task.generation = self.generation
+            return
+
+        task = _DecodeTask(self, menu_item, self.image_path(menu_item), self.generation, self.target_size)
+        self._in_flight[menu_item] = task
+        self.decodes += 1
+        self.pool.start(task)
+
+    def prefetch(self, menu_items, budget_bytes):
+        """메뉴 항목들의 이미지를 낮은 우선순위로 미리 불러오기
+
+        이전 미리 불러오기 중 아직 시작하지 않은 작업은 취소하고,
+        주어진 순서대로 예산 안에 들어가는 항목만 큐에 넣습니다.
+
+        Args:
+            menu_items (list): 우선순위 순으로 정렬된 메뉴 항목 리스트
+            budget_bytes (int): 미리 불러올 이미지의 총 메모리 예산(바이트)
+        """
+        self.cancel_prefetch()
+
+        count = budget_bytes // self.estimated_bytes()
+        for menu_item in menu_items[:count]:
+            if menu_item in self._in_flight:
+                continue
+            task = _DecodeTask(self, menu_item, self.image_path(menu_item),
+                               self.prefetch_generation, self.target_size, prefetch=True)
+            self._in_flight[menu_item] = task
+            self.prefetches += 1
+            self.prefetch_pool.start(task)
+
+    def cancel_prefetch(self):
+        """미리 불러오기 요청 취소"""
+        self.prefetch_generation += 1
+        for key, task in list(self._in_flight.items()):
+            if task.prefetch and self.prefetch_pool.tryTake(task):
+                del self._in_flight[key]
+
+    def is_loading(self, menu_item):
+        """메뉴 항목의 이미지가 로딩 중인지 확인"""
+        return menu_item in self._in_flight
+
+    def cancel_all(self):
+        """모든 요청 취소 (진행 중인 작업은 다음 확인 지점에서 중단)"""
+        self.generation += 1
+        self._cancel_queued(keep=())
+
+    def shutdown(self, timeout_ms=1000):
+        """요청을 모두 취소하고 실행 중인 작업이 끝날 때까지 대기"""
+        self.cancel_prefetch()
+        self.cancel_all()
+        self.pool.waitForDone(timeout_ms)
+        self.prefetch_pool.waitForDone(timeout_ms)
+
+    def stats(self):
+        """로더 통계 반환 (최근 디코딩의 평균 시간과 최대 메모리 사용량 포함)"""
+        log = list(self.decode_log)
+        return {
+            "decodes": self.decodes,
+            "prefetches": self.prefetches,
+            "merged": self.merged,
+            "cancelled": self.cancelled,
+            "in_flight": len(self._in_flight),
+            "avg_decode_ms": sum(entry["decode_ms"] for entry in log) / len(log) if log else 0.0,
+            "max_peak_bytes": max((entry["peak_bytes"] for entry in log), default=0),
+            "max_full_bytes": max((entry["full_bytes"] for entry in log), default=0),
+        }
+
+    def _on_task_done(self, task, image, error):
+        """워커 작업 완료 처리 (GUI 스레드)"""
+        menu_item = task.key
+        if image is None and not error and not task.is_cancelled():
+            # 취소 확인 이후 같은 항목이 다시 요청된 경우 작업을 재시작
+            task.pool.start(task)
+            return
+
+        current = self._in_flight.get(menu_item)
+        if current is task:
+            del self._in_flight[menu_item]
+        elif current is not None:
+            # 같은 항목을 더 큰 크기로 다시 요청한 경우 이전 결과는 버림
+            self.cancelled += 1
+            return
+
+        if error:
+            self.load_error.emit(menu_item, error)
+        elif image is None:
+            self.cancelled += 1
+        else:
+            self.decode_log.append(dict(task.stats, item=menu_item))
+            # QPixmap은 GUI 스레드에서만 생성
+            self.image_loaded.emit(menu_item, QPixmap.fromImage(image), task.target_size)
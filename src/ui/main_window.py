@@ -1,61 +1,79 @@
 import os
+import time
 from PySide6.QtWidgets import (QMainWindow, QWidget, QLabel, QVBoxLayout, 
-                             QMessageBox)
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QPixmap
+                             QMessageBox, QSizePolicy, QDockWidget)
+from PySide6.QtCore import Qt, QEvent, QTimer, Signal
 from .menu_manager import MenuManager
+from .image_cache import PixmapCache, DEFAULT_MAX_BYTES
+from .mipmap import MipmapPyramid
+from .disk_cache import DiskImageCache
+from .image_loader import ImageLoadEngine, TARGET_SIZE, decode_size
+from .search_box import MenuSearchBox
+from .thumbnail_grid import ThumbnailGrid
+from metrics import metrics
 
-class ImageLoader(QThread):
-    """이미지 로딩을 위한 워커 스레드"""
-    image_loaded = Signal(object)  # 이미지 로딩이 완료되면 QPixmap을 전달
-    load_error = Signal(str)    # 에러 발생 시 에러 메시지 전달
-    
-    def __init__(self, image_path):
-        super().__init__()
-        self.image_path = image_path
-        
-    def run(self):
-        """이미지 로딩 작업 실행"""
-        try:
-            if not os.path.exists(self.image_path):
-                raise FileNotFoundError(f"이미지를 찾을 수 없습니다: {os.path.basename(self.image_path)}")
-                
-            pixmap = QPixmap(self.image_path)
-            if pixmap.isNull():
-                raise ValueError("이미지를 로드할 수 없습니다")
-                
-            # 이미지 크기를 조정 (700x500)
-            scaled_pixmap = pixmap.scaled(700, 500, 
-                                        Qt.AspectRatioMode.KeepAspectRatio,
-                                        Qt.TransformationMode.SmoothTransformation)
-            self.image_loaded.emit(scaled_pixmap)
-        except Exception as e:
-            self.load_error.emit(str(e))
+# 미리 불러오기에 사용할 최대 메모리 (이미지 캐시 예산의 일부, 기본 표시 크기 기준)
+PREFETCH_BUDGET_BYTES = 16 * 1024 * 1024
+# 표시 크기가 커지면 이미지 캐시 예산을 면적에 비례해 늘리되 이 값을 넘지 않음
+MAX_IMAGE_CACHE_BYTES = 384 * 1024 * 1024
+# 창 크기 변경이 멈춘 뒤 이미지를 새 크기에 맞추기까지 기다리는 시간(ms)
+RESIZE_DEBOUNCE_MS = 150
+# 이미지 영역 최소 크기
+MIN_IMAGE_SIZE = (320, 240)
 
 class MainWindow(QMainWindow):
-    def __init__(self, app_title, image_dir, audio_manager):
+    first_painted = Signal()  # 윈도우를 처음 그렸을 때 (스플래시를 닫는 시점)
+
+    def __init__(self, app_title, image_dir, audio_manager, cache_dir=None, catalog_path=None,
+                 bundle=None, derived=None):
         """메인 윈도우 초기화
         
         Args:
             app_title (str): 애플리케이션 제목
             image_dir (str): 이미지 파일이 있는 디렉토리 경로
             audio_manager (AudioManager): 오디오 관리자 인스턴스
+            cache_dir (str): 축소 이미지 디스크 캐시 디렉토리 경로 (None이면 사용 안 함)
+            catalog_path (str): 메뉴 카탈로그 파일 경로 (None이면 기본 메뉴)
+            bundle (AssetBundle): 미리 축소한 이미지 번들 (None이면 이미지 파일에서 읽음)
+            derived (DerivedAssets): 전처리 도구가 미리 축소한 이미지 색인 (선택)
         """
         super().__init__()
         self.app_title = app_title
+        self.catalog_path = catalog_path
         self.image_dir = image_dir
         self.audio_manager = audio_manager
         self.previous_category = None  # 이전에 선택된 카테고리 저장
         self.current_category = None  # 항목을 선택한 카테고리 저장
-        self.image_loader = None  # 이미지 로더 
-        self.image_cache = {}  # 이미지 캐시 추가
+        self.requested_image = None  # 가장 최근에 요청한 이미지 키
+        self._requested_at = 0.0  # 가장 최근 요청 시각 (클릭 -> 표시 지연 시간 측정용)
+        self.image_cache = PixmapCache()  # 메모리 예산 기반 LRU 이미지 캐시 (항목별 MipmapPyramid)
+        self.prefetch_budget = PREFETCH_BUDGET_BYTES  # 표시 크기에 맞춰 조정됨
+        self.stall_detector = None  # 이벤트 루프 멈춤 감지기 (닫을 때 중지)
+        self.painted = False  # 윈도우를 한 번이라도 그렸는지 여부
+        self.current_image = None  # 현재 표시 중인(고정된) 이미지 키
+        self.shown_size = None  # 이미지를 표시하는 크기 (물리 픽셀, 로더는 이를 올린 디코딩 크기 사용)
+        self.disk_cache = DiskImageCache(os.path.join(cache_dir, "images")) if cache_dir else None
+        self.category_grid = None  # 카테고리 썸네일 그리드 (처음 열 때 만듦)
+        self.grid_dock = None
+        self.grid_category = None  # 그리드에 표시 중인 카테고리
+        
+        # 공유 스레드 풀 기반 이미지 로더
+        self.image_loader = ImageLoadEngine(image_dir, self.disk_cache, parent=self, bundle=bundle,
+                                            derived=derived)
+        self.image_loader.image_loaded.connect(self.cache_and_display_image)
+        self.image_loader.load_error.connect(self._on_load_error)
+        
+        # 창 크기 변경이 끝난 뒤 한 번만 표시 중인 이미지를 새 크기에 맞춤
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._apply_display_size)
         
         # UI 초기화
         self.init_ui()
         
-        # 배경 환경음 시작 - 비동기로 시작하여 UI 초기화 지연 방지
-        QThread.currentThread().msleep(100)  # UI가 먼저 표시되도록 약간 지연
-        self.audio_manager.play_ambient_sound("ambient.mp3", self)
+        # 배경 환경음 요청 - 믹서가 백그라운드에서 준비되면 시작됨
+        self.audio_manager.play_ambient_sound("ambient.mp3")
 
     def init_ui(self):
         """UI 초기화"""
@@ -74,10 +92,13 @@ class MainWindow(QMainWindow):
         # 이미지를 표시할 라벨
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setMinimumSize(700, 500)  # 최소 크기 설정
+        self.image_label.setMinimumSize(*MIN_IMAGE_SIZE)  # 최소 크기 설정
+        # 표시 중인 이미지 크기가 레이아웃을 키우지 않도록 함 (이미지를 라벨 크기에 맞춤)
+        self.image_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
         self.image_label.setText("메뉴를 선택해주세요")  # 초기 텍스트
         self.image_label.setStyleSheet("QLabel { font-size: 14px; }")
-        layout.addWidget(self.image_label)
+        self.image_label.installEventFilter(self)
+        layout.addWidget(self.image_label, 1)
         
         # 선택된 메뉴를 표시할 라벨
         self.selected_label = QLabel("메뉴를 선택해주세요")
@@ -89,15 +110,115 @@ class MainWindow(QMainWindow):
         self.set_default_image()
         
         # 윈도우 크기 설정
-        self.setMinimumSize(800, 600)
+        self.setMinimumSize(480, 400)
         self.setGeometry(100, 100, 800, 600)
         
         # 메뉴 관리자 생성 및 메뉴 초기화 - UI 초기화 후 메뉴 생성
-        self.menu_manager = MenuManager(self)
+        self.menu_manager = MenuManager(self, self.catalog_path)
         self.menu_manager.create_menus(self.menu_clicked)
+        
+        # 메뉴 검색창 (선택한 항목은 메뉴 클릭과 같은 경로로 처리)
+        self.search_box = MenuSearchBox(self.menu_manager.catalog.categories)
+        self.search_box.item_selected.connect(self.menu_manager.select_item)
+        layout.insertWidget(0, self.search_box)
+
+    def on_audio_ready(self):
+        """믹서가 준비되면 카테고리 음성을 백그라운드에서 미리 디코딩"""
+        filenames = [f"{category}.mp3" for category in self.menu_manager.food_categories()]
+        self.audio_manager.start_warmup(filenames)
+
+    def paintEvent(self, event):
+        """처음 그릴 때 한 번만 first_painted 신호 발생"""
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            self.first_painted.emit()
+
+    def eventFilter(self, watched, event):
+        """이미지 라벨의 크기나 화면 배율이 바뀌면 변경이 끝난 뒤 이미지를 다시 맞춤"""
+        if watched is self.image_label and event.type() in (QEvent.Type.Resize,
+                                                            QEvent.Type.DevicePixelRatioChange):
+            if self.current_image is None:
+                self._apply_display_size()  # 표시 중인 이미지가 없으면 바로 반영
+            else:
+                self._resize_timer.start()
+        return super().eventFilter(watched, event)
+
+    def display_size(self):
+        """이미지를 표시할 크기 (물리 픽셀, HiDPI 화면에서는 화면 배율을 곱한 크기)"""
+        rect = self.image_label.contentsRect()
+        ratio = self.image_label.devicePixelRatioF()
+        return (max(1, round(rect.width() * ratio)), max(1, round(rect.height() * ratio)))
+
+    def _apply_display_size(self):
+        """현재 표시 크기를 반영하고 표시 중인 이미지를 다시 맞춤
+
+        로더의 목표 크기는 표시 크기를 DECODE_STEP 단위로 올린 크기이므로,
+        같은 단위 안에서 크기가 바뀌면 디코딩한 이미지를 줄여서 표시하기만 합니다.
+        """
+        size = self.display_size()
+        if size == self.shown_size:
+            return
+        self.shown_size = size
+        target_size = decode_size(size)
+        if target_size != self.image_loader.target_size:
+            self.image_loader.target_size = target_size
+            self.image_loader.cancel_prefetch()  # 이전 크기로 미리 불러오던 작업 중단
+            self._scale_budgets(target_size)
+        metrics.count("ui.rescale")
+        
+        # 표시 중인 이미지는 피라미드에서 새 크기에 맞춤 (해상도가 부족할 때만 다시 디코딩)
+        pyramid = self.image_cache.peek(self.current_image) if self.current_image else None
+        if pyramid is not None and self.current_image == self.requested_image:
+            self._show_pyramid(self.current_image, pyramid)
+
+    def show_category_grid(self, category):
+        """카테고리의 메뉴 항목을 썸네일 그리드로 표시 (그리드에서 선택하면 메뉴 클릭과 같은 경로로 처리)
+
+        Args:
+            category (str): 표시할 카테고리
+        """
+        if self.category_grid is None:
+            self.category_grid = ThumbnailGrid(self.image_dir, self.disk_cache, self.image_loader.bundle,
+                                               self.image_loader.derived)
+            self.category_grid.item_selected.connect(self.menu_manager.select_item)
+            self.grid_dock = QDockWidget(self)
+            self.grid_dock.setObjectName("category_grid")
+            self.grid_dock.setWidget(self.category_grid)
+            self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.grid_dock)
+            # 셀 두 줄이 들어가는 너비로 시작
+            cell_width = self.category_grid.gridSize().width()
+            scrollbar_width = self.category_grid.verticalScrollBar().sizeHint().width()
+            self.resizeDocks([self.grid_dock], [cell_width * 2 + scrollbar_width + 4],
+                             Qt.Orientation.Horizontal)
+        
+        catalog = self.menu_manager.catalog
+        items = catalog.items(category)
+        self.grid_category = category
+        self.grid_dock.setWindowTitle(category)
+        self.category_grid.show_items(items, {item: catalog.label(item) for item in items})
+        self.grid_dock.show()
+
+    def _scale_budgets(self, size):
+        """이미지 캐시와 미리 불러오기 예산을 표시 면적에 맞춤
+
+        기본 표시 크기(TARGET_SIZE)일 때와 비슷한 장수를 담도록 면적에 비례해 늘리되,
+        캐시는 MAX_IMAGE_CACHE_BYTES를 넘지 않으므로 아주 큰 화면에서는 담는 장수가 줄어듭니다.
+        미리 불러오기는 캐시 예산의 1/4 안에서 최소 한 장은 불러옵니다.
+        """
+        ratio = max(1.0, size[0] * size[1] / (TARGET_SIZE[0] * TARGET_SIZE[1]))
+        self.image_cache.set_max_bytes(min(MAX_IMAGE_CACHE_BYTES, int(DEFAULT_MAX_BYTES * ratio)))
+        self.prefetch_budget = max(self.image_loader.estimated_bytes(),
+                                   min(int(PREFETCH_BUDGET_BYTES * ratio), self.image_cache.max_bytes // 4))
 
     def closeEvent(self, event):
         """윈도우가 닫힐 때 호출되는 메서드"""
+        # 아래의 작업 종료 대기를 이벤트 루프 멈춤으로 기록하지 않도록 먼저 중지
+        if self.stall_detector:
+            self.stall_detector.stop()
+        self.image_loader.shutdown()
+        if self.category_grid is not None:
+            self.category_grid.shutdown()
         self.audio_manager.cleanup()
         event.accept()
 
@@ -108,37 +229,111 @@ class MainWindow(QMainWindow):
 
     def load_menu_image(self, menu_item):
         """메뉴에 해당하는 이미지 비동기 로드"""
+        self.requested_image = menu_item
+        self._requested_at = time.perf_counter()
+        
         # 캐시에 이미지가 있는지 확인
-        if menu_item in self.image_cache:
-            self.on_image_loaded(self.image_cache[menu_item])
+        pyramid = self.image_cache.get(menu_item)
+        if pyramid is not None:
+            metrics.count("image.cache.hit")
+            self.image_loader.cancel_all()
+            self._set_current_image(menu_item)
+            self._show_pyramid(menu_item, pyramid)
             return
-            
-        # 이전 로더가 있다면 중지
-        if self.image_loader and self.image_loader.isRunning():
-            self.image_loader.terminate()
-            self.image_loader.wait()
+        metrics.count("image.cache.miss")
         
         # 로딩 중임을 표시
         self.image_label.setText("이미지 로딩 중...")
         self.image_label.setStyleSheet("QLabel { font-size: 14px; }")
         
-        # 새로운 이미지 로더 생성 및 시작
-        image_path = os.path.join(self.image_dir, f"{menu_item}.jpg")
-        self.image_loader = ImageLoader(image_path)
-        self.image_loader.image_loaded.connect(lambda pixmap: self.cache_and_display_image(menu_item, pixmap))
-        self.image_loader.load_error.connect(self.on_image_error)
-        self.image_loader.start()
+        # 이미지 로딩 요청 (이전 요청은 취소되고, 같은 항목의 요청은 합쳐짐)
+        self.image_loader.request(menu_item)
+
+    def prefetch_images(self, menu_items):
+        """메뉴 항목들의 이미지를 백그라운드에서 미리 불러오기
+
+        Args:
+            menu_items (list): 우선순위 순으로 정렬된 메뉴 항목 리스트
+        """
+        # 이미 캐시에 있거나 로딩 중인 항목은 제외
+        pending = [item for item in menu_items
+                   if not self.image_cache.contains(item) and not self.image_loader.is_loading(item)]
+        if not pending:
+            return
+        self.image_loader.prefetch(pending, self.prefetch_budget)
+
+    def on_catalog_changed(self, diff):
+        """카탈로그가 바뀌었을 때 없어진 항목과 카테고리의 캐시만 정리
+        
+        Args:
+            diff (CatalogDiff): 이전 카탈로그와의 차이
+        """
+        for item in diff.removed_items:
+            if item != self.current_image:
+                self.image_cache.remove(item)
+        for category in diff.removed_categories:
+            self.audio_manager.evict_sound(f"{category}.mp3")
+        if self.previous_category in diff.removed_categories:
+            self.previous_category = None
+        if self.grid_category in diff.removed_categories:
+            self.grid_dock.hide()
+            self.grid_category = None
+        elif self.grid_category in diff.changed_categories:
+            self.show_category_grid(self.grid_category)
+        self.search_box.rebuild(self.menu_manager.catalog.categories)
 
-    def cache_and_display_image(self, menu_item, pixmap):
-        """이미지를 캐시에 저장하고 표시"""
-        self.image_cache[menu_item] = pixmap
-        self.on_image_loaded(pixmap)
+    def cache_and_display_image(self, menu_item, pixmap, target_size):
+        """이미지를 캐시에 저장하고 가장 최근에 요청한 이미지라면 표시
+
+        Args:
+            menu_item (str): 메뉴 항목
+            pixmap (QPixmap): 디코딩한 이미지
+            target_size (tuple): 디코딩할 때의 목표 크기 (물리 픽셀)
+        """
+        pyramid = MipmapPyramid(pixmap, target_size)
+        if menu_item != self.requested_image:
+            self.image_cache.put(menu_item, pyramid, pyramid.cost())
+            return
+        self._set_current_image(menu_item)
+        self.image_cache.put(menu_item, pyramid, pyramid.cost())
+        self._show_pyramid(menu_item, pyramid)
+
+    def _show_pyramid(self, menu_item, pyramid):
+        """피라미드에서 현재 표시 크기에 맞는 픽스맵을 만들어 표시
+
+        디코딩한 해상도가 표시 크기보다 작으면 늘린 이미지를 먼저 보여 주고 더 크게 다시 디코딩합니다.
+        """
+        size = self.shown_size or self.image_loader.target_size
+        cost = pyramid.cost()
+        self.on_image_loaded(pyramid.render(size, self.image_label.devicePixelRatioF()))
+        if pyramid.cost() != cost:
+            self.image_cache.put(menu_item, pyramid, pyramid.cost())  # 새로 만든 단계만큼 크기 갱신
+        if not pyramid.covers(size):
+            self.image_loader.request(menu_item)
+
+    def _set_current_image(self, menu_item):
+        """현재 표시 중인 이미지를 캐시에 고정하고 이전 이미지는 고정 해제"""
+        if self.current_image == menu_item:
+            return
+        if self.current_image is not None:
+            self.image_cache.unpin(self.current_image)
+        self.image_cache.pin(menu_item)
+        self.current_image = menu_item
 
     def on_image_loaded(self, pixmap):
         """이미지 로딩이 완료되면 호출"""
         self.image_label.setPixmap(pixmap)
         self.image_label.setStyleSheet("")  # 기본 스타일로 복원
+        if self._requested_at:
+            # 다시 맞추거나 더 크게 다시 디코딩한 이미지는 클릭 지연 시간에서 제외
+            metrics.observe("ui.click_to_display", (time.perf_counter() - self._requested_at) * 1000)
+            self._requested_at = 0.0
     
+    def _on_load_error(self, menu_item, error_message):
+        """로더 에러 중 가장 최근 요청에 대한 것만 표시"""
+        if menu_item == self.requested_image:
+            self.on_image_error(error_message)
+
     def on_image_error(self, error_message):
         """이미지 로딩 실패 시 호출"""
         self.image_label.setText(error_message)
@@ -146,6 +341,11 @@ class MainWindow(QMainWindow):
 
     def menu_clicked(self, menu_item):
         """메뉴 아이템이 선택되었을 때 호출되는 메서드"""
+        with metrics.span("ui.menu_clicked"):
+            self._select_menu_item(menu_item)
+
+    def _select_menu_item(self, menu_item):
+        """선택한 메뉴 항목 표시, 알림음/카테고리 음성 재생, 이미지 로딩 시작"""
         self.selected_label.setText(f"선택된 메뉴: {menu_item}")
         
         # 시스템 알림음 재생
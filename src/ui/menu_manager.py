@@ -1,48 +1,301 @@
+import os
 from PySide6.QtWidgets import QMenuBar, QMenu, QMessageBox
+from PySide6.QtCore import QFileSystemWatcher, QTimer
+from PySide6.QtGui import QAction
 from typing import Dict, List, Callable
 from functools import partial
+from collections import Counter
+from .catalog import Catalog, CatalogDiff, CatalogError
+
+# 한 메뉴에 표시할 최대 항목 수 (넘으면 하위 메뉴로 나눔)
+PAGE_SIZE = 25
+# 카탈로그 파일 변경 후 다시 읽기까지 기다리는 시간 (저장 중 여러 번 발생하는 알림을 묶음)
+RELOAD_DELAY_MS = 300
 
 class MenuManager:
-    def __init__(self, parent_window):
+    def __init__(self, parent_window, catalog_path=None):
         """메뉴 관리자 초기화
         
         Args:
             parent_window: 메뉴바를 포함할 부모 윈도우
+            catalog_path: 메뉴 카탈로그 파일 경로 (JSON 또는 SQLite, None이면 기본 메뉴)
         """
         self.parent = parent_window
         self.menubar = parent_window.menuBar()
-        self.category_map = {}  # 메뉴 항목에서 카테고리로의 매핑 캐시
+        self.click_counts = Counter()  # 메뉴 항목별 클릭 횟수 (미리 불러오기 순서에 사용)
+        self._last_hovered = None  # 마지막으로 미리 불러오기를 요청한 항목
+        self._click_handler = None  # 일반 메뉴 항목 클릭 핸들러
+        self._menus = {}  # 카테고리 -> QMenu
+        self._menu_items = {}  # 카테고리 -> 메뉴의 항목 리스트 (카탈로그가 바뀌면 내용만 교체)
+        self._populated = set()  # 항목을 채운 QMenu
         
-        # 메뉴 카테고리와 항목들
-        self.categories = {
-            "한식": ["비빔밥", "김치찌개", "된장찌개", "불고기"],
-            "중식": ["짜장면", "짬뽕", "탕수육", "마파두부"],
-            "분식": ["떡볶이", "순대", "튀김", "라면"],
-            "일식": ["초밥", "라멘", "돈까스", "우동"],
-            "양식": ["파스타", "스테이크", "피자", "샐러드"],
+        # 메뉴 카탈로그 로드 (항목 -> 카테고리 색인은 로드할 때 생성됨)
+        try:
+            self.catalog = Catalog.load(catalog_path)
+        except CatalogError as e:
+            print(e)
+            self.catalog = Catalog.default()
+        self.category_map = self.catalog.category_map  # 메뉴 항목에서 카테고리로의 매핑
+        
+        # 카탈로그와 관계없는 프로그램 메뉴
+        self.system_menus = {
             "설정": ["환경음"],
             "푸드코트": ["푸드코트 정보...", "나가기"]
         }
         
-        # 카테고리 맵 초기화
-        self._init_category_map()
-    
-    def _init_category_map(self):
-        """메뉴 항목에서 카테고리로의 매핑 생성"""
-        for category, items in self.categories.items():
-            for item in items:
-                self.category_map[item] = category
+        # 메뉴 카테고리와 항목들
+        self.categories = dict(self.catalog.categories)
+        self.categories.update(self.system_menus)
+        
+        # 이미지가 없는 특수 메뉴 항목
+        self.special_items = {"환경음", "푸드코트 정보...", "나가기"}
+        
+        # 카탈로그 파일이 바뀌면 다시 읽어서 바뀐 메뉴만 갱신
+        self._watcher = None
+        self._reload_timer = QTimer(parent_window)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(RELOAD_DELAY_MS)
+        self._reload_timer.timeout.connect(self.reload_catalog)
+        if self.catalog.source_path:
+            self._watcher = QFileSystemWatcher([self.catalog.source_path], parent_window)
+            self._watcher.fileChanged.connect(self._on_catalog_file_changed)
     
     def create_menus(self, menu_click_handler: Callable[[str], None]):
-        """메뉴바에 모든 메뉴 항목을 생성
+        """메뉴바에 카테고리 메뉴를 생성 (항목은 메뉴를 처음 열 때 채움)
         
         Args:
             menu_click_handler: 일반 메뉴 항목 클릭 시 호출될 핸들러 함수
         """
-        for category, items in self.categories.items():
+        self._click_handler = menu_click_handler
+        for category in self.catalog.categories:
+            self._create_category_menu(category)
+        
+        for category, items in self.system_menus.items():
             menu = self.menubar.addMenu(category)
             self._add_menu_items(menu, items, menu_click_handler)
     
+    def _create_category_menu(self, category: str, before=None):
+        """카테고리 메뉴를 만들어 메뉴바에 추가 (항목은 처음 열 때 채움)
+        
+        Args:
+            category: 카테고리 이름
+            before: 이 액션 앞에 메뉴를 넣음 (None이면 맨 뒤)
+        """
+        menu = QMenu(category, self.menubar)
+        if before is None:
+            self.menubar.addMenu(menu)
+        else:
+            self.menubar.insertMenu(before, menu)
+        self._menus[category] = menu
+        # 지연 생성 핸들러가 이 리스트를 참조하므로 카탈로그가 바뀌면 리스트 내용만 교체
+        items = list(self.catalog.items(category))
+        self._menu_items[category] = items
+        self._make_lazy(menu, items, category)
+        return menu
+    
+    def _remove_category_menu(self, category: str):
+        """카테고리 메뉴를 메뉴바에서 제거 (하위 메뉴도 함께 정리)"""
+        menu = self._menus.pop(category)
+        self._menu_items.pop(category, None)
+        self._populated.discard(menu)
+        for submenu in menu.findChildren(QMenu):
+            self._populated.discard(submenu)
+        self.menubar.removeAction(menu.menuAction())
+        menu.deleteLater()
+    
+    def _update_category_menu(self, category: str, diff: CatalogDiff):
+        """바뀐 카테고리 메뉴에서 바뀐 항목의 QAction만 갱신
+        
+        가격만 바뀐 항목은 QAction의 텍스트만 바꾸고, 추가/삭제된 항목의 QAction만 넣거나 뺍니다.
+        아직 열지 않은 메뉴는 항목 리스트만 바꾸며, 하위 메뉴로 나뉜 메뉴는 항목이 추가/삭제되면
+        나누는 경계가 달라지므로 하위 메뉴만 다음에 열 때 다시 만듭니다.
+        
+        Args:
+            category: 카테고리 이름
+            diff: 이전 카탈로그와의 차이
+        """
+        menu = self._menus[category]
+        items = self._menu_items[category]
+        old_items = list(items)
+        items[:] = self.catalog.items(category)
+        
+        if diff.repriced_items:
+            repriced = set(diff.repriced_items)
+            for submenu in [menu] + menu.findChildren(QMenu):
+                for action in submenu.actions():
+                    if action.data() in repriced:
+                        action.setText(self.catalog.label(action.data()))
+        
+        if menu not in self._populated or items == old_items:
+            return
+        if len(old_items) > PAGE_SIZE or len(items) > PAGE_SIZE:
+            self._reset_menu(menu)
+        else:
+            self._sync_item_actions(menu, items, diff.category_removed_items.get(category, []))
+    
+    def _reset_menu(self, menu: QMenu):
+        """채운 메뉴를 비우고 다음에 열 때 다시 채우도록 되돌림 (하위 메뉴는 삭제)"""
+        for submenu in menu.findChildren(QMenu):
+            self._populated.discard(submenu)
+            submenu.deleteLater()
+        self._populated.discard(menu)
+        menu.clear()
+        self._add_placeholder(menu)
+    
+    def _sync_item_actions(self, menu: QMenu, items: List[str], removed_items: List[str]):
+        """메뉴의 항목 QAction을 새 항목 리스트에 맞춤
+        
+        없어진 항목의 QAction만 제거하고 새 항목의 QAction만 만들며,
+        이미 제자리에 있는 QAction은 옮기지 않습니다.
+        
+        Args:
+            menu: 항목을 채운 메뉴
+            items: 새 항목 리스트
+            removed_items: 메뉴에서 없어진 항목
+        """
+        actions = {action.data(): action for action in menu.actions() if action.data()}
+        for item in removed_items:
+            action = actions.pop(item, None)
+            if action is not None:
+                menu.removeAction(action)
+                action.deleteLater()
+        
+        # 뒤에서부터 다음 항목의 QAction 앞에 오도록 맞춤
+        anchor = None
+        for item in reversed(items):
+            action = actions.get(item)
+            if action is None:
+                action = self._add_item_action(menu, item, self._click_handler, before=anchor)
+            else:
+                current = menu.actions()
+                position = current.index(action) + 1
+                following = current[position] if position < len(current) else None
+                if following is not anchor:
+                    menu.insertAction(anchor, action)
+            anchor = action
+    
+    def _on_catalog_file_changed(self, path):
+        """카탈로그 파일 변경 알림 (편집기가 파일을 교체하면 감시가 풀리므로 다시 등록)"""
+        if path not in self._watcher.files():
+            self._watcher.addPath(path)
+        self._reload_timer.start()
+    
+    def reload_catalog(self):
+        """카탈로그를 다시 읽어 바뀐 메뉴만 갱신
+        
+        Returns:
+            CatalogDiff: 이전 카탈로그와의 차이. 읽지 못했거나 바뀐 것이 없으면 None
+        """
+        path = self.catalog.source_path
+        if path and path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+        try:
+            new_catalog = Catalog.load(path)
+        except CatalogError as e:
+            # 저장 도중의 불완전한 파일일 수 있으므로 이전 카탈로그 유지
+            print(e)
+            return None
+        
+        diff = CatalogDiff(self.catalog, new_catalog)
+        if diff.is_empty():
+            self.catalog = new_catalog
+            return None
+        self.apply_catalog(new_catalog, diff)
+        return diff
+    
+    def apply_catalog(self, new_catalog: Catalog, diff: CatalogDiff):
+        """새 카탈로그를 적용하여 바뀐 메뉴와 색인만 갱신
+        
+        Args:
+            new_catalog: 새 카탈로그
+            diff: 이전 카탈로그와의 차이
+        """
+        self.catalog = new_catalog
+        
+        # 없어진 카테고리 메뉴는 제거하고, 바뀐 카테고리 메뉴는 바뀐 항목만 갱신
+        for category in diff.removed_categories:
+            self._remove_category_menu(category)
+        for category in diff.changed_categories:
+            self._update_category_menu(category, diff)
+        
+        # 새 순서대로 메뉴 위치를 맞추며 빠진 메뉴 생성 (기존 QMenu는 그대로 이동)
+        anchor = None
+        for category in reversed(list(new_catalog.categories)):
+            menu = self._menus.get(category)
+            if menu is None:
+                menu = self._create_category_menu(category, before=anchor or self._system_anchor())
+            elif diff.order_changed:
+                self.menubar.removeAction(menu.menuAction())
+                self.menubar.insertMenu(anchor or self._system_anchor(), menu)
+            anchor = menu.menuAction()
+        
+        # 항목 -> 카테고리 색인을 바뀐 부분만 갱신
+        for item in diff.removed_items:
+            self.category_map.pop(item, None)
+            self.click_counts.pop(item, None)
+        for item in diff.added_items + diff.moved_items:
+            self.category_map[item] = new_catalog.category_map[item]
+        
+        self.categories = dict(new_catalog.categories)
+        self.categories.update(self.system_menus)
+        
+        # 없어진 항목과 카테고리의 캐시만 정리
+        self.parent.on_catalog_changed(diff)
+    
+    def _system_anchor(self):
+        """카테고리 메뉴를 넣을 기준 위치 (첫 번째 프로그램 메뉴 앞)"""
+        for action in self.menubar.actions():
+            if action.text() in self.system_menus:
+                return action
+        return None
+    
+    def _make_lazy(self, menu: QMenu, items: List[str], category: str = None):
+        """메뉴가 처음 열릴 때 항목을 채우도록 설정
+        
+        Args:
+            menu: 지연 생성할 메뉴
+            items: 메뉴에 들어갈 항목 리스트
+            category: 카테고리 메뉴이면 카테고리 이름 (맨 위에 썸네일 그리드로 보기 항목 추가)
+        """
+        self._add_placeholder(menu)
+        # 메뉴가 열리거나 항목에 마우스를 올리면 이미지 미리 불러오기
+        menu.aboutToShow.connect(partial(self._populate_menu, menu, items, category))
+        menu.hovered.connect(partial(self._on_menu_hovered, items))
+    
+    @staticmethod
+    def _add_placeholder(menu: QMenu):
+        """항목을 채우기 전 표시할 자리 표시 항목 추가"""
+        placeholder = menu.addAction("불러오는 중...")
+        placeholder.setEnabled(False)
+    
+    def _populate_menu(self, menu: QMenu, items: List[str], category: str = None):
+        """메뉴 항목 채우기 (항목이 많으면 하위 메뉴로 나눔)"""
+        if menu not in self._populated:
+            menu.clear()
+            if category is not None:
+                action = menu.addAction("사진으로 보기")
+                action.triggered.connect(partial(self._show_grid, category))
+                menu.addSeparator()
+            if len(items) > PAGE_SIZE:
+                for page in self._paginate(items):
+                    submenu = menu.addMenu(f"{page[0]} ~ {page[-1]}")
+                    self._make_lazy(submenu, page)
+            else:
+                self._add_menu_items(menu, items, self._click_handler)
+            self._populated.add(menu)
+        self._prefetch_items(items)
+    
+    @staticmethod
+    def _paginate(items: List[str]) -> List[List[str]]:
+        """항목을 하위 메뉴 하나에 PAGE_SIZE개 이하의 메뉴가 오도록 나눔
+        
+        나눈 묶음도 PAGE_SIZE보다 크면 열릴 때 다시 나누어지므로 여러 단계로 중첩됩니다.
+        """
+        chunk = PAGE_SIZE
+        while (len(items) + chunk - 1) // chunk > PAGE_SIZE:
+            chunk *= PAGE_SIZE
+        return [items[i:i + chunk] for i in range(0, len(items), chunk)]
+    
     def _add_menu_items(self, menu: QMenu, items: List[str], 
                        menu_click_handler: Callable[[str], None]):
         """메뉴에 항목들을 추가
@@ -59,21 +312,79 @@ class MenuManager:
                 action.setChecked(self.parent.audio_manager.is_ambient_enabled())
                 action.triggered.connect(self.toggle_ambient_sound)
             else:
-                action = menu.addAction(item)
                 if item == "푸드코트 정보...":
+                    action = menu.addAction(item)
                     action.triggered.connect(self.show_about_dialog)
                 elif item == "나가기":
+                    action = menu.addAction(item)
                     action.triggered.connect(self.close_application)
                 else:
-                    # 람다 함수 대신 부분 함수 사용 (성능 개선)
-                    action.triggered.connect(
-                        partial(self._handle_menu_click, item, menu_click_handler)
-                    )
+                    self._add_item_action(menu, item, menu_click_handler)
+    
+    def _add_item_action(self, menu: QMenu, item: str, menu_click_handler: Callable[[str], None],
+                         before: QAction = None) -> QAction:
+        """메뉴 항목 QAction을 만들어 메뉴에 추가
+        
+        Args:
+            menu: 항목을 추가할 메뉴
+            item: 메뉴 항목
+            menu_click_handler: 메뉴 항목 클릭 시 호출될 핸들러 함수
+            before: 이 액션 앞에 넣음 (None이면 맨 뒤)
+        
+        Returns:
+            QAction: 추가한 액션
+        """
+        action = QAction(self.catalog.label(item), menu)
+        action.setData(item)
+        # 람다 함수 대신 부분 함수 사용 (성능 개선)
+        action.triggered.connect(partial(self._handle_menu_click, item, menu_click_handler))
+        menu.insertAction(before, action)
+        return action
     
     def _handle_menu_click(self, item, handler, checked=False):
         """메뉴 클릭 핸들러 (람다 대신 사용)"""
+        self.click_counts[item] += 1
         handler(item)
 
+    def _show_grid(self, category, checked=False):
+        """카테고리 항목을 썸네일 그리드로 표시"""
+        self.parent.show_category_grid(category)
+
+    def select_item(self, item: str):
+        """메뉴를 거치지 않고 항목 선택 (검색 결과 등에서 사용, 메뉴 클릭과 같은 경로로 처리)"""
+        if item in self.category_map and self._click_handler:
+            self._handle_menu_click(item, self._click_handler)
+
+    def _prefetch_items(self, items: List[str], hovered_item=None):
+        """메뉴 항목들의 이미지 미리 불러오기 요청
+        
+        마우스가 올라간 항목과 가까운 순서, 클릭 횟수가 많은 순서로 정렬합니다.
+        
+        Args:
+            items: 미리 불러올 메뉴 항목 리스트
+            hovered_item: 마우스가 올라간 항목 (없으면 클릭 횟수 순)
+        """
+        items = [item for item in items if item not in self.special_items]
+        if hovered_item in items:
+            positions = {item: index for index, item in enumerate(items)}
+            center = positions[hovered_item]
+            items.sort(key=lambda item: (abs(positions[item] - center), -self.click_counts[item]))
+        else:
+            items.sort(key=lambda item: -self.click_counts[item])
+        self.parent.prefetch_images(items)
+
+    def _on_menu_hovered(self, items, action):
+        """메뉴 항목에 마우스가 올라갔을 때 해당 위치 기준으로 미리 불러오기"""
+        item = action.data()
+        if not item or item == self._last_hovered:
+            return
+        self._last_hovered = item
+        self._prefetch_items(items, item)
+
+    def food_categories(self) -> List[str]:
+        """이미지와 음성이 있는 음식 카테고리 목록 (설정 등 특수 메뉴 제외)"""
+        return list(self.catalog.categories)
+
     def get_category_for_item(self, menu_item: str) -> str:
         """메뉴 항목에 해당하는 카테고리를 반환
         
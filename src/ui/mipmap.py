@@ -0,0 +1,85 @@
+from PySide6.QtCore import Qt, QSize
+
+class MipmapPyramid:
+    """메뉴 항목 하나의 여러 해상도 QPixmap
+
+    가장 큰 단계는 디코딩한 이미지이고, 작은 단계는 필요할 때 바로 위 단계를 반으로 줄여 만듭니다.
+    표시 크기가 바뀌면 그 크기를 덮는 가장 작은 단계에서 한 번만 축소하므로
+    원본을 다시 디코딩하거나 큰 이미지를 매번 축소하지 않습니다.
+    """
+
+    def __init__(self, pixmap, requested_size):
+        """피라미드 생성
+
+        Args:
+            pixmap (QPixmap): 디코딩한 이미지 (가장 큰 단계)
+            requested_size (tuple): 디코딩할 때 요청한 크기 (원본이 더 작으면 이미지가 이보다 작음)
+        """
+        self.levels = [pixmap]  # 큰 단계부터
+        self.requested_size = tuple(requested_size)
+
+    @property
+    def top(self):
+        """가장 큰 단계"""
+        return self.levels[0]
+
+    def covers(self, size):
+        """표시 크기를 디코딩한 해상도로 채울 수 있는지 확인 (아니면 더 크게 다시 디코딩해야 함)"""
+        return size[0] <= self.requested_size[0] and size[1] <= self.requested_size[1]
+
+    def fitted_size(self, size):
+        """표시 크기 안에 가로세로 비율을 유지하며 들어가는 크기
+
+        디코딩한 해상도로 채울 수 있는 크기면 가장 큰 단계보다 크게 늘리지 않습니다
+        (원본이 표시 크기보다 작거나 이미 그 크기에 맞춰 디코딩된 경우).
+        """
+        width, height = self.top.width(), self.top.height()
+        scale = min(size[0] / width, size[1] / height)
+        if self.covers(size):
+            scale = min(scale, 1.0)
+        return QSize(max(1, round(width * scale)), max(1, round(height * scale)))
+
+    def level_for(self, size):
+        """크기를 덮는 가장 작은 단계 (없는 단계는 바로 위 단계를 반으로 줄여 만듦)
+
+        Args:
+            size (QSize): 필요한 크기 (물리 픽셀)
+
+        Returns:
+            QPixmap: 크기 이상인 가장 작은 단계. 모든 단계가 작으면 가장 큰 단계
+        """
+        index = 0
+        while True:
+            level = self.levels[index]
+            half = QSize(level.width() // 2, level.height() // 2)
+            if half.width() < max(size.width(), 1) or half.height() < max(size.height(), 1):
+                return level
+            if index + 1 == len(self.levels):
+                self.levels.append(level.scaled(half,
+                                                Qt.AspectRatioMode.IgnoreAspectRatio,
+                                                Qt.TransformationMode.SmoothTransformation))
+            index += 1
+
+    def render(self, size, device_pixel_ratio=1.0):
+        """표시 크기에 맞춘 픽스맵
+
+        Args:
+            size (tuple): 표시 크기 (물리 픽셀)
+            device_pixel_ratio (float): 화면 배율 (HiDPI 화면에서 물리 픽셀 그대로 그리도록 설정)
+
+        Returns:
+            QPixmap: 표시할 픽스맵 (디코딩한 해상도가 부족하면 임시로 늘린 이미지)
+        """
+        fitted = self.fitted_size(size)
+        level = self.level_for(fitted)
+        pixmap = level
+        if level.size() != fitted:
+            pixmap = level.scaled(fitted,
+                                  Qt.AspectRatioMode.IgnoreAspectRatio,
+                                  Qt.TransformationMode.SmoothTransformation)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    def cost(self):
+        """모든 단계가 차지하는 메모리(바이트)"""
+        return sum(level.width() * level.height() * max(level.depth(), 8) // 8 for level in self.levels)
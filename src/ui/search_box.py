@@ -0,0 +1,72 @@
+from PySide6.QtWidgets import QLineEdit, QCompleter
+from PySide6.QtCore import Qt, QStringListModel, Signal
+from .search_index import SearchIndex
+
+class MenuSearchBox(QLineEdit):
+    """메뉴 항목 검색 입력창
+
+    입력할 때마다 미리 만든 색인에서 검색하여 자동완성 목록을 갱신합니다.
+    초성(ㄱㅊ)이나 입력 중인 음절(김ㅊ)로도 검색할 수 있습니다.
+    """
+    item_selected = Signal(str)  # 검색 결과에서 선택한 메뉴 항목
+
+    def __init__(self, categories, parent=None, max_results=20):
+        """검색 입력창 초기화
+
+        Args:
+            categories (dict): 카테고리 이름 -> 메뉴 항목 리스트
+            parent (QWidget): 부모 위젯
+            max_results (int): 자동완성 목록에 표시할 최대 결과 수
+        """
+        super().__init__(parent)
+        self.max_results = max_results
+        self.index = SearchIndex(categories)
+
+        self.setPlaceholderText("메뉴 검색 (예: 김치, ㄱㅊ)")
+        self.setClearButtonEnabled(True)
+
+        # 색인에서 이미 걸러낸 결과를 그대로 보여 주도록 자동완성 자체 필터링은 끔
+        self._model = QStringListModel(self)
+        self._completer = QCompleter(self._model, self)
+        self._completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._completer.setMaxVisibleItems(10)
+        self._completer.setWidget(self)
+        self._completer.activated[str].connect(self._on_activated)
+
+        self.textEdited.connect(self._update_results)
+        self.returnPressed.connect(self._on_return_pressed)
+
+    def rebuild(self, categories):
+        """카탈로그가 바뀌었을 때 색인 다시 만들기"""
+        self.index = SearchIndex(categories)
+        if self.text():
+            self._update_results(self.text())
+
+    def inputMethodEvent(self, event):
+        """한글 입력기로 조합 중인 음절도 바로 검색에 반영"""
+        super().inputMethodEvent(event)
+        if event.preeditString():
+            self._update_results(self.text() + event.preeditString())
+
+    def _update_results(self, text):
+        """입력이 바뀔 때마다 검색 결과 갱신"""
+        results = [item for item, _ in self.index.search(text, self.max_results)]
+        self._model.setStringList(results)
+        if results:
+            self._completer.complete()
+        else:
+            self._completer.popup().hide()
+
+    def _on_activated(self, item):
+        """자동완성 목록에서 항목을 선택했을 때"""
+        self.clear()
+        self.item_selected.emit(item)
+
+    def _on_return_pressed(self):
+        """엔터를 누르면 가장 잘 맞는 항목 선택"""
+        if self._completer.popup().isVisible():
+            return
+        results = self.index.search(self.text(), 1)
+        if results:
+            self._on_activated(results[0][0])
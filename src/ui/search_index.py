@@ -0,0 +1,202 @@
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple
+
+# 한글 음절 분해에 사용하는 호환용 자모 표
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ", "ㅗㅣ", "ㅛ",
+             "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"]
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ",
+             "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ",
+             "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 입력된 겹자모(호환용)를 기본 자모로 분해
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_CONSONANTS = set(CHOSEONG)
+
+# 검색 결과 순위 (작을수록 앞)
+RANK_PREFIX = 0            # 이름 접두어
+RANK_JAMO_PREFIX = 1       # 자모 접두어 (입력 중인 음절 포함)
+RANK_INITIAL_PREFIX = 2    # 초성 접두어
+RANK_SUBSTRING = 3         # 자모 부분 문자열
+RANK_INITIAL_SUBSTRING = 4 # 초성 부분 문자열
+RANK_FUZZY = 5             # 자모 순서만 일치
+
+# 결과 수 대비 최대 후보 수
+CANDIDATE_FACTOR = 4
+
+# 색인 문자열을 이어 붙일 때 사용하는 구분자
+_SEPARATOR = "\x00"
+
+def decompose(text: str) -> str:
+    """한글 음절을 기본 자모로 분해 (예: "김치" -> "ㄱㅣㅁㅊㅣ")
+
+    한글이 아닌 문자는 소문자로 바꾸고 공백은 제거합니다.
+    """
+    result = []
+    for char in text:
+        code = ord(char)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            offset = code - _SYLLABLE_BASE
+            result.append(CHOSEONG[offset // 588])
+            result.append(JUNGSEONG[(offset % 588) // 28])
+            result.append(JONGSEONG[offset % 28])
+        elif char in COMPOUND_JAMO:
+            result.append(COMPOUND_JAMO[char])
+        elif not char.isspace():
+            result.append(char.lower())
+    return "".join(result)
+
+def initials(text: str) -> str:
+    """한글 음절의 초성만 추출 (예: "김치찌개" -> "ㄱㅊㅉㄱ")
+
+    한글이 아닌 문자는 소문자로 바꾸어 그대로 두고 공백은 제거합니다.
+    """
+    result = []
+    for char in text:
+        code = ord(char)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            result.append(CHOSEONG[(code - _SYLLABLE_BASE) // 588])
+        elif not char.isspace():
+            result.append(char.lower())
+    return "".join(result)
+
+class _Blob:
+    """모든 항목의 색인 문자열을 구분자로 이어 붙인 문자열
+
+    str.find를 반복하는 것만으로 전체 항목의 부분 문자열 검색을 C 속도로 처리합니다.
+    """
+
+    def __init__(self, keys: List[str]):
+        # 모든 항목의 앞뒤에 구분자가 오도록 맨 앞에도 구분자를 둠
+        self.offsets = []
+        position = 1
+        for key in keys:
+            self.offsets.append(position)
+            position += len(key) + 1
+        self.text = _SEPARATOR + _SEPARATOR.join(keys) + _SEPARATOR
+
+    def find_all(self, needle: str):
+        """부분 문자열이 들어 있는 항목 번호와 위치(항목 안에서의 시작 위치)를 차례로 생성"""
+        start = 0
+        last_index = -1
+        while True:
+            found = self.text.find(needle, start)
+            if found < 0:
+                return
+            index = bisect_right(self.offsets, found) - 1
+            if index != last_index:
+                last_index = index
+                yield index, found - self.offsets[index]
+            # 다음 항목부터 계속 검색
+            start = self.offsets[index + 1] if index + 1 < len(self.offsets) else len(self.text)
+
+    def find_pattern(self, pattern):
+        """정규식과 일치하는 항목 번호와 일치 구간 길이를 차례로 생성"""
+        last_index = -1
+        for match in pattern.finditer(self.text):
+            index = bisect_right(self.offsets, match.start() + 1) - 1
+            if index != last_index:
+                last_index = index
+                yield index, match.end() - match.start()
+
+class SearchIndex:
+    """한글 초성/자모를 고려한 메뉴 항목 검색 색인
+
+    - 접두어 검색: 이름과 자모 문자열을 정렬해 두고 이진 탐색
+    - 초성 검색: "ㄱㅊ"으로 김치찌개 찾기
+    - 자모 단위 부분 문자열과 순서 일치(퍼지) 검색: 입력 중인 음절도 찾음
+    """
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        """색인 생성
+
+        Args:
+            categories: 카테고리 이름 -> 메뉴 항목 리스트
+        """
+        self.items = []       # 항목 번호 -> (메뉴 항목, 카테고리)
+        jamo_keys = []
+        initial_keys = []
+        for category, names in categories.items():
+            for name in names:
+                self.items.append((name, category))
+                jamo_keys.append(decompose(name))
+                initial_keys.append(initials(name))
+
+        # 접두어 검색용 정렬 배열 (키, 항목 번호)
+        self._names = sorted((name.lower().replace(" ", ""), i) for i, (name, _) in enumerate(self.items))
+        self._jamo = sorted((key, i) for i, key in enumerate(jamo_keys))
+        self._initials = sorted((key, i) for i, key in enumerate(initial_keys))
+
+        # 부분 문자열 검색용 이어 붙인 문자열
+        self._jamo_blob = _Blob(jamo_keys)
+        self._initial_blob = _Blob(initial_keys)
+
+    @staticmethod
+    def _prefix_matches(sorted_keys, prefix):
+        """정렬된 (키, 항목 번호) 배열에서 접두어가 일치하는 항목 번호 생성"""
+        position = bisect_left(sorted_keys, (prefix,))
+        while position < len(sorted_keys):
+            key, index = sorted_keys[position]
+            if not key.startswith(prefix):
+                return
+            yield index
+            position += 1
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[str, str]]:
+        """검색어와 일치하는 메뉴 항목 검색
+
+        Args:
+            query: 검색어 (완성된 음절, 입력 중인 음절, 초성 모두 가능)
+            limit: 최대 결과 수
+
+        Returns:
+            list: (메뉴 항목, 카테고리) 튜플 리스트 (일치 정도 순)
+        """
+        name_query = query.strip().lower().replace(" ", "")
+        if not name_query:
+            return []
+        jamo_query = decompose(name_query)
+        initial_only = all(char in _CONSONANTS for char in jamo_query)
+
+        ranks = {}  # 항목 번호 -> (순위, 세부 점수)
+        # 짧은 검색어로 수천 개가 일치해도 정렬 비용이 커지지 않도록 후보 수 제한
+        max_candidates = limit * CANDIDATE_FACTOR
+
+        def add(matches, rank):
+            for index, score in matches:
+                if len(ranks) >= max_candidates:
+                    return
+                if index not in ranks:
+                    ranks[index] = (rank, score)
+
+        add(((index, 0) for index in self._prefix_matches(self._names, name_query)), RANK_PREFIX)
+        add(((index, 0) for index in self._prefix_matches(self._jamo, jamo_query)), RANK_JAMO_PREFIX)
+        if initial_only:
+            add(((index, 0) for index in self._prefix_matches(self._initials, jamo_query)),
+                RANK_INITIAL_PREFIX)
+        # 부분 문자열은 앞쪽에서 일치할수록 우선
+        if len(ranks) < limit:
+            add(self._jamo_blob.find_all(jamo_query), RANK_SUBSTRING)
+        if initial_only and len(ranks) < limit:
+            add(self._initial_blob.find_all(jamo_query), RANK_INITIAL_SUBSTRING)
+        if len(ranks) < limit and len(jamo_query) > 1:
+            # 이름의 첫 자모부터 검색어의 자모가 순서대로 나타나면 일치 (예: "김찌" -> 김치찌개)
+            # 각 간격은 다음 자모가 나올 때까지 되돌아가지 않고(possessive) 건너뛰므로 선형 시간이고,
+            # 구분자로 시작하는 접두어 덕분에 정규식 엔진이 후보 위치만 빠르게 찾음
+            # 일치 구간이 짧을수록(사이에 건너뛴 자모가 적을수록) 우선
+            parts = [_SEPARATOR + re.escape(jamo_query[0])]
+            for char in jamo_query[1:]:
+                parts.append(f"[^{_SEPARATOR}{re.escape(char)}]*+{re.escape(char)}")
+            add(self._jamo_blob.find_pattern(re.compile("".join(parts))), RANK_FUZZY)
+
+        ordered = sorted(ranks, key=lambda index: (ranks[index], len(self.items[index][0]), index))
+        return [self.items[index] for index in ordered[:limit]]
+
+    def __len__(self):
+        return len(self.items)
@@ -0,0 +1,80 @@
+import sys
+import time
+import threading
+import traceback
+from PySide6.QtCore import QObject, QTimer
+from metrics import metrics
+
+# 이 시간(ms) 넘게 이벤트 루프가 멈추면 기록
+DEFAULT_STALL_MS = 100
+# GUI 스레드 하트비트 간격(ms)
+HEARTBEAT_MS = 20
+# 멈춘 GUI 스레드의 호출 스택 중 출력할 프레임 수
+STACK_DEPTH = 8
+
+class StallDetector(QObject):
+    """GUI 이벤트 루프 멈춤 감지기
+
+    GUI 스레드의 타이머가 주기적으로 하트비트를 남기고, 감시 스레드는 하트비트가
+    기준 시간 넘게 끊기면 그 순간 GUI 스레드의 호출 스택을 출력하여 어떤 핸들러가
+    이벤트 루프를 막고 있는지 알려 줍니다. 멈춘 시간은 gui.stall 히스토그램에 기록됩니다.
+    """
+
+    def __init__(self, threshold_ms=DEFAULT_STALL_MS, parent=None):
+        """감지기 초기화 (GUI 스레드에서 생성)
+
+        Args:
+            threshold_ms (float): 멈춤으로 판단할 최소 시간(ms)
+            parent (QObject): 부모 객체
+        """
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.stalls = 0  # 감지한 멈춤 횟수
+        self._gui_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._reported = False  # 현재 멈춤을 이미 출력했는지 여부
+        self._stop_event = threading.Event()
+        self._watcher = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(HEARTBEAT_MS)
+        self._timer.timeout.connect(self._beat)
+
+    def start(self):
+        """감지 시작"""
+        self._heartbeat = time.monotonic()
+        self._timer.start()
+        self._stop_event.clear()
+        self._watcher = threading.Thread(target=self._watch, name="StallDetector", daemon=True)
+        self._watcher.start()
+        return self
+
+    def stop(self):
+        """감지 중지"""
+        self._timer.stop()
+        self._stop_event.set()
+        if self._watcher:
+            self._watcher.join(timeout=1.0)
+
+    def _beat(self):
+        """GUI 스레드 하트비트 (직전 하트비트와의 간격으로 멈춘 시간 측정)"""
+        now = time.monotonic()
+        blocked_ms = (now - self._heartbeat) * 1000 - HEARTBEAT_MS
+        self._heartbeat = now
+        self._reported = False
+        if blocked_ms > self.threshold_ms:
+            self.stalls += 1
+            metrics.count("gui.stalls")
+            metrics.observe("gui.stall", blocked_ms)
+
+    def _watch(self):
+        """감시 스레드 본문 (멈춘 동안 GUI 스레드의 호출 스택을 한 번 출력)"""
+        interval = self.threshold_ms / 2000
+        while not self._stop_event.wait(interval):
+            blocked_ms = (time.monotonic() - self._heartbeat) * 1000 - HEARTBEAT_MS
+            if blocked_ms <= self.threshold_ms or self._reported:
+                continue
+            self._reported = True
+            frame = sys._current_frames().get(self._gui_thread_id)
+            stack = "".join(traceback.format_stack(frame)[-STACK_DEPTH:]) if frame else ""
+            print(f"GUI 이벤트 루프가 {blocked_ms:.0f}ms 넘게 멈춰 있습니다:\n{stack}", end="")
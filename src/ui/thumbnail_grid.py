@@ -0,0 +1,274 @@
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import (Qt, QAbstractListModel, QModelIndex, QSize, QRect, QEvent, QTimer, QThread,
+                            Signal)
+from PySide6.QtGui import QPalette
+from .image_cache import PixmapCache
+from .image_loader import ImageLoadEngine
+
+# 썸네일 크기 (논리 픽셀, 전처리 도구의 썸네일 크기와 같아야 미리 축소한 파일을 그대로 사용)
+THUMBNAIL_SIZE = (160, 120)
+# 썸네일 아래 이름을 표시할 높이
+LABEL_HEIGHT = 24
+# 셀 안쪽 여백
+CELL_PADDING = 6
+# 스크롤 중 보이는 셀을 다시 계산하는 간격(ms, 스크롤 이벤트마다 계산하지 않음)
+LOAD_INTERVAL_MS = 40
+# 화면 위아래로 함께 불러올 셀 줄 수
+OVERSCAN_ROWS = 1
+# 썸네일에 사용할 최대 메모리 (160x120 32비트 기준 약 270장)
+THUMBNAIL_BUDGET_BYTES = 20 * 1024 * 1024
+
+class ThumbnailModel(QAbstractListModel):
+    """카테고리 메뉴 항목과 불러온 썸네일 모델
+
+    썸네일은 메모리 예산 기반 LRU 캐시에 보관하므로 항목이 많아도 메모리 사용량이 일정하며,
+    제거된 썸네일은 셀이 다시 보일 때 다시 불러옵니다.
+    """
+
+    def __init__(self, parent=None, max_bytes=THUMBNAIL_BUDGET_BYTES):
+        super().__init__(parent)
+        self.items = []
+        self.labels = {}  # 메뉴 항목 -> 표시 이름
+        self._rows = {}  # 메뉴 항목 -> 행 번호
+        self.thumbnails = PixmapCache(max_bytes)
+
+    def set_items(self, items, labels=None):
+        """표시할 메뉴 항목 교체 (불러온 썸네일은 유지)
+
+        Args:
+            items (list): 메뉴 항목 리스트
+            labels (dict): 메뉴 항목 -> 표시 이름 (없는 항목은 항목 이름 그대로)
+        """
+        self.beginResetModel()
+        self.items = list(items)
+        self.labels = labels or {}
+        self._rows = {item: row for row, item in enumerate(self.items)}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self.labels.get(item, item)
+        if role == Qt.ItemDataRole.DecorationRole:
+            # 그릴 때마다 호출되므로 LRU 순서와 통계에 영향을 주지 않는 조회 사용
+            return self.thumbnails.peek(item)
+        if role == Qt.ItemDataRole.UserRole:
+            return item
+        return None
+
+    def set_thumbnail(self, menu_item, pixmap):
+        """썸네일을 저장하고 해당 셀만 다시 그리도록 알림"""
+        self.thumbnails.put(menu_item, pixmap)
+        row = self._rows.get(menu_item)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def clear_thumbnails(self):
+        """불러온 썸네일을 모두 버림 (화면 배율이 바뀐 경우)"""
+        self.thumbnails.clear()
+        if self.items:
+            self.dataChanged.emit(self.index(0), self.index(len(self.items) - 1),
+                                  [Qt.ItemDataRole.DecorationRole])
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """셀을 그리는 델리게이트
+
+    모든 셀을 델리게이트 하나가 그리며 셀마다 위젯을 만들지 않습니다.
+    썸네일은 셀 크기에 맞춰 디코딩되어 있으므로 그릴 때 축소하지 않습니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cell_size = QSize(THUMBNAIL_SIZE[0] + CELL_PADDING * 2,
+                               THUMBNAIL_SIZE[1] + LABEL_HEIGHT + CELL_PADDING * 2)
+
+    def sizeHint(self, option, index):
+        return self.cell_size
+
+    def paint(self, painter, option, index):
+        painter.save()
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        if selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+
+        # 썸네일 (아직 불러오지 않았으면 빈 자리만 표시)
+        image_rect = QRect(option.rect.x() + CELL_PADDING, option.rect.y() + CELL_PADDING, *THUMBNAIL_SIZE)
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if pixmap is None:
+            painter.fillRect(image_rect, option.palette.midlight())
+        else:
+            size = pixmap.deviceIndependentSize().toSize()
+            painter.drawPixmap(image_rect.x() + (image_rect.width() - size.width()) // 2,
+                               image_rect.y() + (image_rect.height() - size.height()) // 2, pixmap)
+
+        # 이름 (가격은 탭 대신 공백으로 구분)
+        text_rect = QRect(image_rect.x(), image_rect.bottom() + 1, image_rect.width(), LABEL_HEIGHT)
+        text = index.data(Qt.ItemDataRole.DisplayRole).replace("\t", "  ")
+        text = option.fontMetrics.elidedText(text, Qt.TextElideMode.ElideRight, text_rect.width())
+        role = QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text
+        painter.setPen(option.palette.color(role))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+class ThumbnailGrid(QListView):
+    """카테고리 메뉴 항목의 썸네일 그리드
+
+    화면에 보이는 셀(과 위아래 한 줄)의 썸네일만 백그라운드 디코딩 작업(ImageLoadEngine)으로 요청합니다.
+    스크롤하는 동안 일정 간격으로 보이는 셀을 다시 계산하여, 보이지 않게 된 셀의 요청은 취소하고
+    새로 보이는 셀만 요청하므로 항목이 수백 개여도 스크롤할 때 GUI 스레드가 하는 일은 셀을 그리는 것뿐입니다.
+    """
+    item_selected = Signal(str)  # 선택한 메뉴 항목
+
+    def __init__(self, image_dir, disk_cache=None, bundle=None, derived=None, parent=None):
+        """썸네일 그리드 초기화
+
+        Args:
+            image_dir (str): 이미지 파일이 있는 디렉토리 경로
+            disk_cache (DiskImageCache): 축소 이미지 디스크 캐시 (선택)
+            bundle (AssetBundle): 미리 축소한 이미지 번들 (선택)
+            derived (DerivedAssets): 전처리 도구가 미리 축소한 이미지 색인 (선택, 썸네일 크기를 우선 사용)
+            parent (QWidget): 부모 위젯
+        """
+        super().__init__(parent)
+        self._model = ThumbnailModel(self)
+        self._delegate = ThumbnailDelegate(self)
+        self._failed = set()  # 불러오지 못한 항목 (다시 요청하지 않음)
+        self.setModel(self._model)
+        self.setItemDelegate(self._delegate)
+
+        # 같은 크기의 셀을 왼쪽에서 오른쪽으로 채우고 줄을 바꿈 (크기가 같으므로 배치 계산이 빠름)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setGridSize(self._delegate.cell_size)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(self._delegate.cell_size.height() // 4)
+
+        # 썸네일 전용 로더 (메인 이미지 로딩과 스레드를 나눠 쓰지 않음)
+        self.loader = ImageLoadEngine(image_dir, disk_cache, self._thumbnail_size(), parent=self,
+                                      bundle=bundle, derived=derived, metrics_name="thumbnail")
+        self.loader.pool.setThreadPriority(QThread.Priority.LowPriority)  # 스크롤하는 GUI 스레드를 우선
+        self.loader.image_loaded.connect(self._on_thumbnail_loaded)
+        self.loader.load_error.connect(self._on_thumbnail_error)
+
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(LOAD_INTERVAL_MS)
+        self._load_timer.timeout.connect(self.load_visible)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_load)
+
+        self.clicked.connect(self._on_clicked)
+
+    def show_items(self, items, labels=None):
+        """표시할 메뉴 항목 교체
+
+        Args:
+            items (list): 메뉴 항목 리스트
+            labels (dict): 메뉴 항목 -> 표시 이름
+        """
+        self._failed.clear()
+        self._model.set_items(items, labels)
+        self.scrollToTop()
+        self.loader.request_visible([])  # 이전 카테고리의 요청 취소
+        self._schedule_load()
+
+    def _thumbnail_size(self):
+        """썸네일 디코딩 크기 (물리 픽셀)"""
+        ratio = self.devicePixelRatioF()
+        return (round(THUMBNAIL_SIZE[0] * ratio), round(THUMBNAIL_SIZE[1] * ratio))
+
+    def _schedule_load(self):
+        """보이는 셀 계산 예약 (스크롤 중에는 LOAD_INTERVAL_MS마다 한 번만 계산)"""
+        if not self._load_timer.isActive():
+            self._load_timer.start()
+
+    def visible_rows(self):
+        """화면에 보이는 셀(위아래 OVERSCAN_ROWS줄 포함)의 행 범위"""
+        count = self._model.rowCount()
+        viewport = self.viewport().rect()
+        overscan = self._delegate.cell_size.height() * OVERSCAN_ROWS
+        top, bottom = viewport.top() - overscan, viewport.bottom() + overscan
+
+        # 셀이 행 순서대로 위에서 아래로 배치되므로 첫 번째 셀은 이진 탐색으로 찾음
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if self.visualRect(self._model.index(middle)).bottom() < top:
+                low = middle + 1
+            else:
+                high = middle
+        end = low
+        while end < count and self.visualRect(self._model.index(end)).top() <= bottom:
+            end += 1
+        return range(low, end)
+
+    def load_visible(self):
+        """보이는 셀 중 썸네일이 없는 것만 요청하고 보이지 않게 된 셀의 요청은 취소"""
+        size = self._thumbnail_size()
+        if size != self.loader.target_size:
+            # 화면 배율이 바뀌면 이전 해상도의 썸네일은 버리고 다시 불러옴
+            self.loader.target_size = size
+            self._model.clear_thumbnails()
+
+        thumbnails = self._model.thumbnails
+        pending = []
+        for row in self.visible_rows():
+            item = self._model.items[row]
+            if thumbnails.contains(item):
+                thumbnails.get(item)  # 보이는 썸네일이 먼저 제거되지 않도록 최근 사용으로 갱신
+            elif item not in self._failed:
+                pending.append(item)
+        self.loader.request_visible(pending)
+
+    def stats(self):
+        """썸네일 캐시와 로더 통계"""
+        return {"cache": self._model.thumbnails.stats(), "loader": self.loader.stats()}
+
+    def shutdown(self):
+        """진행 중인 썸네일 요청을 취소하고 작업이 끝날 때까지 대기"""
+        self._load_timer.stop()
+        self.loader.shutdown()
+
+    def _on_thumbnail_loaded(self, menu_item, pixmap, target_size):
+        """썸네일 로딩 완료 (이전 화면 배율로 디코딩한 결과는 버림)"""
+        if target_size != self.loader.target_size:
+            return
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self._model.set_thumbnail(menu_item, pixmap)
+
+    def _on_thumbnail_error(self, menu_item, error_message):
+        """불러오지 못한 썸네일은 빈 자리로 두고 다시 요청하지 않음"""
+        self._failed.add(menu_item)
+
+    def _on_clicked(self, index):
+        self.item_selected.emit(index.data(Qt.ItemDataRole.UserRole))
+
+    def keyPressEvent(self, event):
+        """엔터를 누르면 현재 셀 선택"""
+        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter) and self.currentIndex().isValid():
+            self._on_clicked(self.currentIndex())
+            return
+        super().keyPressEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_load()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_load()
+
+    def event(self, event):
+        if event.type() == QEvent.Type.DevicePixelRatioChange:
+            self._schedule_load()
+        return super().event(event)